@@ -0,0 +1,86 @@
+# aggregates.py
+"""Monthly, weekly and seasonal statistics of a daily forecast, computed in one pass.
+
+Each period table has ``PERIOD_COLUMNS`` (the same layout as
+``forecast_stream.MonthlyAccumulator``), so the yearly chart and the summary
+metrics can share one set of aggregates instead of resampling repeatedly.
+Heatwave episodes (``episodes.find_episodes``) are kept alongside them.
+"""
+
+import numpy as np
+import pandas as pd
+
+from episodes import find_episodes
+
+PERIOD_COLUMNS = ['temp_mean', 'temp_min', 'temp_max', 'heatwave_days', 'days']
+
+# IMD seasons, keyed by the month each one starts in.
+SEASONS = {1: "Winter", 3: "Summer", 6: "Monsoon", 10: "Post-monsoon"}
+_SEASON_START_MONTH = np.array([0, 1, 1, 3, 3, 3, 6, 6, 6, 6, 10, 10, 10])  # by month number
+
+
+def _period_stats(keys, columns, label):
+    """Statistics over runs of equal ``keys`` (the daily index is sorted, so periods
+    are contiguous); ``label(key)`` maps each period's key to its index value."""
+    temp, temp_min, temp_max, heatwave = columns
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    days = np.diff(np.r_[starts, len(keys)])
+    return pd.DataFrame(
+        {
+            'temp_mean': np.add.reduceat(temp, starts) / days,
+            'temp_min': np.minimum.reduceat(temp_min, starts),
+            'temp_max': np.maximum.reduceat(temp_max, starts),
+            'heatwave_days': np.add.reduceat(heatwave, starts),
+            'days': days,
+        },
+        index=pd.DatetimeIndex(label(keys[starts]).astype('datetime64[ns]')),
+    )
+
+
+class ForecastAggregates:
+    """Period statistics for one taluk's daily forecast.
+
+    ``monthly`` is labelled by month end and ``weekly`` by the Sunday ending
+    each week (as ``resample('M')``/``resample('W')`` would), ``seasonal`` by
+    the first day of each season with its name in a ``season`` column.
+    ``episodes`` lists the IMD-style heatwave episodes.
+    """
+
+    def __init__(self, df):
+        index = pd.DatetimeIndex(df.index)
+        if not index.is_monotonic_increasing:
+            df = df.sort_index()
+            index = pd.DatetimeIndex(df.index)
+        temp = df['Temp_2m'].to_numpy(dtype=np.float64)
+        temp_min = df['Temp_min'].to_numpy(dtype=np.float64)
+        temp_max = df['Temp_max'].to_numpy(dtype=np.float64)
+        heatwave = df['Predicted_Heatwave'].to_numpy(dtype=np.int64)
+        columns = (temp, temp_min, temp_max, heatwave)
+
+        # Calendar arithmetic on datetime64 day/month numbers avoids pandas
+        # period conversions, which cost more than the aggregation itself.
+        day = index.to_numpy().astype('datetime64[D]')
+        month = day.astype('datetime64[M]')
+        month_of_year = month.astype(np.int64) % 12
+
+        self.monthly = _period_stats(month, columns, lambda m: (m + 1).astype('datetime64[D]') - 1)
+
+        # 1970-01-01 was a Thursday; weeks start on Monday and are labelled by their Sunday.
+        week_start = day - (day.astype(np.int64) + 3) % 7
+        self.weekly = _period_stats(week_start, columns, lambda w: w + 6)
+
+        season = month - (month_of_year - (_SEASON_START_MONTH[month_of_year + 1] - 1))
+        self.seasonal = _period_stats(season, columns, lambda s: s.astype('datetime64[D]'))
+        self.seasonal.insert(0, 'season', [SEASONS[m] for m in self.seasonal.index.month])
+
+        self.episodes = find_episodes(df)
+
+    def hottest_month(self):
+        """Month end with the highest mean temperature."""
+        return self.monthly['temp_mean'].idxmax()
+
+    def longest_episode(self):
+        """Row of ``episodes`` with the most days, or None without any episode."""
+        if self.episodes.empty:
+            return None
+        return self.episodes.loc[self.episodes['days'].idxmax()]
@@ -0,0 +1,253 @@
+# alerts.py
+"""Heat alerts raised when a taluk's risk band crosses into High or Severe.
+
+``AlertEngine`` subscribes to a ``WardStore`` and re-scores only the taluks
+each write touched. Two guards keep alerts from flapping around a band
+floor:
+
+- hysteresis: a taluk only drops out of a band once its score falls
+  ``hysteresis`` points below that band's floor;
+- debounce: a new band must come out of ``confirm_updates`` consecutive
+  evaluations before it replaces the current one. The store only reports
+  readings that changed, so a repeated identical reading does not count.
+
+Band changes that involve an alerting band are written to a SQLite outbox,
+from which a separate dispatcher (SMS, email, ...) reads pending alerts and
+marks them dispatched. The engine only sees writes made in its own process,
+so it runs next to whatever feeds the store (``start_alerting(store)``); the
+dashboard itself never updates readings and does not start one.
+
+    python alerts.py pending
+    python alerts.py ack 12 13
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from shared_data import RISK_BAND_FLOORS, calculate_heatwave_percentage_batch
+
+# Outbox used by start_alerting and the CLI when no path is given.
+OUTBOX_PATH = os.environ.get("HEATWAVE_ALERT_OUTBOX", "")
+DEFAULT_OUTBOX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alert_outbox.sqlite")
+
+BANDS = ("Low",) + tuple(RISK_BAND_FLOORS)
+ALERT_BANDS = ("High", "Severe")
+HYSTERESIS_POINTS = 5
+CONFIRM_UPDATES = 2
+
+_UNSET = -1
+_FIRST_ALERT_BAND = BANDS.index(ALERT_BANDS[0])
+
+
+class AlertOutbox:
+    """Append-only SQLite table of alerts awaiting dispatch."""
+
+    def __init__(self, path=DEFAULT_OUTBOX_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS alerts (
+                   id INTEGER PRIMARY KEY AUTOINCREMENT,
+                   created_ns INTEGER NOT NULL,
+                   taluk TEXT NOT NULL,
+                   kind TEXT NOT NULL,
+                   level TEXT NOT NULL,
+                   previous_level TEXT NOT NULL,
+                   heatwave_pct INTEGER NOT NULL,
+                   dispatched_ns INTEGER
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS alerts_pending ON alerts (dispatched_ns, id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS alerts_taluk ON alerts (taluk, id)")
+        self._conn.commit()
+
+    def write(self, rows):
+        """Append ``(created_ns, taluk, kind, level, previous_level, heatwave_pct)`` rows in one transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO alerts (created_ns, taluk, kind, level, previous_level, heatwave_pct) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def pending(self, limit=100):
+        """Oldest undispatched alerts as a DataFrame indexed by alert id."""
+        with self._lock:
+            df = pd.read_sql_query(
+                "SELECT id, created_ns, taluk, kind, level, previous_level, heatwave_pct FROM alerts "
+                "WHERE dispatched_ns IS NULL ORDER BY id LIMIT ?",
+                self._conn,
+                params=(limit,),
+                index_col="id",
+            )
+        df.insert(0, "created", pd.to_datetime(df.pop("created_ns"), unit="ns"))
+        return df
+
+    def mark_dispatched(self, ids, at_ns=None):
+        at_ns = time.time_ns() if at_ns is None else at_ns
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE alerts SET dispatched_ns = ? WHERE id = ? AND dispatched_ns IS NULL",
+                [(at_ns, int(i)) for i in ids],
+            )
+
+    def last_levels(self):
+        """``{taluk: level}`` from each taluk's latest alert, i.e. the band it was last reported in."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT taluk, level FROM alerts WHERE id IN (SELECT MAX(id) FROM alerts GROUP BY taluk)"
+            ).fetchall()
+        return dict(rows)
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class AlertEngine:
+    """Per-taluk band state, updated incrementally from ``WardStore`` writes.
+
+    Each taluk starts in the band of its latest alert in the outbox (Low
+    without one), so a restart neither repeats alerts already queued nor
+    misses a taluk that is High or Severe when it starts.
+    """
+
+    def __init__(self, store, outbox, hysteresis=HYSTERESIS_POINTS, confirm_updates=CONFIRM_UPDATES,
+                 floors=RISK_BAND_FLOORS):
+        self.store = store
+        self.outbox = outbox
+        self.hysteresis = hysteresis
+        self.confirm_updates = confirm_updates
+        self._floors = np.array([floors[band] for band in BANDS[1:]], dtype=np.float64)
+        self._taluks = np.asarray(store.taluks, dtype=object)
+        n = len(store.taluks)
+        self.level = np.zeros(n, dtype=np.int8)  # confirmed band index per taluk
+        for taluk, level in outbox.last_levels().items():
+            if taluk in store.taluk_ids and level in BANDS:
+                self.level[store.taluk_ids[taluk]] = BANDS.index(level)
+        self._candidate = np.full(n, _UNSET, dtype=np.int8)
+        self._streak = np.zeros(n, dtype=np.int32)
+        self._lock = threading.Lock()
+        self._unsubscribe = None
+        self.evaluations = 0
+        self.alerts_written = 0
+
+    def start(self):
+        """Score every taluk with readings against its baseline, then follow later writes.
+
+        The startup pass does not wait for ``confirm_updates``: readings that
+        crossed a floor while no engine was running alert straight away.
+        """
+        if self._unsubscribe is None:
+            self._unsubscribe = self.store.subscribe(self.evaluate)
+            self.evaluate(np.arange(len(self.store.taluks)), time.time_ns(), confirm_updates=1)
+        return self
+
+    def stop(self):
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _band(self, pct):
+        return np.searchsorted(self._floors, pct, side="right").astype(np.int8)
+
+    def evaluate(self, ids, timestamp, confirm_updates=None):
+        """Re-score ``ids`` (taluk ids) and record confirmed band changes; returns the alert rows."""
+        confirm_updates = self.confirm_updates if confirm_updates is None else confirm_updates
+        ids = np.asarray(ids, dtype=np.intp)
+        with self._lock:
+            # Read under the lock: callbacks of concurrent writes can arrive out
+            # of order, and the last evaluation must see the latest readings.
+            readings = self.store.readings(ids)
+            complete = ~np.isnan(np.column_stack(list(readings.values()))).any(axis=1)
+            if not complete.all():
+                ids = ids[complete]
+                readings = {field: values[complete] for field, values in readings.items()}
+            if not len(ids):
+                return []
+            pct = calculate_heatwave_percentage_batch(readings)
+
+            self.evaluations += len(ids)
+            current = self.level[ids]
+            raised = self._band(pct)
+            # Falling back needs a margin of ``hysteresis`` below the current band's floor.
+            lowered = self._band(pct + self.hysteresis)
+            target = np.where(raised > current, raised, np.minimum(lowered, current))
+
+            changing = target != current
+            streak = np.where(changing & (self._candidate[ids] == target), self._streak[ids] + 1, changing)
+            confirmed = changing & (streak >= confirm_updates)
+            streak[confirmed] = 0
+            self._streak[ids] = streak
+            self._candidate[ids] = np.where(changing & ~confirmed, target, _UNSET)
+
+            hits = np.flatnonzero(confirmed & (np.maximum(current, target) >= _FIRST_ALERT_BAND))
+            self.level[ids[confirmed]] = target[confirmed]
+            if not len(hits):
+                return []
+            rows = [
+                (int(timestamp), self._taluks[ids[i]], _alert_kind(current[i], target[i]),
+                 BANDS[target[i]], BANDS[current[i]], int(pct[i]))
+                for i in hits
+            ]
+            self.outbox.write(rows)
+            self.alerts_written += len(rows)
+            return rows
+
+    def levels(self):
+        """Confirmed band per taluk."""
+        return {taluk: BANDS[level] for taluk, level in zip(self._taluks, self.level)}
+
+
+def _alert_kind(previous, level):
+    if previous < _FIRST_ALERT_BAND:
+        return "raised"
+    if level < _FIRST_ALERT_BAND:
+        return "cleared"
+    return "escalated" if level > previous else "downgraded"
+
+
+def start_alerting(store, path=None):
+    """Engine writing to the outbox at ``path`` (default ``HEATWAVE_ALERT_OUTBOX``), or None when unset."""
+    path = path or OUTBOX_PATH
+    if not path:
+        return None
+    return AlertEngine(store, AlertOutbox(path)).start()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and acknowledge queued heat alerts.")
+    parser.add_argument("--outbox", default=OUTBOX_PATH or DEFAULT_OUTBOX_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    pending = sub.add_parser("pending", help="list alerts not yet dispatched")
+    pending.add_argument("--limit", type=int, default=100)
+    ack = sub.add_parser("ack", help="mark alerts as dispatched")
+    ack.add_argument("ids", nargs="+", type=int)
+    args = parser.parse_args()
+
+    outbox = AlertOutbox(args.outbox)
+    if args.command == "pending":
+        alerts = outbox.pending(args.limit)
+        print(alerts.to_string() if len(alerts) else "No pending alerts.")
+    else:
+        outbox.mark_dispatched(args.ids)
+    outbox.close()
+
+
+if __name__ == "__main__":
+    main()
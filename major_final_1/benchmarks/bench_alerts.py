@@ -0,0 +1,71 @@
+"""Throughput of ward-store updates with the alert engine subscribed.
+
+Run from ``major_final_1``:  python -m benchmarks.bench_alerts [updates] [taluks]
+
+Synthetic taluks get readings jittered around a random starting point, so
+some of them cross band floors and alerts fire; the outbox is a real SQLite file in a temporary
+directory. Single-taluk writes (one ``update`` call each, as a live feed
+would send them) and batched ``update_many`` writes are timed with and
+without the engine.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from alerts import AlertEngine, AlertOutbox
+from shared_data import HEATWAVE_WEIGHTS, READING_FIELDS
+from ward_store import WardStore
+
+
+def make_store(n_taluks, rng):
+    store = WardStore([f"T{i}" for i in range(n_taluks)], READING_FIELDS)
+    store.update_many(store.taluks, rng.uniform(20, 80, (n_taluks, len(READING_FIELDS))))
+    return store
+
+
+def random_rows(store, n_updates, rng):
+    ids = rng.integers(0, len(store.taluks), n_updates)
+    rows = store.frame(complete_only=False).to_numpy()[ids] + rng.normal(0, 4, (n_updates, len(READING_FIELDS)))
+    return np.asarray(store.taluks, dtype=object)[ids], rows
+
+
+def run(n_updates, n_taluks, with_engine, batch):
+    rng = np.random.default_rng(0)
+    store = make_store(n_taluks, rng)
+    names, rows = random_rows(store, n_updates, rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = None
+        if with_engine:
+            engine = AlertEngine(store, AlertOutbox(os.path.join(tmp, "outbox.sqlite"))).start()
+        start = time.perf_counter()
+        if batch:
+            for offset in range(0, n_updates, batch):
+                store.update_many(names[offset:offset + batch], rows[offset:offset + batch])
+        else:
+            fields = list(READING_FIELDS)
+            for name, row in zip(names, rows):
+                store.update(name, dict(zip(fields, row)))
+        seconds = time.perf_counter() - start
+        alerts = engine.alerts_written if engine else 0
+        if engine:
+            engine.stop()
+            engine.outbox.close()
+    return n_updates / seconds, alerts
+
+
+def main(n_updates=50_000, n_taluks=1_000):
+    assert set(HEATWAVE_WEIGHTS) <= set(READING_FIELDS)
+    print(f"{n_updates:,} taluk updates over {n_taluks:,} taluks")
+    for batch, label in [(0, "single update() calls"), (100, "update_many, 100 rows")]:
+        plain, _ = run(n_updates, n_taluks, False, batch)
+        engine, alerts = run(n_updates, n_taluks, True, batch)
+        print(f"{label:<24} store only {plain:10,.0f}/s   with alerts {engine:10,.0f}/s   ({alerts:,} alerts)")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 50_000, int(args[1]) if len(args) > 1 else 1_000)
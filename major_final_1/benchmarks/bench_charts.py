@@ -0,0 +1,59 @@
+"""Figure build time and JSON payload of create_3month_plot at long horizons.
+
+Compares the merged heatwave shapes with the old one-add_vrect-per-day
+approach, and the full daily series with LTTB downsampling + WebGL. Run from ``major_final_1``:  python -m benchmarks.bench_charts
+"""
+
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+from benchmarks.dummy_model import DummyHeatwaveModel
+from charts import HEATWAVE_FILL, create_3month_plot
+from downsampling import max_points_for_width
+from forecasting import FORECAST_SEED, START_DATE, generate_weather_data, prepare_features
+
+# The per-day loop grows quadratically; cap it so the benchmark finishes.
+LEGACY_MAX_YEARS = 1
+
+
+def forecast_frame(years):
+    end_date = pd.Timestamp(START_DATE) + pd.DateOffset(years=years) - timedelta(days=1)
+    df = generate_weather_data(START_DATE, end_date, "Pavagada", seed=FORECAST_SEED)
+    df['Predicted_Heatwave'] = DummyHeatwaveModel(work=0).predict(prepare_features(df))
+    return df
+
+
+def legacy_3month_plot(df, taluk):
+    """The original approach: the base figure plus one add_vrect per heatwave day."""
+    heatwave_days = df.index[df['Predicted_Heatwave'] == 1]
+    fig = create_3month_plot(df.assign(Predicted_Heatwave=0), taluk)
+    for date in heatwave_days:
+        fig.add_vrect(x0=date, x1=date + timedelta(days=1), fillcolor=HEATWAVE_FILL,
+                      layer="below", line_width=0)
+    return fig
+
+
+def downsampled_3month_plot(df, taluk):
+    return create_3month_plot(df, taluk, max_points=max_points_for_width(), webgl=True)
+
+
+def main():
+    print(f"{'years':>5} {'hw days':>8} {'impl':>8} {'build s':>9} {'shapes':>7} {'json KB':>9}")
+    for years in (1, 5, 30):
+        df = forecast_frame(years)
+        hw_days = int(df['Predicted_Heatwave'].sum())
+        impls = [("merged", create_3month_plot), ("lttb+gl", downsampled_3month_plot)]
+        if years <= LEGACY_MAX_YEARS:
+            impls.append(("per-day", legacy_3month_plot))
+        for name, build in impls:
+            start = time.perf_counter()
+            fig = build(df, "Pavagada")
+            elapsed = time.perf_counter() - start
+            size = len(fig.to_json())
+            print(f"{years:>5} {hw_days:>8} {name:>8} {elapsed:>9.3f} {len(fig.layout.shapes):>7} {size / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
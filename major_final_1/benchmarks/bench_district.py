@@ -0,0 +1,49 @@
+"""Serial vs parallel wall time for the all-taluk forecast.
+
+Run from ``major_final_1``:  python -m benchmarks.bench_district [years] [workers]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+import model_registry
+from benchmarks.dummy_model import benchmark_model_path
+from district_forecast import forecast_district, shutdown_pools
+from forecasting import START_DATE
+
+
+def main(years=1, workers=4):
+    model_path = benchmark_model_path()
+    end_date = pd.Timestamp(START_DATE) + pd.DateOffset(years=years) - pd.Timedelta(days=1)
+
+    # Load the model in this process first so serial timing excludes it
+    model_registry.warm_up(model_path)
+    start = time.perf_counter()
+    serial = forecast_district(START_DATE, end_date, workers=1, model_path=model_path)
+    serial_s = time.perf_counter() - start
+
+    # First parallel call pays for worker start-up and model loading
+    start = time.perf_counter()
+    forecast_district(START_DATE, end_date, workers=workers, model_path=model_path)
+    cold_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = forecast_district(START_DATE, end_date, workers=workers, model_path=model_path)
+    warm_s = time.perf_counter() - start
+    shutdown_pools()
+
+    assert serial.equals(parallel)
+    print(f"model:             {model_path}")
+    print(f"horizon:           {years} year(s), {len(serial):,} taluk-days")
+    print(f"serial:            {serial_s:.3f} s")
+    print(f"parallel (cold):   {cold_s:.3f} s  ({workers} workers)")
+    print(f"parallel (warm):   {warm_s:.3f} s  speedup {serial_s / warm_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
@@ -0,0 +1,61 @@
+"""Build, update and render time of the interpolated heat-risk grid.
+
+Run from ``major_final_1``:  python -m benchmarks.bench_heat_grid [resolution_km] [stations]
+
+The default 0.5 km resolution gives about 120k cells over the district
+bounding box. Extra synthetic stations are scattered inside the box to show
+how the KD-tree scales past the ten taluk centroids.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import heat_grid
+from heat_grid import HeatGrid, encode_png, risk_to_rgba
+from shared_data import HEATWAVE_WEIGHTS
+from tile_cache import TUMAKURU_BBOX
+
+
+def stations(n, seed=0):
+    rng = np.random.default_rng(seed)
+    south, west, north, east = TUMAKURU_BBOX
+    coords = np.column_stack([rng.uniform(south, north, n), rng.uniform(west, east, n)])
+    readings = pd.DataFrame({field: rng.uniform(0, 100, n) for field in HEATWAVE_WEIGHTS})
+    return coords, readings
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(resolution_km=0.5, n_stations=10):
+    coords, readings = stations(n_stations)
+    heat_grid._neighbour_index(coords)  # import scipy outside the timings
+    grid, build_ms = timed(lambda: HeatGrid(coords, resolution_km=resolution_km))
+    risk, update_ms = timed(lambda: grid.risk(readings))
+    png, render_ms = timed(lambda: encode_png(risk_to_rgba(risk)))
+
+    print(f"grid:        {grid.n_rows} x {grid.n_cols} = {grid.n_cells:,} cells at {resolution_km} km, {n_stations} stations")
+    print(f"build:       {build_ms:8.1f} ms  (neighbour search + IDW weights, once per station layout)")
+    print(f"update:      {update_ms:8.1f} ms  (interpolate readings + score)")
+    print(f"render:      {render_ms:8.1f} ms  (RGBA + PNG, {len(png) / 1024:.0f} KiB)")
+
+    # Same grid with the numpy fallback used when scipy is missing
+    neighbour_index = heat_grid._neighbour_index
+    heat_grid._neighbour_index = heat_grid._BruteForceNeighbours
+    try:
+        fallback, fallback_ms = timed(lambda: HeatGrid(coords, resolution_km=resolution_km))
+    finally:
+        heat_grid._neighbour_index = neighbour_index
+    assert np.allclose(np.nan_to_num(fallback.risk(readings), nan=-1), np.nan_to_num(risk, nan=-1))
+    print(f"build (no scipy): {fallback_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 0.5, int(args[1]) if len(args) > 1 else 10)
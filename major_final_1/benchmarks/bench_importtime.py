@@ -0,0 +1,52 @@
+"""Cold import time of the app shell and each dashboard page.
+
+Runs ``python -X importtime`` in a fresh interpreter per target and reports
+the total, the part on top of Streamlit itself, and the heaviest direct
+imports of each module. Run from ``major_final_1``:  python -m benchmarks.bench_importtime [top]
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+from views import PAGES
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def import_times(module):
+    """(total microseconds, {direct dependency: cumulative microseconds}) for a cold ``import module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    total, children = 0, {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        # Nesting is shown by indentation: one space is top level, three is one level down.
+        depth = (len(match.group(3)) - 1) // 2
+        if depth == 0:
+            total += int(match.group(2))
+        elif depth == 1:
+            children[match.group(4)] = int(match.group(2))
+    return total, children
+
+
+def main(top=5):
+    baseline, _ = import_times("streamlit")
+    targets = {"(shell) streamlit_app": "streamlit_app"}
+    targets.update({page: module for page, (module, _) in PAGES.items()})
+    print(f"streamlit alone: {baseline / 1000:8.1f} ms\n")
+    for label, module in targets.items():
+        total, children = import_times(module)
+        print(f"{label:<28} {total / 1000:8.1f} ms total  {max(total - baseline, 0) / 1000:8.1f} ms beyond streamlit")
+        heaviest = sorted(children.items(), key=lambda item: item[1], reverse=True)[:top]
+        print("    " + ", ".join(f"{name} {us / 1000:.0f} ms" for name, us in heaviest))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
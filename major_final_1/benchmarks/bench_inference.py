@@ -0,0 +1,45 @@
+"""Latency of each inference backend at the batch sizes the app produces.
+
+Run from ``major_final_1``:  python -m benchmarks.bench_inference [repeat]
+
+Uses the model at HEATWAVE_MODEL_PATH (the dummy model otherwise, which only
+the joblib backend supports). 1 row is a service request, 92 and 365 rows a
+3-month and 1-year taluk forecast, 8192 rows a full service micro-batch.
+"""
+
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from benchmarks.dummy_model import benchmark_model_path
+from inference import BACKEND_NAMES, _best_time, default_sample, evaluate_backends, select_backend
+
+BATCH_SIZES = (1, 92, 365, 8192)
+
+
+def main(repeat=20):
+    path = benchmark_model_path()
+    model = joblib.load(path)
+    print(f"model: {path} ({type(model).__name__})")
+    sample = default_sample()
+    backends, report = evaluate_backends(model, sample, BACKEND_NAMES, repeat=3)
+    for entry in report:
+        if entry["status"] != "ok":
+            print(f"{entry['backend']:<10} {entry['status']}")
+
+    rows = np.resize(np.arange(len(sample)), max(BATCH_SIZES))
+    table = {}
+    for name, backend in backends.items():
+        table[name] = {
+            f"{n} rows (ms)": _best_time(lambda: backend.predict(sample.iloc[rows[:n]]), repeat) * 1000
+            for n in BATCH_SIZES
+        }
+    print(pd.DataFrame(table).T.round(3).to_string())
+    chosen, _ = select_backend(model, sample)
+    print(f"selected at startup: {chosen.name}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,75 @@
+"""Points per second of the bulk taluk lookup.
+
+Run from ``major_final_1``:  python -m benchmarks.bench_locator [points] [boundaries.geojson]
+
+Without a boundary file the centroid lookup is timed, along with a synthetic
+set of 2000-vertex taluk polygons through both the shapely STRtree index and
+the numpy ray-cast fallback, so the polygon paths are measured too.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import taluk_locator
+from taluk_locator import TalukLocator, get_locator, load_boundaries
+from shared_data import TALUK_COORDS
+from tile_cache import TUMAKURU_BBOX
+
+
+def points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    south, west, north, east = TUMAKURU_BBOX
+    return rng.uniform(south, north, n), rng.uniform(west, east, n)
+
+
+def synthetic_boundaries(vertices=2000, radius_deg=0.06):
+    """Non-overlapping wobbly discs around the taluk centroids, one with a hole, standing in for real polygons."""
+    angle = np.linspace(0, 2 * np.pi, vertices, endpoint=False)
+    r = radius_deg * (1 + 0.1 * np.sin(17 * angle))
+    boundaries = {}
+    for i, (taluk, (lat, lon)) in enumerate(TALUK_COORDS.items()):
+        ring = np.column_stack([lon + r * np.cos(angle), lat + r * np.sin(angle)]).tolist()
+        hole = np.column_stack([lon + 0.02 * np.cos(angle[::50]), lat + 0.02 * np.sin(angle[::50])]).tolist()
+        boundaries[taluk] = [[ring, hole] if i == 0 else [ring]]
+    return boundaries
+
+
+def timed(label, fn, n):
+    fn()  # warm-up: lazy imports and the risk table
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    print(f"{label:<28} {seconds * 1000:8.1f} ms  {n / seconds / 1e6:6.2f} M points/s")
+    return result
+
+
+def main(n=1_000_000, path=None):
+    lat, lon = points(n)
+    print(f"{n:,} points over the district box")
+    if path:
+        locator = TalukLocator.from_boundaries(load_boundaries(path))
+        timed("boundaries: taluk ids", lambda: locator.taluk_ids(lat, lon), n)
+        timed("boundaries: lookup", lambda: locator.lookup(lat, lon), n)
+        return
+
+    locator = get_locator()
+    timed("centroids: taluk ids", lambda: locator.taluk_ids(lat, lon), n)
+    timed("centroids: lookup", lambda: locator.lookup(lat, lon), n)
+
+    boundaries = synthetic_boundaries()
+    strtree = TalukLocator.from_boundaries(boundaries)
+    ids = timed(f"polygons ({type(strtree._index).__name__})", lambda: strtree.taluk_ids(lat, lon), n)
+
+    # The ray cast tests every edge of every candidate polygon, so time a slice.
+    polygons = [(i, rings) for i, taluk in enumerate(strtree.taluks) for rings in boundaries[taluk]]
+    raycast = TalukLocator(strtree.taluks, taluk_locator._RayCastIndex(polygons), boundaries=boundaries)
+    m = min(n, 100_000)
+    fallback = timed("polygons (no shapely)", lambda: raycast.taluk_ids(lat[:m], lon[:m]), m)
+    assert np.array_equal(fallback, ids[:m])
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 1_000_000, args[1] if len(args) > 1 else None)
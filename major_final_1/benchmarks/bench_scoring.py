@@ -0,0 +1,70 @@
+"""Throughput of the batch heatwave scorer against the original per-dict scorer.
+
+Run from ``major_final_1``:  python -m benchmarks.bench_scoring [rows]
+
+``baseline_percentage`` is the scorer as it was before the batch path
+existed (hard-coded weights, one dict at a time); the speedups are relative
+to it, not to the current single-dict function.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from shared_data import HEATWAVE_WEIGHTS, calculate_heatwave_percentage, calculate_heatwave_percentage_batch
+
+
+def baseline_percentage(data):
+    tempWeight = 0.4
+    humidityWeight = 0.1
+    greenCoverWeight = -0.1
+    trafficWeight = 0.2
+    aiqWeight = 0.2
+    precipitationWeight = -0.1
+
+    score = (
+        data["Temp_2m"] * tempWeight +
+        data["Humidity"] * humidityWeight +
+        data["Green_Cover_"] * greenCoverWeight +
+        data["Traffic_Index"] * trafficWeight +
+        data["AIQ"] * aiqWeight +
+        data["Precipitation_mm"] * precipitationWeight
+    )
+    return min(max(round(score), 0), 100)
+
+
+def make_rows(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({field: rng.uniform(0, 100, n_rows) for field in HEATWAVE_WEIGHTS})
+
+
+def _per_dict_seconds(fn, sample, n_rows):
+    start = time.perf_counter()
+    scores = [fn(row) for row in sample]
+    return (time.perf_counter() - start) * n_rows / len(sample), scores
+
+
+def main(n_rows=1_000_000):
+    df = make_rows(n_rows)
+
+    start = time.perf_counter()
+    batch = calculate_heatwave_percentage_batch(df)
+    batch_s = time.perf_counter() - start
+
+    # The per-dict paths are far slower, so time them on a sample and extrapolate.
+    sample = df.head(min(n_rows, 50_000)).to_dict("records")
+    baseline_s, expected = _per_dict_seconds(baseline_percentage, sample, n_rows)
+    single_s, single = _per_dict_seconds(calculate_heatwave_percentage, sample, n_rows)
+
+    assert np.array_equal(batch[: len(expected)], expected) and single == expected
+    print(f"rows:              {n_rows:,}")
+    print(f"baseline per-dict: {baseline_s:.3f} s  ({n_rows / baseline_s:,.0f} rows/s, extrapolated)")
+    print(f"current per-dict:  {single_s:.3f} s  ({n_rows / single_s:,.0f} rows/s, extrapolated)")
+    print(f"batch:             {batch_s:.3f} s  ({n_rows / batch_s:,.0f} rows/s)")
+    print(f"batch speedup:     {baseline_s / batch_s:,.0f}x over the baseline")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
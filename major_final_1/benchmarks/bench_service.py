@@ -0,0 +1,118 @@
+"""p50/p99 latency of the prediction service under concurrent load.
+
+Drives the ASGI app in-process (no HTTP) with and without micro-batching,
+or a running server over HTTP with ``--url``.
+
+Run from ``major_final_1``:
+    python -m benchmarks.bench_service [--clients 64] [--requests 20] [--rows 30]
+    python -m benchmarks.bench_service --url http://127.0.0.1:8502
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from benchmarks.dummy_model import benchmark_model_path
+from forecasting import FEATURES, START_DATE, generate_weather_data
+from prediction_service import PredictionApp, RemoteModel
+
+
+def sample_payload(rows):
+    df = generate_weather_data(START_DATE, "2030-12-31", "Tumakuru", seed=0).iloc[:rows]
+    return {"columns": FEATURES, "data": df[FEATURES].to_numpy().tolist()}
+
+
+async def _call(app, body):
+    sent = iter([{"type": "http.request", "body": body, "more_body": False}])
+    status = {}
+
+    async def receive():
+        return next(sent)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+
+    scope = {"type": "http", "method": "POST", "path": "/predict"}
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    assert status["code"] == 200
+    return time.perf_counter() - start
+
+
+async def _load(app, body, clients, requests):
+    async def client():
+        return [await _call(app, body) for _ in range(requests)]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client() for _ in range(clients)))
+    wall = time.perf_counter() - start
+    await app.batcher.close()
+    return np.concatenate(results), wall
+
+
+def run_in_process(model_path, body, clients, requests, **batching):
+    app = PredictionApp(model_path, **batching)
+    asyncio.run(_warm(app, body))
+    latencies, wall = asyncio.run(_load(app, body, clients, requests))
+    return latencies, wall, app.stats()
+
+
+async def _warm(app, body):
+    await _call(app, body)
+    await app.batcher.close()
+
+
+def run_http(url, payload, clients, requests):
+    model = RemoteModel(url)
+    body = json.dumps(payload).encode("utf-8")
+
+    def client():
+        out = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            model._request("/predict", json.loads(body))
+            out.append(time.perf_counter() - start)
+        return out
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        results = list(pool.map(lambda _: client(), range(clients)))
+    return np.concatenate(results), time.perf_counter() - start
+
+
+def report(label, latencies, wall, stats=None):
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    line = f"{label:<14} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms   {len(latencies) / wall:8.0f} req/s"
+    if stats:
+        line += f"   {stats['requests'] / max(stats['batches'], 1):5.1f} req/batch"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=30, help="feature rows per request")
+    parser.add_argument("--url", help="benchmark a running server instead of the in-process app")
+    args = parser.parse_args()
+
+    payload = sample_payload(args.rows)
+    print(f"{args.clients} clients x {args.requests} requests x {args.rows} rows")
+    if args.url:
+        report("http", *run_http(args.url, payload, args.clients, args.requests))
+        return
+
+    model_path = benchmark_model_path()
+    print(f"model: {model_path}")
+    body = json.dumps(payload).encode("utf-8")
+    report("unbatched", *run_in_process(model_path, body, args.clients, args.requests, max_batch_rows=1))
+    report("micro-batched", *run_in_process(model_path, body, args.clients, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Stand-in for forecasting_model.joblib so benchmarks run without the real artifact."""
+
+import os
+import tempfile
+
+import joblib
+import numpy as np
+
+
+class DummyHeatwaveModel:
+    """Flags a heatwave when the heat index crosses a threshold.
+
+    ``work`` repeats a few vectorized passes per call to roughly mimic the
+    per-row cost of a small tree ensemble.
+    """
+
+    def __init__(self, threshold=33.0, work=20):
+        self.threshold = threshold
+        self.work = work
+
+    def predict(self, X):
+        heat_index = np.asarray(X['Heat_Index'], dtype=np.float64)
+        values = np.asarray(X, dtype=np.float64)
+        for _ in range(self.work):
+            values = np.tanh(values)
+        return (heat_index > self.threshold).astype(np.int64)
+
+
+def dummy_model_path(directory=None):
+    """Write the dummy model (once) and return its path."""
+    directory = directory or os.path.join(tempfile.gettempdir(), "heatwave_bench")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, "dummy_forecasting_model.joblib")
+    if not os.path.exists(path):
+        joblib.dump(DummyHeatwaveModel(), path)
+    return path
+
+
+def benchmark_model_path():
+    """The real model when HEATWAVE_MODEL_PATH points at one, otherwise the dummy."""
+    path = os.environ.get("HEATWAVE_MODEL_PATH")
+    if path and os.path.exists(path):
+        return path
+    return dummy_model_path()
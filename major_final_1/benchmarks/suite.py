@@ -0,0 +1,204 @@
+"""Time and peak memory of the forecast and scoring hot paths at several scales.
+
+Each scale point generates weather, builds features, predicts, scores,
+aggregates, finds heatwave episodes and plots, timing every stage (best of ``--repeat`` runs) and measuring its peak
+Python allocation with tracemalloc in a separate run. Results can be saved as
+a baseline and later runs compared against it; any stage slower or larger
+than ``--threshold`` times the baseline fails the run with exit status 1.
+
+Run from ``major_final_1``:
+    python -m benchmarks.suite --save benchmarks/results/baseline.json
+    python -m benchmarks.suite --compare benchmarks/results/baseline.json
+    python -m benchmarks.suite --scales 1x3m,1x1y --repeat 5
+
+Uses the dummy model unless HEATWAVE_MODEL_PATH points at a real artifact;
+baselines are only comparable on the same machine and model.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+from aggregates import ForecastAggregates
+from benchmarks.dummy_model import benchmark_model_path
+from charts import create_3month_plot, create_yearly_plot
+from downsampling import DEFAULT_CHART_WIDTH, max_points_for_width
+from episodes import find_episodes
+from forecasting import FORECAST_SEED, START_DATE, TALUKS, generate_weather_data, prepare_features
+from shared_data import HEATWAVE_WEIGHTS, WARD_DATA, calculate_heatwave_percentage, calculate_heatwave_percentage_batch
+
+# name -> (number of taluks, months of forecast)
+SCALES = {
+    "1x3m": (1, 3),
+    "1x1y": (1, 12),
+    "allx1y": (len(TALUKS), 12),
+    "allx10y": (len(TALUKS), 120),
+    "allx30y": (len(TALUKS), 360),
+}
+DEFAULT_THRESHOLD = 1.5
+# Stages below these are dominated by noise and never fail a comparison.
+MIN_COMPARABLE_SECONDS = 0.002
+MIN_COMPARABLE_BYTES = 64 * 1024
+
+
+def measure(fn, repeat):
+    """(best wall time in seconds, peak traced bytes) for ``fn()``."""
+    fn()  # warm-up: lazy imports and one-off caches count towards neither figure
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best, peak
+
+
+def scale_stages(n_taluks, months, model_path):
+    """Ordered (stage name, callable) pairs; later stages reuse earlier outputs."""
+    taluks = TALUKS[:n_taluks]
+    end_date = pd.Timestamp(START_DATE) + pd.DateOffset(months=months) - timedelta(days=1)
+    state = {}
+
+    def generate():
+        state["weather"] = [generate_weather_data(START_DATE, end_date, t, seed=FORECAST_SEED) for t in taluks]
+
+    def features():
+        state["features"] = [prepare_features(df) for df in state["weather"]]
+
+    def model_load():
+        model_registry.clear()
+        state["model"] = model_registry.get_model(model_path)
+
+    def predict():
+        state["predictions"] = [state["model"].predict(X) for X in state["features"]]
+
+    def score_batch():
+        calculate_heatwave_percentage_batch(state["ward_rows"])
+
+    def score_dicts():
+        for row in WARD_DATA.values():
+            calculate_heatwave_percentage(row)
+
+    def aggregate():
+        ForecastAggregates(state["forecast"])
+
+    def episodes():
+        find_episodes(state["district"], by='Taluk')
+
+    def plot_3month():
+        create_3month_plot(state["forecast"], taluks[0], max_points=max_points_for_width(DEFAULT_CHART_WIDTH)).to_json()
+
+    def plot_yearly():
+        create_yearly_plot(state["forecast"], taluks[0]).to_json()
+
+    # Inputs that are not themselves being measured.
+    def setup_scoring():
+        rng = np.random.default_rng(0)
+        n_rows = sum(len(df) for df in state["weather"])
+        state["ward_rows"] = pd.DataFrame({f: rng.uniform(0, 100, n_rows) for f in HEATWAVE_WEIGHTS})
+        forecast = state["weather"][0].copy()
+        forecast['Predicted_Heatwave'] = state["predictions"][0]
+        state["forecast"] = forecast
+        state["district"] = pd.concat(
+            df.assign(Taluk=taluk, Predicted_Heatwave=pred)
+            for taluk, df, pred in zip(taluks, state["weather"], state["predictions"])
+        ).rename_axis('Date').reset_index()
+
+    return [
+        ("generate_weather_data", generate),
+        ("prepare_features", features),
+        ("model_load", model_load),
+        ("predict", predict),
+        (None, setup_scoring),
+        ("score_batch", score_batch),
+        ("score_ward_dicts", score_dicts),
+        ("aggregates", aggregate),
+        ("episodes", episodes),
+        ("create_3month_plot", plot_3month),
+        ("create_yearly_plot", plot_yearly),
+    ]
+
+
+def run(scales, repeat, model_path):
+    results = {}
+    for name in scales:
+        n_taluks, months = SCALES[name]
+        for stage, fn in scale_stages(n_taluks, months, model_path):
+            if stage is None:
+                fn()
+                continue
+            seconds, peak = measure(fn, repeat)
+            results[f"{name}/{stage}"] = {"seconds": seconds, "peak_bytes": peak}
+            print(f"{name:<8} {stage:<22} {seconds * 1000:10.2f} ms  {peak / 2**20:9.2f} MiB", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Names of measurements that regressed past ``threshold`` x baseline."""
+    regressions = []
+    for key, now in results.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        slow = now["seconds"] > threshold * before["seconds"] and now["seconds"] > MIN_COMPARABLE_SECONDS
+        big = now["peak_bytes"] > threshold * before["peak_bytes"] and now["peak_bytes"] > MIN_COMPARABLE_BYTES
+        if slow or big:
+            regressions.append(key)
+            print(
+                f"REGRESSION {key}: {before['seconds'] * 1000:.2f} -> {now['seconds'] * 1000:.2f} ms, "
+                f"{before['peak_bytes'] / 2**20:.2f} -> {now['peak_bytes'] / 2**20:.2f} MiB"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=",".join(SCALES), help="comma-separated subset of " + ", ".join(SCALES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    scales = [s for s in args.scales.split(",") if s]
+    unknown = [s for s in scales if s not in SCALES]
+    if unknown:
+        parser.error(f"unknown scales: {', '.join(unknown)}")
+
+    # Keep the table readable; deprecation noise is not what is being measured.
+    warnings.simplefilter("ignore", FutureWarning)
+    model_path = benchmark_model_path()
+    print(f"model: {model_path}")
+    results = run(scales, args.repeat, model_path)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump({"machine": platform.node(), "model": model_path, "results": results}, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            return 1
+        print(f"no regressions past {args.threshold:.2f}x baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# charts.py
+"""Plotly figures for the forecast views."""
+
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from aggregates import ForecastAggregates
+from downsampling import envelope, lttb_indices
+from episodes import IMD_MIN_DAYS, find_runs
+
+
+HEATWAVE_FILL = 'rgba(231, 76, 60, 0.3)'
+ISOLATED_DAY_FILL = 'rgba(231, 76, 60, 0.12)'
+
+
+def heatwave_runs(index, flags):
+    """Merge heatwave days into contiguous runs.
+
+    Returns ``(starts, ends, lengths)``: DatetimeIndex pairs where each run
+    covers ``[start, end)`` and the run lengths in days. A gap in the dates
+    ends a run even if the days on both sides are flagged.
+    """
+    index = pd.DatetimeIndex(index)
+    days = index.normalize().asi8 // (24 * 60 * 60 * 10**9)
+    positions, starts, lengths = find_runs(days, flags)
+    first = positions[starts]
+    last = positions[starts + lengths - 1]
+    return index[first], index[last] + pd.Timedelta(days=1), lengths
+
+
+def heatwave_shapes(index, flags, min_days=IMD_MIN_DAYS):
+    """Layout shapes shading every heatwave run, for a single ``update_layout`` call.
+
+    Runs of at least ``min_days`` days (declared episodes) are shaded fully,
+    shorter isolated hot days more lightly.
+    """
+    starts, ends, lengths = heatwave_runs(index, flags)
+    return [
+        dict(
+            type="rect",
+            xref="x",
+            yref="paper",
+            x0=start,
+            x1=end,
+            y0=0,
+            y1=1,
+            fillcolor=HEATWAVE_FILL if length >= min_days else ISOLATED_DAY_FILL,
+            layer="below",
+            line_width=0,
+        )
+        for start, end, length in zip(starts, ends, lengths)
+    ]
+
+
+def create_3month_plot(df, taluk, max_points=None, webgl=False, x_range=None):
+    """Create 3-month forecast plot.
+
+    ``x_range`` (start, end) zooms to a window before downsampling, so the
+    visible span always gets the full point budget. When the series has more
+    than ``max_points`` days the temperature line is reduced with LTTB and the
+    range band with a per-bucket min/max envelope. ``webgl`` draws the
+    traces with Scattergl.
+    """
+    if x_range is not None:
+        df = df.loc[x_range[0]:x_range[1]]
+    scatter = go.Scattergl if webgl else go.Scatter
+
+    line_x, line_y = df.index, df['Temp_2m'].to_numpy()
+    band_x, band_min, band_max = df.index, df['Temp_min'].to_numpy(), df['Temp_max'].to_numpy()
+    if max_points and len(df) > max_points:
+        keep = lttb_indices(line_x, line_y, max_points)
+        line_x, line_y = line_x[keep], line_y[keep]
+        band_x, band_min, band_max = envelope(band_x, band_min, band_max, max_points // 2)
+
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    # Add temperature trace
+    fig.add_trace(
+        scatter(
+            x=line_x, 
+            y=line_y,
+            mode='lines',
+            name='Temperature (°C)',
+            line=dict(color='#2c3e50', width=2),
+            hovertemplate='%{x|%b %d}<br>%{y:.1f}°C<extra></extra>'
+        ),
+        secondary_y=False,
+    )
+    
+    # Add min-max range using a different approach
+    fig.add_trace(
+        scatter(
+            x=band_x,
+            y=band_max,
+            mode='lines',
+            line=dict(width=0),
+            showlegend=False,
+            hoverinfo='skip',
+        ),
+        secondary_y=False,
+    )
+    
+    fig.add_trace(
+        scatter(
+            x=band_x,
+            y=band_min,
+            fill='tonexty',
+            mode='lines',
+            line=dict(width=0),
+            fillcolor='rgba(52, 152, 219, 0.2)',
+            name='Temperature Range',
+            hoverinfo='skip',
+        ),
+        secondary_y=False,
+    )
+    
+    # Add heatwave indicators: one shape per run of consecutive heatwave days
+    fig.update_layout(shapes=heatwave_shapes(df.index, df['Predicted_Heatwave']))
+    
+    # Update layout
+    fig.update_layout(
+        title=f"3-Month Heatwave Forecast for {taluk} (Oct-Dec 2025)",
+        xaxis_title="Date",
+        yaxis_title="Temperature (°C)",
+        template="plotly_white",
+        hovermode="x unified",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        margin=dict(l=50, r=50, t=80, b=50),
+        height=400,
+    )
+    
+    # Add heatwave legend item
+    fig.add_annotation(
+        x=0.02,
+        y=1.1,
+        xref="paper",
+        yref="paper",
+        text="🌡️ Predicted Heatwave",
+        showarrow=False,
+        font=dict(color="#e74c3c", size=12)
+    )
+    
+    return fig
+
+def create_yearly_plot(df, taluk, monthly=None, webgl=False, title=None):
+    """Create 1-year forecast plot.
+
+    ``monthly`` can hold precomputed statistics for the taluk (the
+    ``aggregates.PERIOD_COLUMNS`` layout, e.g. ``ForecastAggregates.monthly``
+    or one taluk of ``forecast_stream.run_streaming_forecast``); ``df`` is then
+    not needed. ``webgl`` draws the temperature traces with Scattergl.
+    """
+    scatter = go.Scattergl if webgl else go.Scatter
+    if monthly is None:
+        monthly = ForecastAggregates(df).monthly
+    monthly_avg = monthly['temp_mean']
+    monthly_min = monthly['temp_min']
+    monthly_max = monthly['temp_max']
+    heatwave_months = monthly['heatwave_days']
+    
+    # Create figure
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    # Add temperature trace
+    fig.add_trace(
+        scatter(
+            x=monthly_avg.index,
+            y=monthly_avg,
+            mode='lines+markers',
+            name='Avg Temperature',
+            line=dict(color='#2c3e50', width=2),
+            marker=dict(size=8, color='#2c3e50'),
+            hovertemplate='%{x|%b %Y}<br>%{y:.1f}°C<extra></extra>'
+        ),
+        secondary_y=False,
+    )
+    
+    # Add min-max range using a different approach
+    fig.add_trace(
+        scatter(
+            x=monthly_avg.index,
+            y=monthly_max,
+            mode='lines',
+            line=dict(width=0),
+            showlegend=False,
+            hoverinfo='skip',
+        ),
+        secondary_y=False,
+    )
+    
+    fig.add_trace(
+        scatter(
+            x=monthly_avg.index,
+            y=monthly_min,
+            fill='tonexty',
+            mode='lines',
+            line=dict(width=0),
+            fillcolor='rgba(52, 152, 219, 0.2)',
+            name='Temperature Range',
+            hoverinfo='skip',
+        ),
+        secondary_y=False,
+    )
+    
+    # Add heatwave days as bars
+    fig.add_trace(
+        go.Bar(
+            x=heatwave_months.index,
+            y=heatwave_months.values,
+            name='Heatwave Days',
+            marker_color='#e74c3c',
+            opacity=0.7,
+            hovertemplate='%{x|%b %Y}<br>%{y} heatwave days<extra></extra>',
+            width=20*24*60*60*1000,  # 20 days in milliseconds
+        ),
+        secondary_y=True,
+    )
+    
+    # Update layout
+    fig.update_layout(
+        title=title or f"1-Year Heatwave Forecast for {taluk} (Oct 2025 - Sep 2026)",
+        xaxis_title="Date",
+        yaxis_title="Temperature (°C)",
+        yaxis2_title="Heatwave Days",
+        template="plotly_white",
+        hovermode="x unified",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        margin=dict(l=50, r=50, t=80, b=50),
+        height=500,
+    )
+    
+    # Update y-axes
+    fig.update_yaxes(title_text="Temperature (°C)", secondary_y=False)
+    fig.update_yaxes(title_text="Heatwave Days", secondary_y=True, range=[0, heatwave_months.max() * 1.2])
+    
+    return fig
@@ -0,0 +1,126 @@
+# district_forecast.py
+"""Forecast every taluk in the district in parallel across worker processes."""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+import model_registry
+from episodes import episode_summary, find_episodes
+from forecasting import FORECAST_SEED, TALUKS, run_forecast
+
+# Number of worker processes; 0 or 1 runs everything in the calling process.
+# Unset, each call picks one with ``default_workers``.
+WORKERS = os.environ.get("HEATWAVE_FORECAST_WORKERS")
+
+# Smallest run (taluks x days) worth a worker pool. Serial cost is about 3 ms
+# per taluk plus 1.5 us per taluk-day, so the app's 1-year district run takes
+# ~0.05 s, while starting spawned workers takes seconds; below this size a
+# pool cannot pay for itself (see benchmarks/bench_district.py).
+PARALLEL_MIN_TALUK_DAYS = 100_000
+
+_pool_lock = threading.Lock()
+_pools = {}  # (workers, model_path) -> ProcessPoolExecutor
+
+
+def _forecast_one(taluk, start_date, end_date, seed, model_path):
+    # Runs in a worker: the model was loaded by the pool initializer and is
+    # served from the worker's model_registry from then on.
+    df = run_forecast(start_date, end_date, taluk, model_registry.get_model(model_path), seed=seed)
+    df.insert(0, 'Taluk', taluk)
+    return df
+
+
+def _get_pool(workers, model_path):
+    """Reuse one pool per configuration so each worker loads the model only once."""
+    key = (workers, model_path)
+    with _pool_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            # Spawned, not forked: a fork copies whatever locks other threads hold at
+            # that moment (model_registry._lock during a background warm-up), and the
+            # worker's own warm_up would then wait on it forever.
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=model_registry.warm_up, initargs=(model_path,),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def _discard_pool(workers, model_path, pool):
+    """Drop a broken pool so the next ``_get_pool`` starts fresh workers."""
+    with _pool_lock:
+        if _pools.get((workers, model_path)) is pool:
+            del _pools[(workers, model_path)]
+    pool.shutdown(wait=False)
+
+
+def shutdown_pools():
+    with _pool_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
+
+
+def default_workers(n_taluks, n_days):
+    """``HEATWAVE_FORECAST_WORKERS`` if set, else serial unless the run is large and there are spare CPUs."""
+    if WORKERS is not None:
+        return int(WORKERS)
+    if n_taluks * n_days < PARALLEL_MIN_TALUK_DAYS:
+        return 1
+    return min(n_taluks, os.cpu_count() or 1)
+
+
+def forecast_district(start_date, end_date, taluks=TALUKS, seed=FORECAST_SEED, workers=None, model_path=None):
+    """Forecast ``taluks`` and return one long-format DataFrame (Date, Taluk, features, prediction)."""
+    if workers is None:
+        n_days = (pd.Timestamp(end_date) - pd.Timestamp(start_date)).days + 1
+        workers = default_workers(len(taluks), max(n_days, 0))
+    args = [(taluk, start_date, end_date, seed, model_path) for taluk in taluks]
+
+    if workers <= 1:
+        frames = [_forecast_one(*a) for a in args]
+    else:
+        pool = _get_pool(workers, model_path)
+        try:
+            frames = list(pool.map(_forecast_one, *zip(*args)))
+        except BrokenProcessPool:
+            # A worker died (OOM kill, segfault); retry once on a new pool.
+            _discard_pool(workers, model_path, pool)
+            pool = _get_pool(workers, model_path)
+            frames = list(pool.map(_forecast_one, *zip(*args)))
+
+    combined = pd.concat(frames)
+    combined.index.name = 'Date'
+    return combined.reset_index()
+
+
+def district_summary(long_df, short_end=None):
+    """Heatwave days and episodes per taluk, plus the hottest month, sorted from most to least affected.
+
+    When ``short_end`` is given, an extra column counts heatwave days up to that date.
+    """
+    grouped = long_df.groupby('Taluk')
+    summary = pd.DataFrame({
+        'Heatwave days': grouped['Predicted_Heatwave'].sum(),
+        'Mean temp (°C)': grouped['Temp_2m'].mean().round(1),
+        'Peak heat index': grouped['Heat_Index'].max().round(1),
+    })
+    if short_end is not None:
+        short = long_df[long_df['Date'] <= pd.Timestamp(short_end)]
+        summary.insert(0, 'Heatwave days (to ' + pd.Timestamp(short_end).strftime('%b %Y') + ')',
+                       short.groupby('Taluk')['Predicted_Heatwave'].sum())
+
+    episodes = episode_summary(find_episodes(long_df, by='Taluk'), by='Taluk')
+    summary['Heatwave episodes'] = episodes['episodes'].reindex(summary.index, fill_value=0)
+    summary['Longest episode (days)'] = episodes['longest'].reindex(summary.index, fill_value=0)
+
+    month = long_df['Date'].dt.to_period('M')
+    monthly_temp = long_df.groupby(['Taluk', month])['Temp_2m'].mean()
+    summary['Hottest month'] = monthly_temp.groupby(level='Taluk').idxmax().map(lambda key: key[1].strftime('%B %Y'))
+    return summary.sort_values('Heatwave days', ascending=False)
@@ -0,0 +1,69 @@
+# downsampling.py
+"""Server-side downsampling so long daily series stay light in the browser."""
+
+import numpy as np
+
+# Roughly two points per horizontal pixel is indistinguishable from the full series.
+POINTS_PER_PIXEL = 2
+DEFAULT_CHART_WIDTH = 1200
+
+
+def max_points_for_width(width_px=DEFAULT_CHART_WIDTH, points_per_pixel=POINTS_PER_PIXEL):
+    return int(width_px * points_per_pixel)
+
+
+def _as_float(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of ``n_out`` points that keep the shape of y(x).
+
+    The first and last points are always kept. Returns all indices when the
+    series is already short enough.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    # Average of each bucket, used as the third triangle vertex for the bucket before it
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Twice the triangle area for every candidate point in the bucket
+        area = np.abs(
+            (x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def envelope(x, low, high, n_buckets):
+    """Min of ``low`` and max of ``high`` per bucket, for range bands such as Temp_min/Temp_max.
+
+    Returns ``(x_at_bucket_start, low_min, high_max)``; unchanged when already short.
+    """
+    x = np.asarray(x)
+    low = np.asarray(low, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    if n_buckets >= len(x):
+        return x, low, high
+    starts = np.linspace(0, len(x), n_buckets, endpoint=False).astype(np.int64)
+    return x[starts], np.minimum.reduceat(low, starts), np.maximum.reduceat(high, starts)
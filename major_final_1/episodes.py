@@ -0,0 +1,110 @@
+# episodes.py
+"""Heatwave episodes: runs of consecutive predicted heatwave days.
+
+The daily ``Predicted_Heatwave`` flags are run-length encoded in one
+vectorised pass, for a single taluk's forecast or a long frame holding
+every taluk. Following IMD practice, a heatwave is only declared once the
+conditions hold on ``IMD_MIN_DAYS`` consecutive days; shorter runs are
+isolated hot days.
+"""
+
+import numpy as np
+import pandas as pd
+
+IMD_MIN_DAYS = 2
+
+EPISODE_COLUMNS = ['start', 'end', 'days', 'peak_temp', 'intensity']
+
+
+def find_runs(days, flags, groups=None):
+    """Run-length encode flagged days.
+
+    ``days`` are integer day numbers, sorted within each group, and
+    ``groups`` optional integer group codes. A run ends at a gap in the
+    dates or a change of group. Returns ``(positions, starts, lengths)``:
+    the positions of all flagged days, the offset of each run's first day
+    in ``positions`` and each run's length in days.
+    """
+    days = np.asarray(days, dtype=np.int64)
+    flagged = np.asarray(flags) == 1
+    follows = np.zeros(len(days), dtype=bool)
+    follows[1:] = flagged[1:] & flagged[:-1] & (np.diff(days) == 1)
+    if groups is not None:
+        groups = np.asarray(groups)
+        follows[1:] &= groups[1:] == groups[:-1]
+    positions = np.flatnonzero(flagged)
+    starts = np.flatnonzero(~follows[positions])
+    lengths = np.diff(np.r_[starts, len(positions)])
+    return positions, starts, lengths
+
+
+def find_episodes(df, min_days=IMD_MIN_DAYS, by=None):
+    """Episodes with at least ``min_days`` consecutive heatwave days.
+
+    ``df`` holds daily rows with ``Predicted_Heatwave``, ``Temp_max`` and
+    ``Heat_Index`` and is dated by its index or a ``Date`` column. With
+    ``by`` (e.g. ``'Taluk'``) all groups are encoded together and the
+    result gets that column first. ``end`` is the last heatwave day,
+    ``peak_temp`` the highest ``Temp_max`` and ``intensity`` the sum of
+    ``Heat_Index`` over the episode (°C·days).
+    """
+    dates = pd.DatetimeIndex(df['Date'] if 'Date' in df.columns else df.index)
+    days = dates.to_numpy().astype('datetime64[D]').astype(np.int64)
+    codes = labels = None
+    if by is not None:
+        codes, labels = pd.factorize(df[by], sort=True)
+        order = np.lexsort((days, codes))
+    else:
+        order = np.argsort(days, kind='stable')
+    days = days[order]
+    codes = None if codes is None else codes[order]
+
+    positions, _, lengths = find_runs(days, df['Predicted_Heatwave'].to_numpy()[order], codes)
+    keep = lengths >= min_days
+    # Days of the kept runs, in order, and each run's offset among them.
+    episode_days = positions[np.repeat(keep, lengths)]
+    lengths = lengths[keep]
+    offsets = np.cumsum(lengths) - lengths
+    first, last = episode_days[offsets], episode_days[offsets + lengths - 1]
+
+    def reduce(column, ufunc):
+        if column not in df.columns or not len(lengths):
+            return np.full(len(lengths), np.nan)
+        values = df[column].to_numpy(dtype=np.float64)[order[episode_days]]
+        return ufunc.reduceat(values, offsets)
+
+    def dates_at(sorted_positions):
+        return pd.DatetimeIndex(days[sorted_positions].astype('datetime64[D]').astype('datetime64[ns]'))
+
+    episodes = pd.DataFrame({
+        'start': dates_at(first),
+        'end': dates_at(last),
+        'days': lengths,
+        'peak_temp': reduce('Temp_max', np.maximum),
+        'intensity': reduce('Heat_Index', np.add),
+    })
+    if by is not None:
+        episodes.insert(0, by, labels[codes[first]])
+    return episodes
+
+
+def episode_summary(episodes, by=None):
+    """Episode count, longest episode, days in episodes and strongest intensity.
+
+    Returns a dict for a single series or, with ``by``, one row per group
+    (groups without episodes are absent).
+    """
+    if by is None:
+        return {
+            'episodes': len(episodes),
+            'longest': int(episodes['days'].max()) if len(episodes) else 0,
+            'episode_days': int(episodes['days'].sum()),
+            'max_intensity': float(episodes['intensity'].max()) if len(episodes) else 0.0,
+        }
+    grouped = episodes.groupby(by)
+    return pd.DataFrame({
+        'episodes': grouped.size(),
+        'longest': grouped['days'].max(),
+        'episode_days': grouped['days'].sum(),
+        'max_intensity': grouped['intensity'].max(),
+    })
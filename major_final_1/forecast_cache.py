@@ -0,0 +1,139 @@
+# forecast_cache.py
+"""Two-tier cache for forecast results: in-process LRU plus optional Parquet files."""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+import model_registry
+from aggregates import ForecastAggregates
+from instrumentation import count, stage
+from forecasting import FORECAST_SEED, run_forecast
+
+# Set HEATWAVE_FORECAST_CACHE_DIR to keep forecasts on disk across restarts.
+DEFAULT_CACHE_DIR = os.environ.get("HEATWAVE_FORECAST_CACHE_DIR")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ForecastCache:
+    """LRU of forecast DataFrames bounded by total memory, keyed by
+    (taluk, start, end, model version, seed).
+
+    Cached frames are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, cache_dir=DEFAULT_CACHE_DIR):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (DataFrame, nbytes)
+        self._aggregates = {}  # key -> ForecastAggregates for frames in _entries
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(taluk, start_date, end_date, seed, model_path):
+        return (
+            taluk,
+            str(pd.Timestamp(start_date).date()),
+            str(pd.Timestamp(end_date).date()),
+            model_registry.model_version(model_path),
+            seed,
+        )
+
+    def get_forecast(self, taluk, start_date, end_date, seed=FORECAST_SEED, model_path=None):
+        """Return the forecast for a taluk and date range, computing it at most once."""
+        model = model_registry.get_model(model_path)
+        key = self._key(taluk, start_date, end_date, seed, model_path)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                count("forecast_cache.memory_hit")
+                return self._entries[key][0]
+
+        df = self._read_disk(key)
+        if df is None:
+            self.misses += 1
+            count("forecast_cache.miss")
+            df = run_forecast(start_date, end_date, taluk, model, seed=seed)
+            self._write_disk(key, df)
+        else:
+            self.hits += 1
+            count("forecast_cache.disk_hit")
+
+        self._store(key, df)
+        return df
+
+    def get_aggregates(self, taluk, start_date, end_date, seed=FORECAST_SEED, model_path=None):
+        """Monthly/weekly/seasonal statistics of the same forecast, computed once per cached frame."""
+        df = self.get_forecast(taluk, start_date, end_date, seed=seed, model_path=model_path)
+        key = self._key(taluk, start_date, end_date, seed, model_path)
+        with self._lock:
+            aggregates = self._aggregates.get(key)
+        if aggregates is None:
+            with stage("aggregate"):
+                aggregates = ForecastAggregates(df)
+            with self._lock:
+                # Only keep them while the frame itself is cached.
+                if key in self._entries:
+                    self._aggregates[key] = aggregates
+        return aggregates
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._aggregates.clear()
+            self._nbytes = 0
+
+    def _store(self, key, df):
+        nbytes = int(df.memory_usage(index=True).sum())
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (df, nbytes)
+            self._nbytes += nbytes
+            # Always keep the newest entry, even if it alone exceeds the budget.
+            while self._nbytes > self.max_bytes and len(self._entries) > 1:
+                evicted_key, (_, evicted) = self._entries.popitem(last=False)
+                self._aggregates.pop(evicted_key, None)
+                self._nbytes -= evicted
+
+    def _disk_path(self, key):
+        name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.parquet")
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            return pd.read_parquet(path)
+        except (ImportError, OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, df):
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except ImportError:
+            # No Parquet engine installed: run with the in-memory tier only.
+            self.cache_dir = None
+        except OSError:
+            pass
+
+
+# Shared by every Streamlit session in this process.
+forecast_cache = ForecastCache()
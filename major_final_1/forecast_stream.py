@@ -0,0 +1,192 @@
+# forecast_stream.py
+"""Chunked forecast pipeline for long (multi-decade) horizons.
+
+Weather is generated, featurised and scored a fixed number of days at a
+time, and only monthly statistics are kept, so peak memory depends on the
+chunk size rather than the length of the horizon.
+
+Example (from ``major_final_1``)::
+
+    python forecast_stream.py 2025-01-01 2054-12-31 --out monthly.csv
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+from aggregates import PERIOD_COLUMNS
+from forecasting import CALENDAR_FIELDS, FEATURES, FORECAST_SEED, TALUKS, WEATHER_FIELDS, generate_district_weather
+
+DEFAULT_CHUNK_DAYS = 365
+
+MONTHLY_COLUMNS = PERIOD_COLUMNS
+
+
+def _month_seed(seed, month_start):
+    # Each calendar month gets its own deterministic stream derived from the run
+    # seed, so the weather does not depend on how the horizon is chunked.
+    return None if seed is None else [seed, month_start.toordinal()]
+
+
+def _iter_month_weather(start, end, taluks, seed, dtype):
+    """``generate_district_weather`` one calendar month at a time, clipped to [start, end]."""
+    month_start = start.to_period('M').to_timestamp()
+    while month_start <= end:
+        month_end = month_start + pd.offsets.MonthEnd(0)
+        dates, fields = generate_district_weather(
+            month_start, month_end, taluks, seed=_month_seed(seed, month_start), dtype=dtype
+        )
+        keep = slice(dates.searchsorted(start), dates.searchsorted(end, side='right'))
+        yield dates[keep], _slice_days(fields, keep)
+        month_start = month_end + pd.Timedelta(days=1)
+
+
+def _slice_days(fields, days):
+    return {name: values[..., days] for name, values in fields.items()}
+
+
+def _concat_days(parts):
+    dates = parts[0][0].append([d for d, _ in parts[1:]])
+    fields = {name: np.concatenate([f[name] for _, f in parts], axis=-1) for name in parts[0][1]}
+    return dates, fields
+
+
+def iter_forecast_chunks(start_date, end_date, model, taluks=TALUKS, seed=FORECAST_SEED,
+                         chunk_days=DEFAULT_CHUNK_DAYS, dtype=np.float32):
+    """Yield ``(dates, fields, predictions)`` for consecutive day chunks.
+
+    ``fields`` is the ``generate_district_weather`` output for the chunk and
+    ``predictions`` a (len(taluks), len(dates)) array of heatwave flags. The
+    days themselves are the same for any ``chunk_days``.
+    """
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    parts, buffered = [], 0
+    for dates, fields in _iter_month_weather(start, end, taluks, seed, dtype):
+        parts.append((dates, fields))
+        buffered += len(dates)
+        while buffered >= chunk_days:
+            dates, fields = _concat_days(parts)
+            chunk = slice(0, chunk_days)
+            yield _predicted_chunk(model, dates[chunk], _slice_days(fields, chunk), len(taluks))
+            rest = slice(chunk_days, None)
+            parts, buffered = [(dates[rest], _slice_days(fields, rest))], buffered - chunk_days
+    if buffered:
+        dates, fields = _concat_days(parts)
+        yield _predicted_chunk(model, dates, fields, len(taluks))
+
+
+def _predicted_chunk(model, dates, fields, n_taluks):
+    return dates, fields, predict_fields(model, fields, n_taluks, len(dates))
+
+
+def predict_fields(model, fields, n_taluks, n_days):
+    """Run ``model.predict`` on district fields laid out like ``prepare_features``."""
+    X = np.empty((n_taluks * n_days, len(FEATURES)), dtype=fields['Temp_2m'].dtype)
+    for j, name in enumerate(WEATHER_FIELDS):
+        X[:, j] = fields[name].ravel()
+    for j, name in enumerate(CALENDAR_FIELDS, start=len(WEATHER_FIELDS)):
+        X[:, j] = np.tile(fields[name], n_taluks)
+    predictions = model.predict(pd.DataFrame(X, columns=FEATURES, copy=False))
+    return np.asarray(predictions).reshape(n_taluks, n_days)
+
+
+class MonthlyAccumulator:
+    """Incrementally aggregate monthly statistics per taluk across chunks.
+
+    Chunks must arrive in date order. The days of the last month seen are
+    held back until a later chunk starts a new month (or ``result`` is
+    called), so every month is aggregated in one pass over all of its days
+    and the table does not depend on where the chunks were cut.
+    """
+
+    def __init__(self, taluks):
+        self.taluks = list(taluks)
+        self._stats = {}  # month period ordinal -> (n_taluks, 5) array
+        self._open = None  # (months, temp, temp_min, temp_max, predictions) of the trailing month
+
+    def add(self, dates, fields, predictions):
+        daily = (
+            dates.to_period('M').asi8,
+            fields['Temp_2m'], fields['Temp_min'], fields['Temp_max'],
+            np.asarray(predictions, dtype=np.float64),
+        )
+        if self._open is not None:
+            daily = tuple(np.concatenate([held, new], axis=-1) for held, new in zip(self._open, daily))
+        months = daily[0]
+        if not len(months):
+            return
+        done = np.searchsorted(months, months[-1])
+        self._open = tuple(values[..., done:] for values in daily)
+        if done:
+            self._aggregate(*(values[..., :done] for values in daily))
+
+    def _aggregate(self, months, temp, temp_min, temp_max, predictions):
+        codes, inverse = np.unique(months, return_inverse=True)
+        n_taluks, n_months = len(self.taluks), len(codes)
+        group = (np.arange(n_taluks)[:, None] * n_months + inverse).ravel()
+        size = n_taluks * n_months
+
+        temp_sum = np.bincount(group, weights=temp.ravel(), minlength=size)
+        heatwave_days = np.bincount(group, weights=predictions.ravel(), minlength=size)
+        days = np.bincount(group, minlength=size).astype(np.float64)
+        low = np.full(size, np.inf)
+        np.minimum.at(low, group, temp_min.ravel())
+        high = np.full(size, -np.inf)
+        np.maximum.at(high, group, temp_max.ravel())
+
+        stats = np.stack([temp_sum, low, high, heatwave_days, days], axis=1).reshape(n_taluks, n_months, 5)
+        for m, code in enumerate(codes):
+            self._stats[code] = stats[:, m].copy()
+
+    def result(self):
+        """Monthly statistics as a DataFrame indexed by (Taluk, month end)."""
+        if self._open is not None:
+            self._aggregate(*self._open)
+            self._open = None
+        codes = np.asarray(sorted(self._stats), dtype=np.int64)
+        stats = np.stack([self._stats[c] for c in codes], axis=1) if len(codes) else np.empty((len(self.taluks), 0, 5))
+        month_ends = pd.to_datetime(
+            pd.DataFrame({'year': codes // 12 + 1970, 'month': codes % 12 + 1, 'day': 1})
+        ) + pd.offsets.MonthEnd(0)
+        index = pd.MultiIndex.from_product([self.taluks, pd.DatetimeIndex(month_ends)], names=['Taluk', 'Month'])
+        df = pd.DataFrame(stats.reshape(-1, 5), index=index, columns=['temp_sum'] + MONTHLY_COLUMNS[1:])
+        df['temp_mean'] = df.pop('temp_sum') / df['days']
+        df[['heatwave_days', 'days']] = df[['heatwave_days', 'days']].astype(np.int64)
+        return df[MONTHLY_COLUMNS]
+
+
+def run_streaming_forecast(start_date, end_date, taluks=TALUKS, seed=FORECAST_SEED,
+                           chunk_days=DEFAULT_CHUNK_DAYS, model=None):
+    """Forecast a long horizon chunk by chunk and return the monthly statistics."""
+    model = model if model is not None else model_registry.get_model()
+    accumulator = MonthlyAccumulator(taluks)
+    for dates, fields, predictions in iter_forecast_chunks(
+        start_date, end_date, model, taluks, seed=seed, chunk_days=chunk_days
+    ):
+        accumulator.add(dates, fields, predictions)
+    return accumulator.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a long-horizon heatwave forecast for Tumakuru taluks.")
+    parser.add_argument("start")
+    parser.add_argument("end")
+    parser.add_argument("--taluk", action="append", help="Taluk to include (repeatable, default: all)")
+    parser.add_argument("--chunk-days", type=int, default=DEFAULT_CHUNK_DAYS)
+    parser.add_argument("--seed", type=int, default=FORECAST_SEED)
+    parser.add_argument("--out", help="CSV file for the monthly statistics (default: print a summary)")
+    args = parser.parse_args()
+
+    monthly = run_streaming_forecast(
+        args.start, args.end, args.taluk or TALUKS, seed=args.seed, chunk_days=args.chunk_days
+    )
+    if args.out:
+        monthly.to_csv(args.out)
+    else:
+        print(monthly.groupby(level='Taluk')['heatwave_days'].sum().sort_values(ascending=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# forecasting.py
+"""Synthetic weather generation, feature preparation and heatwave prediction."""
+
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+
+# Configuration
+TALUKS = [
+    "Tumakuru", "Tiptur", "Madhugiri", "Sira", "Pavagada",
+    "Gubbi", "Koratagere", "Chikkanayakanahalli", "Turuvekere", "Kunigal"
+]
+
+START_DATE = '2025-10-01'
+END_DATE_3MONTH = '2025-12-31'
+END_DATE_1YEAR = '2026-09-26'
+
+# Seed used by the app so a forecast is reproducible (and therefore cacheable).
+FORECAST_SEED = 2025
+
+FEATURES = [
+    'Temp_2m', 'Temp_max', 'Temp_min', 'Humidity', 'Heat_Index',
+    'Green_Cover_%', 'Traffic_Index', 'AIQ', 'Precipitation_mm',
+    'day_of_year', 'month', 'year', 'day_of_week'
+]
+
+# Seasonal temperature profile per region: (base °C, amplitude °C, phase in
+# days, daily noise std). Taluks not listed in TALUK_REGIONS use "other".
+REGION_PROFILES = {
+    "hot": (28.0, 8.0, 90.0, 3.5),       # Pavagada, Madhugiri
+    "central": (27.0, 7.0, 100.0, 3.0),  # Tumakuru, Gubbi, Koratagere
+    "other": (26.0, 6.0, 110.0, 2.8),
+}
+
+TALUK_REGIONS = {
+    "Pavagada": "hot",
+    "Madhugiri": "hot",
+    "Tumakuru": "central",
+    "Gubbi": "central",
+    "Koratagere": "central",
+}
+
+WEATHER_FIELDS = FEATURES[:9]
+CALENDAR_FIELDS = FEATURES[9:]
+
+
+def _profile_table(taluks):
+    """Profile parameters for ``taluks`` as (n_taluks, 1) columns ready to broadcast."""
+    table = np.array([REGION_PROFILES[TALUK_REGIONS.get(t, "other")] for t in taluks])
+    return [table[:, [i]] for i in range(table.shape[1])]
+
+
+def _taluk_rng(seed_seq, taluk):
+    # One independent stream per (seed, taluk), so a taluk gets the same series
+    # whether it is generated alone or together with the rest of the district.
+    key = zlib.crc32(taluk.encode("utf-8"))
+    return np.random.default_rng(np.random.SeedSequence(seed_seq.entropy, spawn_key=(key,)))
+
+
+def calendar_features(dates):
+    """Scaled date components used by the model, as 1-D arrays keyed by feature name."""
+    return {
+        'day_of_year': dates.dayofyear.to_numpy() / 365.0,
+        'month': (dates.month.to_numpy() - 1) / 11.0,
+        'year': (dates.year.to_numpy() - 2024) / 2.0,
+        'day_of_week': dates.dayofweek.to_numpy() / 6.0,
+    }
+
+
+def generate_district_weather(start_date, end_date, taluks=TALUKS, seed=None, dtype=np.float64):
+    """Generate synthetic weather for several taluks in one vectorized pass.
+
+    Returns ``(dates, fields)`` where ``fields`` maps each weather feature to a
+    (len(taluks), len(dates)) array and each calendar feature to a 1-D array
+    shared by all taluks. Results are a deterministic function of ``seed``.
+    """
+    dates = pd.date_range(start=start_date, end=end_date, freq='D')
+    n_taluks, n_days = len(taluks), len(dates)
+    seed_seq = np.random.SeedSequence(seed)
+
+    # Draw every random term into preallocated (taluk x day) arrays
+    noise = {name: np.empty((n_taluks, n_days), dtype=dtype) for name in
+             ('temp', 'max', 'min', 'humidity', 'green', 'traffic', 'aiq', 'rain')}
+    for i, taluk in enumerate(taluks):
+        rng = _taluk_rng(seed_seq, taluk)
+        rng.standard_normal(n_days, dtype=dtype, out=noise['temp'][i])
+        noise['max'][i] = rng.uniform(2, 5, n_days)
+        noise['min'][i] = rng.uniform(2, 5, n_days)
+        noise['humidity'][i] = rng.normal(65, 10, n_days)
+        noise['green'][i] = rng.uniform(30, 70, n_days)
+        noise['traffic'][i] = rng.uniform(40, 80, n_days)
+        noise['aiq'][i] = rng.uniform(50, 300, n_days)
+        noise['rain'][i] = rng.gamma(1, 2, n_days)
+
+    # Seasonal base temperature for Karnataka, with per-taluk profile parameters
+    base, amplitude, phase, variation = _profile_table(taluks)
+    day_of_year = dates.dayofyear.to_numpy()
+    temp = noise['temp']
+    temp *= variation
+    temp += base + amplitude * np.sin(2 * np.pi * (day_of_year - phase) / 365)
+
+    temp_max = noise['max']
+    temp_max += temp
+    temp_min = np.subtract(temp, noise['min'], out=noise['min'])
+    humidity = np.clip(noise['humidity'], 30, 95, out=noise['humidity'])
+    heat_index = humidity / 100 * 5
+    heat_index += temp
+
+    fields = {
+        'Temp_2m': temp,
+        'Temp_max': temp_max,
+        'Temp_min': temp_min,
+        'Humidity': humidity,
+        'Heat_Index': heat_index,
+        'Green_Cover_%': noise['green'],
+        'Traffic_Index': noise['traffic'],
+        'AIQ': noise['aiq'],
+        'Precipitation_mm': noise['rain'],
+    }
+    fields.update(calendar_features(dates))
+    return dates, fields
+
+
+def weather_frame(dates, fields, row=0):
+    """Build the single-taluk DataFrame for row ``row`` of a district result."""
+    columns = {name: fields[name][row] for name in WEATHER_FIELDS}
+    columns.update({name: fields[name] for name in CALENDAR_FIELDS})
+    return pd.DataFrame(columns, index=dates)
+
+
+# Function to generate synthetic weather data
+def generate_weather_data(start_date, end_date, taluk, seed=None):
+    dates, fields = generate_district_weather(start_date, end_date, [taluk], seed=seed)
+    return weather_frame(dates, fields)
+
+def prepare_features(df):
+    """Prepare features for prediction"""
+    return df[FEATURES]
+
+
+def run_forecast(start_date, end_date, taluk, model, seed=FORECAST_SEED):
+    """Generate weather for a taluk and add the model's Predicted_Heatwave column."""
+    with stage("generate_weather"):
+        df = generate_weather_data(start_date, end_date, taluk, seed=seed)
+    with stage("prepare_features"):
+        features = prepare_features(df)
+    with stage("predict"):
+        df['Predicted_Heatwave'] = model.predict(features)
+    return df
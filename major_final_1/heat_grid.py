@@ -0,0 +1,162 @@
+# heat_grid.py
+"""Gridded heat-risk surface over the district, interpolated from point readings.
+
+Readings at taluk centroids (or any other stations) are spread over a
+regular grid with inverse-distance weighting (IDW) on each driver, and the
+grid is then scored with the usual ``HEATWAVE_WEIGHTS``. The neighbour
+search and weights depend only on where the stations are, so they are
+computed once per layout; new readings cost one gather and one weighted sum
+per field. The result is encoded as a single PNG for a Leaflet image overlay.
+"""
+
+import base64
+import math
+import struct
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from shared_data import HEATWAVE_WEIGHTS, calculate_heatwave_percentage_batch
+from tile_cache import TUMAKURU_BBOX
+
+DEFAULT_RESOLUTION_KM = 1.0
+IDW_NEIGHBOURS = 4
+IDW_POWER = 2.0
+# Cells farther than this from every station are left blank rather than extrapolated.
+MAX_DISTANCE_KM = 30.0
+
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON_AT_EQUATOR = 111.320
+
+# Yellow -> orange -> red ramp for 0-100 % risk (ColorBrewer YlOrRd anchors).
+RISK_COLOURS = np.array([
+    (255, 255, 204), (255, 237, 160), (254, 217, 118), (254, 178, 76),
+    (253, 141, 60), (252, 78, 42), (227, 26, 28), (189, 0, 38), (128, 0, 38),
+], dtype=np.float64)
+
+
+class _BruteForceNeighbours:
+    """``cKDTree.query`` stand-in when scipy is not installed; fine for a few dozen stations."""
+
+    def __init__(self, points):
+        self.points = np.asarray(points, dtype=np.float64)
+
+    def query(self, xy, k, chunk=65536):
+        dist = np.empty((len(xy), k))
+        idx = np.empty((len(xy), k), dtype=np.intp)
+        for start in range(0, len(xy), chunk):
+            block = xy[start:start + chunk]
+            d2 = ((block[:, None, :] - self.points[None, :, :]) ** 2).sum(axis=2)
+            nearest = np.argsort(d2, axis=1)[:, :k]
+            idx[start:start + chunk] = nearest
+            dist[start:start + chunk] = np.sqrt(np.take_along_axis(d2, nearest, axis=1))
+        return dist, idx
+
+
+def _neighbour_index(points):
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        return _BruteForceNeighbours(points)
+    return cKDTree(points)
+
+
+class HeatGrid:
+    """Regular lat/lon grid over ``bbox`` with IDW weights from fixed station positions.
+
+    Row 0 is the northern edge, so ``risk()`` output is already in image order.
+    """
+
+    def __init__(self, station_coords, bbox=TUMAKURU_BBOX, resolution_km=DEFAULT_RESOLUTION_KM,
+                 neighbours=IDW_NEIGHBOURS, power=IDW_POWER, max_distance_km=MAX_DISTANCE_KM):
+        south, west, north, east = bbox
+        self.bbox = bbox
+        self.n_stations = len(station_coords)
+        # Equirectangular projection to km around the box centre is accurate to
+        # well under 1% at this size, and lets the KD-tree use plain distances.
+        self._km_per_deg_lon = KM_PER_DEG_LON_AT_EQUATOR * math.cos(math.radians((south + north) / 2))
+        self.n_rows = max(1, math.ceil((north - south) * KM_PER_DEG_LAT / resolution_km))
+        self.n_cols = max(1, math.ceil((east - west) * self._km_per_deg_lon / resolution_km))
+        self.lats = north - (np.arange(self.n_rows) + 0.5) * (north - south) / self.n_rows
+        self.lons = west + (np.arange(self.n_cols) + 0.5) * (east - west) / self.n_cols
+
+        cell_lat, cell_lon = np.meshgrid(self.lats, self.lons, indexing="ij")
+        cells = self._project(cell_lat.ravel(), cell_lon.ravel())
+        stations = np.asarray(station_coords, dtype=np.float64).reshape(-1, 2)
+        k = min(neighbours, self.n_stations)
+        dist, idx = _neighbour_index(self._project(stations[:, 0], stations[:, 1])).query(cells, k)
+        dist, idx = dist.reshape(len(cells), k), idx.reshape(len(cells), k)
+
+        with np.errstate(divide="ignore"):
+            weights = 1.0 / dist ** power
+        # A cell on top of a station takes that station's value exactly.
+        exact = dist[:, 0] < 1e-9
+        weights[exact] = 0.0
+        weights[exact, 0] = 1.0
+        weights /= weights.sum(axis=1, keepdims=True)
+
+        self._idx = idx
+        self._weights = weights.astype(np.float32)
+        self.inside = dist[:, 0] <= max_distance_km
+
+    @property
+    def n_cells(self):
+        return self.n_rows * self.n_cols
+
+    def _project(self, lat, lon):
+        return np.column_stack([lon * self._km_per_deg_lon, lat * KM_PER_DEG_LAT])
+
+    def interpolate(self, station_values):
+        """(cells x fields) IDW estimate from a (stations x fields) array."""
+        values = np.asarray(station_values, dtype=np.float32)
+        return np.einsum("ck,ckf->cf", self._weights, values[self._idx], optimize=True)
+
+    def risk(self, station_frame):
+        """Heatwave % per cell, shape (n_rows, n_cols); NaN outside the station coverage."""
+        fields = list(HEATWAVE_WEIGHTS)
+        surface = pd.DataFrame(self.interpolate(station_frame[fields].to_numpy()), columns=fields)
+        risk = calculate_heatwave_percentage_batch(surface).astype(np.float32)
+        risk[~self.inside] = np.nan
+        return risk.reshape(self.n_rows, self.n_cols)
+
+
+# --- Rendering ---
+
+def risk_to_rgba(risk, alpha=255):
+    """RGBA bytes for a risk grid: the YlOrRd ramp, transparent where NaN."""
+    valid = ~np.isnan(risk)
+    position = np.clip(np.nan_to_num(risk), 0, 100) / 100 * (len(RISK_COLOURS) - 1)
+    low = np.minimum(position.astype(np.intp), len(RISK_COLOURS) - 2)
+    frac = (position - low)[..., None]
+    rgb = RISK_COLOURS[low] * (1 - frac) + RISK_COLOURS[low + 1] * frac
+    rgba = np.empty(risk.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = np.rint(rgb)
+    rgba[..., 3] = np.where(valid, alpha, 0)
+    return rgba
+
+
+def encode_png(rgba):
+    """Minimal PNG encoder for an (h, w, 4) uint8 array (filter type 0 on every row)."""
+    height, width = rgba.shape[:2]
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = rgba.reshape(height, width * 4)
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)  # 8-bit RGBA
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)) + chunk(b"IEND", b""))
+
+
+def overlay_spec(grid, risk, opacity=0.6):
+    """Leaflet ``imageOverlay`` arguments with the PNG inlined as a data URI."""
+    south, west, north, east = grid.bbox
+    png = encode_png(risk_to_rgba(risk))
+    return {
+        "url": "data:image/png;base64," + base64.b64encode(png).decode("ascii"),
+        "bounds": [[south, west], [north, east]],
+        "opacity": opacity,
+    }
@@ -0,0 +1,252 @@
+# inference.py
+"""Interchangeable ``predict`` backends for the loaded forecasting model.
+
+- ``joblib``: the unpickled estimator itself, always available.
+- ``compiled``: sklearn decision-tree ensembles (random forest, extra trees,
+  single trees) flattened into numpy node tables and evaluated for all
+  trees at once, level by level. Skips sklearn's per-call validation and
+  thread-pool dispatch, which dominate small batches.
+- ``onnx``: the estimator converted with ``skl2onnx`` and run on ONNX
+  Runtime's CPU provider (needs both packages).
+
+``select_backend`` builds every candidate that supports the model, drops
+any whose predictions differ from the joblib model on a test batch, and
+keeps the fastest on single-row plus batch latency.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+BACKEND_NAMES = ("joblib", "compiled", "onnx")
+# Largest batch the compiled trees evaluate themselves (see CompiledTreesBackend).
+COMPILED_MAX_ROWS = 1024
+# Parity is checked in chunks small enough for every backend's own code path;
+# the batch latency is timed on one taluk-year of features.
+PARITY_CHUNK_ROWS = 256
+BATCH_ROWS = 365
+
+
+class UnsupportedModel(TypeError):
+    """The backend cannot represent this estimator."""
+
+
+def _tree_estimators(model):
+    """The fitted trees of a single sklearn tree or a random/extra-trees forest.
+
+    Anything else is rejected, including boosted ensembles (trees fitted to
+    residuals or reweighted) and bagging, whose trees each see a feature
+    subset: averaging their leaves would not reproduce ``model.predict``.
+    """
+    from sklearn.ensemble._forest import BaseForest
+    from sklearn.tree import BaseDecisionTree
+
+    if isinstance(model, BaseDecisionTree):
+        return [model]
+    if isinstance(model, BaseForest) and not hasattr(model, "estimators_features_"):
+        return list(model.estimators_)
+    raise UnsupportedModel(f"{type(model).__name__} is not a decision tree or random forest")
+
+
+def _feature_matrix(X, feature_names):
+    """float32 rows in the estimator's column order (sklearn compares in float32 too)."""
+    if isinstance(X, pd.DataFrame):
+        if feature_names is not None and not np.array_equal(X.columns, feature_names):
+            X = X[list(feature_names)]
+        return np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+    return np.ascontiguousarray(np.asarray(X, dtype=np.float32))
+
+
+class JoblibBackend:
+    name = "joblib"
+
+    def __init__(self, model):
+        self.model = model
+
+    def predict(self, X):
+        return self.model.predict(X)
+
+
+class CompiledTreesBackend:
+    """All trees' nodes in flat arrays; leaves point at themselves so every row
+    can take ``max_depth`` steps regardless of where it stops.
+
+    Batches above ``max_rows`` go to the estimator itself: sklearn's Cython
+    traversal overtakes the numpy gathers at about a thousand rows.
+    """
+
+    name = "compiled"
+
+    def __init__(self, model, max_rows=COMPILED_MAX_ROWS):
+        trees = _tree_estimators(model)
+        if getattr(model, "n_outputs_", 1) != 1:
+            raise UnsupportedModel("multi-output models are not supported")
+
+        self.model = model
+        self.max_rows = max_rows
+        self.feature_names = getattr(model, "feature_names_in_", None)
+        self.classes = getattr(model, "classes_", None)
+        self.n_trees = len(trees)
+
+        sizes = [t.tree_.node_count for t in trees]
+        self._roots = np.r_[0, np.cumsum(sizes)[:-1]].astype(np.intp)
+        left, right, feature, threshold, nan_left, values = [], [], [], [], [], []
+        for root, tree in zip(self._roots, trees):
+            t = tree.tree_
+            nodes = np.arange(t.node_count)
+            leaf = t.children_left < 0
+            left.append(np.where(leaf, nodes, t.children_left) + root)
+            right.append(np.where(leaf, nodes, t.children_right) + root)
+            feature.append(np.where(leaf, 0, t.feature))
+            threshold.append(np.where(leaf, np.inf, t.threshold))
+            nan_left.append(getattr(t, "missing_go_to_left", np.zeros(t.node_count, dtype=bool)).astype(bool))
+            value = t.value[:, 0, :].astype(np.float64)
+            if self.classes is not None:
+                # Per-leaf class fractions, as DecisionTreeClassifier.predict_proba returns them.
+                totals = value.sum(axis=1, keepdims=True)
+                value = value / np.where(totals == 0, 1, totals)
+            values.append(value)
+        # Left and right child of node i at 2i and 2i + 1.
+        self._children = np.column_stack([np.concatenate(left), np.concatenate(right)]).astype(np.intp).ravel()
+        self._feature = np.concatenate(feature).astype(np.intp)
+        self._threshold = np.concatenate(threshold)
+        self._nan_left = np.concatenate(nan_left)
+        self._value = np.concatenate(values)
+        self._depth = max(t.tree_.max_depth for t in trees)
+
+    def leaves(self, X):
+        """(rows x trees) global node id of the leaf each row reaches in each tree."""
+        return self._leaf_nodes(X).T
+
+    def _leaf_nodes(self, X):
+        # Laid out trees x rows, so summing leaf values over trees reduces the outer axis.
+        X = _feature_matrix(X, self.feature_names)
+        has_nan = np.isnan(X).any()
+        flat = X.ravel()
+        row_offset = np.arange(len(X)) * X.shape[1]
+        node = np.repeat(self._roots[:, None], len(X), axis=1)
+        for _ in range(self._depth):
+            x = flat.take(row_offset + self._feature.take(node))
+            go_right = ~(x <= self._threshold.take(node))
+            if has_nan:  # sklearn sends NaN the way training sent missing values
+                go_right &= ~(np.isnan(x) & self._nan_left.take(node))
+            node = self._children.take(2 * node + go_right)
+        return node
+
+    def predict(self, X):
+        if len(X) > self.max_rows:
+            return self.model.predict(X)
+        # Summing over the tree axis adds trees one after another, in sklearn's
+        # order, so near-ties round the same way.
+        total = self._value[self._leaf_nodes(X)].sum(axis=0)
+        if self.classes is None:
+            return total[:, 0] / self.n_trees
+        return self.classes[np.argmax(total, axis=1)]
+
+
+class OnnxBackend:
+    name = "onnx"
+
+    def __init__(self, model):
+        import onnxruntime
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+
+        self.feature_names = getattr(model, "feature_names_in_", None)
+        n_features = model.n_features_in_
+        options = {id(model): {"zipmap": False}} if hasattr(model, "classes_") else None
+        try:
+            onx = convert_sklearn(model, initial_types=[("X", FloatTensorType([None, n_features]))], options=options)
+        except Exception as exc:  # skl2onnx raises assorted errors for estimators it cannot convert
+            raise UnsupportedModel(f"skl2onnx cannot convert {type(model).__name__}: {exc}") from exc
+        self._session = onnxruntime.InferenceSession(onx.SerializeToString(), providers=["CPUExecutionProvider"])
+        self._output = self._session.get_outputs()[0].name
+
+    def predict(self, X):
+        result = self._session.run([self._output], {"X": _feature_matrix(X, self.feature_names)})[0]
+        return result.ravel()
+
+
+BACKENDS = {"joblib": JoblibBackend, "compiled": CompiledTreesBackend, "onnx": OnnxBackend}
+
+
+def default_sample(rows_per_taluk=365):
+    """A year of features for a few taluks, as the forecasts produce them."""
+    from forecasting import FORECAST_SEED, START_DATE, TALUKS, generate_weather_data, prepare_features
+
+    end = pd.Timestamp(START_DATE) + pd.Timedelta(days=rows_per_taluk - 1)
+    frames = [prepare_features(generate_weather_data(START_DATE, end, taluk, seed=FORECAST_SEED))
+              for taluk in TALUKS[:3]]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def evaluate_backends(model, sample, names=BACKEND_NAMES, repeat=5):
+    """Build, parity-check and time each backend on ``sample``.
+
+    Returns ``(backends, report)``: the usable backends by name, and one
+    report dict per candidate with its status and latencies in ms (one row
+    and ``BATCH_ROWS`` rows).
+    """
+    reference = np.asarray(model.predict(sample))
+    chunks = [sample.iloc[i:i + PARITY_CHUNK_ROWS] for i in range(0, len(sample), PARITY_CHUNK_ROWS)]
+    single, batch = sample.iloc[:1], sample.iloc[:BATCH_ROWS]
+    backends, report = {}, []
+    for name in names:
+        entry = {"backend": name, "status": "ok", "single_ms": np.nan, "batch_ms": np.nan}
+        report.append(entry)
+        # A backend that cannot be built or fails on the sample is skipped, never
+        # fatal: the joblib model is always there to fall back on.
+        try:
+            backend = BACKENDS[name](model)
+            predictions = np.concatenate([np.asarray(backend.predict(chunk)).ravel() for chunk in chunks])
+            if predictions.shape != reference.shape or not np.array_equal(predictions, reference):
+                same_shape = predictions.shape == reference.shape
+                mismatched = np.count_nonzero(predictions != reference) if same_shape else "all"
+                entry["status"] = f"parity failed: {mismatched} of {len(reference)} rows differ"
+                continue
+            backend.predict(single)  # warm-up
+            single_ms = _best_time(lambda: backend.predict(single), repeat) * 1000
+            batch_ms = _best_time(lambda: backend.predict(batch), repeat) * 1000
+        except (ImportError, UnsupportedModel) as exc:
+            entry["status"] = f"unavailable: {exc}"
+            continue
+        except Exception as exc:
+            entry["status"] = f"failed: {type(exc).__name__}: {exc}"
+            continue
+        entry["single_ms"], entry["batch_ms"] = single_ms, batch_ms
+        backends[name] = backend
+    return backends, report
+
+
+def select_backend(model, sample=None, preferred="auto", repeat=5):
+    """The fastest backend that matches the joblib model, plus the evaluation report.
+
+    ``preferred`` names one backend to use when it passes the parity check;
+    ``"auto"`` picks the lowest single-row + batch latency. The chosen
+    backend's report entry gets ``selected=True``.
+    """
+    if preferred == "joblib":
+        return JoblibBackend(model), []
+    sample = default_sample() if sample is None else sample
+    names = BACKEND_NAMES if preferred == "auto" else ("joblib", preferred)
+    backends, report = evaluate_backends(model, sample, names, repeat)
+    if preferred in backends:
+        chosen = preferred
+    elif preferred != "auto":
+        chosen = "joblib"
+    else:
+        timed = [r for r in report if r["backend"] in backends]
+        chosen = min(timed, key=lambda r: r["single_ms"] + r["batch_ms"])["backend"]
+    for entry in report:
+        entry["selected"] = entry["backend"] == chosen
+    return backends[chosen], report
@@ -0,0 +1,204 @@
+# instrumentation.py
+"""Lightweight per-stage timers, memory peaks and counters.
+
+Wrap a stage with ``with stage("predict"):`` and bump counters with
+``count("forecast_cache.hit")``. While disabled (the default) ``stage``
+returns a shared no-op context manager and ``count`` returns immediately, so
+the calls can stay in hot paths.
+
+Enable with ``HEATWAVE_INSTRUMENT=1`` (add ``HEATWAVE_TRACE_MEMORY=1`` for
+tracemalloc peaks, which slows allocation-heavy code noticeably) or at
+runtime with ``enable()``. With ``HEATWAVE_METRICS_DIR`` set, ``flush()``
+appends stage events to ``events.jsonl`` and rewrites ``metrics.prom`` in
+Prometheus text format.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+METRICS_DIR = os.environ.get("HEATWAVE_METRICS_DIR")
+RECENT_EVENTS = 200
+MAX_PENDING_EVENTS = 10_000
+
+_enabled = os.environ.get("HEATWAVE_INSTRUMENT", "") not in ("", "0")
+_trace_memory = os.environ.get("HEATWAVE_TRACE_MEMORY", "") not in ("", "0")
+if _enabled and _trace_memory and not tracemalloc.is_tracing():
+    tracemalloc.start()
+_lock = threading.Lock()
+_stages = {}  # name -> {"calls", "total_s", "max_s", "last_s", "peak_bytes"}
+_counters = {}
+_recent = deque(maxlen=RECENT_EVENTS)
+_pending = deque(maxlen=MAX_PENDING_EVENTS)  # events not yet written by flush()
+_local = threading.local()  # per-thread stack of saved tracemalloc peaks
+_NOOP = contextlib.nullcontext()
+
+
+def enabled():
+    return _enabled
+
+
+def tracing_memory():
+    return _enabled and _trace_memory
+
+
+def enable(trace_memory=False):
+    global _enabled, _trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not trace_memory and _trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _enabled = True
+    _trace_memory = trace_memory
+
+
+def disable():
+    global _enabled, _trace_memory
+    _enabled = False
+    if _trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _trace_memory = False
+
+
+def reset():
+    """Forget all recorded stages, counters and events."""
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _recent.clear()
+        _pending.clear()
+
+
+def count(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def stage(name):
+    """Context manager timing one stage; a no-op while instrumentation is off."""
+    if not _enabled:
+        return _NOOP
+    return _Stage(name)
+
+
+class _Stage:
+    __slots__ = ("name", "start", "tracing", "base_bytes")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.tracing = _trace_memory and tracemalloc.is_tracing()
+        if self.tracing:
+            # reset_peak() is process-wide, so remember the enclosing stage's
+            # peak so far; it is handed back when this stage ends.
+            stack = getattr(_local, "peaks", None)
+            if stack is None:
+                stack = _local.peaks = []
+            current, peak = tracemalloc.get_traced_memory()
+            stack.append([peak, 0])
+            tracemalloc.reset_peak()
+            self.base_bytes = current
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        peak = None
+        if self.tracing:
+            enclosing_peak, nested_peak = _local.peaks.pop()
+            # Reported as growth over what was allocated when the stage began.
+            peak = max(tracemalloc.get_traced_memory()[1], nested_peak) - self.base_bytes
+            if _local.peaks:
+                _local.peaks[-1][1] = max(_local.peaks[-1][1], enclosing_peak)
+        _record(self.name, elapsed, peak, failed=exc_type is not None)
+        return False
+
+
+def _record(name, elapsed, peak, failed):
+    event = {"time": time.time(), "stage": name, "seconds": round(elapsed, 6)}
+    if peak is not None:
+        event["peak_bytes"] = peak
+    if failed:
+        event["failed"] = True
+    with _lock:
+        stats = _stages.get(name)
+        if stats is None:
+            stats = _stages[name] = {"calls": 0, "total_s": 0.0, "max_s": 0.0, "last_s": 0.0, "peak_bytes": 0}
+        stats["calls"] += 1
+        stats["total_s"] += elapsed
+        stats["max_s"] = max(stats["max_s"], elapsed)
+        stats["last_s"] = elapsed
+        if peak is not None:
+            stats["peak_bytes"] = max(stats["peak_bytes"], peak)
+        _recent.append(event)
+        _pending.append(event)
+
+
+def stage_stats():
+    """Copy of the per-stage aggregates."""
+    with _lock:
+        return {name: dict(stats) for name, stats in _stages.items()}
+
+
+def counters():
+    with _lock:
+        return dict(_counters)
+
+
+def recent_events():
+    with _lock:
+        return list(_recent)
+
+
+# --- Export ---
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text():
+    """All stage aggregates and counters in the Prometheus text exposition format."""
+    stages = stage_stats()
+    lines = [
+        "# HELP heatwave_stage_seconds_total Wall time spent in each stage.",
+        "# TYPE heatwave_stage_seconds_total counter",
+    ]
+    lines += [f'heatwave_stage_seconds_total{{stage="{_label(n)}"}} {s["total_s"]:.6f}' for n, s in stages.items()]
+    lines += ["# HELP heatwave_stage_calls_total Times each stage ran.", "# TYPE heatwave_stage_calls_total counter"]
+    lines += [f'heatwave_stage_calls_total{{stage="{_label(n)}"}} {s["calls"]}' for n, s in stages.items()]
+    lines += ["# HELP heatwave_stage_max_seconds Slowest run of each stage.", "# TYPE heatwave_stage_max_seconds gauge"]
+    lines += [f'heatwave_stage_max_seconds{{stage="{_label(n)}"}} {s["max_s"]:.6f}' for n, s in stages.items()]
+    traced = {n: s for n, s in stages.items() if s["peak_bytes"]}
+    if traced:
+        lines += ["# HELP heatwave_stage_peak_bytes Largest traced allocation peak per stage.",
+                  "# TYPE heatwave_stage_peak_bytes gauge"]
+        lines += [f'heatwave_stage_peak_bytes{{stage="{_label(n)}"}} {s["peak_bytes"]}' for n, s in traced.items()]
+    lines += ["# HELP heatwave_events_total Instrumentation counters.", "# TYPE heatwave_events_total counter"]
+    lines += [f'heatwave_events_total{{name="{_label(n)}"}} {v}' for n, v in counters().items()]
+    return "\n".join(lines) + "\n"
+
+
+def flush(metrics_dir=None):
+    """Append pending events to events.jsonl and rewrite metrics.prom."""
+    metrics_dir = metrics_dir or METRICS_DIR
+    if not _enabled or not metrics_dir:
+        return
+    with _lock:
+        events = list(_pending)
+        _pending.clear()
+    os.makedirs(metrics_dir, exist_ok=True)
+    if events:
+        with open(os.path.join(metrics_dir, "events.jsonl"), "a", encoding="utf-8") as fh:
+            fh.writelines(json.dumps(event) + "\n" for event in events)
+    prom_path = os.path.join(metrics_dir, "metrics.prom")
+    tmp_path = f"{prom_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.write(prometheus_text())
+    os.replace(tmp_path, prom_path)
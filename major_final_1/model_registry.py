@@ -0,0 +1,146 @@
+# model_registry.py
+"""Process-wide registry that loads each model artifact once and reuses it."""
+
+import hashlib
+import logging
+import os
+import threading
+import warnings
+
+import instrumentation
+
+# Default artifact lives next to the app; override with HEATWAVE_MODEL_PATH.
+DEFAULT_MODEL_PATH = os.environ.get(
+    "HEATWAVE_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "forecasting_model.joblib"),
+)
+
+# When set, get_model()/model_version() without an explicit path use the
+# shared prediction service (prediction_service.py) instead of a local load.
+PREDICTION_URL = os.environ.get("HEATWAVE_PREDICTION_URL")
+
+# Backend serving predict (see inference.py): "auto" picks the fastest one that
+# matches the joblib model; "joblib", "compiled" or "onnx" ask for one.
+INFERENCE_BACKEND = os.environ.get("HEATWAVE_INFERENCE_BACKEND", "auto")
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_remote = {}  # url -> RemoteModel
+_entries = {}  # path -> {"model", "fingerprint", "version", "backends"}
+
+
+def _fingerprint(path):
+    """Cheap change detector for an artifact: (mtime_ns, size)."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_hash(path, chunk_size=1 << 20):
+    """Short content hash of the artifact, used as the model version."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def _load(path):
+    # Imported here so pages that never forecast do not pay for joblib.
+    import joblib
+
+    # Memory-map numpy arrays inside uncompressed artifacts (e.g. tree node
+    # tables) so several processes share the same pages. joblib ignores
+    # mmap_mode for compressed files and warns about it; that is fine here.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        return joblib.load(path, mmap_mode="r")
+
+
+def _select_backend(model):
+    from inference import select_backend
+
+    with instrumentation.stage("backend_select"):
+        backend, report = select_backend(model, preferred=INFERENCE_BACKEND)
+    if INFERENCE_BACKEND not in ("auto", backend.name):
+        warnings.warn(f"inference backend {INFERENCE_BACKEND!r} unavailable or not matching; using {backend.name}")
+    return backend, report
+
+
+def _remote_model():
+    model = _remote.get(PREDICTION_URL)
+    if model is None:
+        from prediction_service import RemoteModel
+
+        model = _remote[PREDICTION_URL] = RemoteModel(PREDICTION_URL)
+    return model
+
+
+def get_model(path=None):
+    """Return the model at ``path``, loading it only if it is new or changed on disk.
+
+    The result is the inference backend chosen for the artifact; it has the
+    estimator's ``predict``.
+    """
+    if path is None and PREDICTION_URL:
+        return _remote_model()
+    path = os.path.abspath(path or DEFAULT_MODEL_PATH)
+    fingerprint = _fingerprint(path)
+
+    entry = _entries.get(path)
+    if entry is not None and entry["fingerprint"] == fingerprint:
+        return entry["model"]
+
+    with _lock:
+        entry = _entries.get(path)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            return entry["model"]
+        version = _file_hash(path)
+        if entry is not None and entry["version"] == version:
+            # Touched but not modified: keep the loaded object.
+            entry["fingerprint"] = fingerprint
+            return entry["model"]
+        with instrumentation.stage("model_load"):
+            model = _load(path)
+        backend, report = _select_backend(model)
+        _entries[path] = {"model": backend, "fingerprint": fingerprint, "version": version, "backends": report}
+        return backend
+
+
+def model_version(path=None):
+    """Content hash of the currently loaded artifact (loads it if needed)."""
+    if path is None and PREDICTION_URL:
+        return _remote_model().version()
+    path = os.path.abspath(path or DEFAULT_MODEL_PATH)
+    get_model(path)
+    return _entries[path]["version"]
+
+
+def backend_report(path=None):
+    """Parity and latency of each inference backend tried for the loaded artifact."""
+    entry = _entries.get(os.path.abspath(path or DEFAULT_MODEL_PATH))
+    return entry["backends"] if entry is not None else []
+
+
+def warm_up(path=None):
+    """Load the model ahead of the first forecast. Returns False if it is missing or unloadable.
+
+    Runs on background threads and pool initializers, so failures are logged
+    rather than raised; the first real ``get_model`` call reports them again.
+    """
+    if path is None and PREDICTION_URL:
+        return True
+    try:
+        get_model(path)
+    except FileNotFoundError:
+        return False
+    except Exception:
+        logger.exception("could not load the forecasting model from %s", path or DEFAULT_MODEL_PATH)
+        return False
+    return True
+
+
+def clear():
+    """Drop every cached model (mainly for tests and benchmarks)."""
+    with _lock:
+        _entries.clear()
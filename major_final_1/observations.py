@@ -0,0 +1,232 @@
+# observations.py
+"""On-disk store of observed daily weather per taluk (partitioned Parquet).
+
+Station or reanalysis files are normalised to the model's weather fields,
+reduced to one row per taluk and day, and appended under
+``<root>/taluk=<name>/year=<yyyy>/``. Loads are append-only: each taluk keeps
+a watermark (the last date stored) and rows at or before it are skipped, so
+re-running an ingest is harmless. Range queries return frames that
+``forecasting.prepare_features`` accepts as-is::
+
+    python observations.py ingest stations.csv
+    python observations.py ingest era5.nc --variables Temp_2m=t2m Humidity=rh
+    python observations.py status
+"""
+
+import argparse
+import json
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from forecasting import FEATURES, TALUKS, WEATHER_FIELDS, calendar_features, prepare_features
+from shared_data import TALUK_COORDS
+
+# Set HEATWAVE_OBSERVATIONS_DIR to keep the store somewhere other than the app folder.
+DEFAULT_STORE_DIR = os.environ.get(
+    "HEATWAVE_OBSERVATIONS_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "observations"),
+)
+MANIFEST_NAME = "_manifest.json"
+
+
+# --- Reading source files ---
+
+def read_csv_observations(path, column_map=None, taluk=None):
+    """Read a station CSV with a date column, a taluk column (or ``taluk``) and weather fields.
+
+    ``column_map`` renames source columns to model field names, e.g. ``{"tmax": "Temp_2m"}``.
+    """
+    df = pd.read_csv(path)
+    if column_map:
+        df = df.rename(columns=column_map)
+    df.columns = [c if c in WEATHER_FIELDS else c.lower() for c in df.columns]
+    if "date" not in df.columns:
+        raise ValueError(f"{path}: no 'date' column")
+    if taluk is not None:
+        df["taluk"] = taluk
+    elif "taluk" not in df.columns:
+        raise ValueError(f"{path}: no 'taluk' column; pass taluk= for single-station files")
+    return df
+
+
+def read_netcdf_observations(path, variables, taluks=None):
+    """Sample a gridded NetCDF file at the nearest grid cell to each taluk.
+
+    ``variables`` maps model field names to NetCDF variable names. Values are
+    taken as-is, so convert units (e.g. Kelvin) before ingesting if needed.
+    Needs ``xarray`` with a NetCDF engine.
+    """
+    try:
+        import xarray as xr
+    except ImportError as exc:
+        raise ImportError("NetCDF ingestion needs xarray and netCDF4 (pip install xarray netCDF4)") from exc
+
+    taluks = [t for t in (taluks or TALUKS) if t in TALUK_COORDS]
+    with xr.open_dataset(path) as ds:
+        lat = "latitude" if "latitude" in ds.coords else "lat"
+        lon = "longitude" if "longitude" in ds.coords else "lon"
+        time = "time" if "time" in ds.coords else "valid_time"
+        frames = []
+        for taluk in taluks:
+            t_lat, t_lon = TALUK_COORDS[taluk]
+            point = ds[list(variables.values())].sel({lat: t_lat, lon: t_lon}, method="nearest")
+            df = point.to_dataframe().reset_index()
+            df = df.rename(columns={time: "date", **{src: field for field, src in variables.items()}})
+            df["taluk"] = taluk
+            frames.append(df[["date", "taluk", *variables]])
+    return pd.concat(frames, ignore_index=True)
+
+
+def to_daily(df):
+    """One row per (taluk, day): daily means of the known weather fields."""
+    fields = [f for f in WEATHER_FIELDS if f in df.columns]
+    if not fields:
+        raise ValueError("no recognised weather fields; expected some of " + ", ".join(WEATHER_FIELDS))
+    out = df[["taluk", *fields]].copy()
+    out["date"] = pd.to_datetime(df["date"]).dt.tz_localize(None).dt.normalize()
+    out[fields] = out[fields].astype(np.float32)
+    daily = out.groupby(["taluk", "date"], sort=True)[fields].mean().reset_index()
+    # Missing fields are stored as NaN so every partition has the same schema.
+    for field in WEATHER_FIELDS:
+        if field not in daily.columns:
+            daily[field] = np.float32(np.nan)
+    return daily[["taluk", "date", *WEATHER_FIELDS]]
+
+
+# --- The store ---
+
+class ObservationStore:
+    """Append-only Parquet dataset of daily observations, partitioned by taluk and year."""
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+        self._manifest_path = os.path.join(root, MANIFEST_NAME)
+
+    def watermarks(self):
+        """Last stored date per taluk."""
+        try:
+            with open(self._manifest_path, encoding="utf-8") as fh:
+                raw = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        return {taluk: pd.Timestamp(day) for taluk, day in raw.items()}
+
+    def _save_watermarks(self, marks):
+        tmp_path = f"{self._manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({t: str(d.date()) for t, d in sorted(marks.items())}, fh, indent=2)
+        os.replace(tmp_path, self._manifest_path)
+
+    def append(self, df):
+        """Add daily rows newer than each taluk's watermark. Returns rows written per taluk."""
+        daily = to_daily(df)
+        marks = self.watermarks()
+        written = {}
+        for taluk, rows in daily.groupby("taluk", sort=False):
+            mark = marks.get(taluk)
+            if mark is not None:
+                rows = rows[rows["date"] > mark]
+            if rows.empty:
+                continue
+            for year, part in rows.groupby(rows["date"].dt.year):
+                part_dir = os.path.join(self.root, f"taluk={taluk}", f"year={year}")
+                os.makedirs(part_dir, exist_ok=True)
+                part.drop(columns="taluk").to_parquet(
+                    os.path.join(part_dir, f"part-{uuid.uuid4().hex}.parquet"), index=False
+                )
+            marks[taluk] = rows["date"].max()
+            written[taluk] = len(rows)
+        if written:
+            # Watermarks move only after the data files are in place.
+            self._save_watermarks(marks)
+        return written
+
+    def ingest(self, path, fmt=None, **kwargs):
+        """Read a CSV or NetCDF file and append it. Returns rows written per taluk."""
+        fmt = fmt or ("netcdf" if path.endswith((".nc", ".nc4", ".netcdf")) else "csv")
+        if fmt == "netcdf":
+            df = read_netcdf_observations(path, **kwargs)
+        else:
+            df = read_csv_observations(path, **kwargs)
+        return self.append(df)
+
+    def query(self, taluk, start_date=None, end_date=None, columns=None):
+        """Daily observations for a taluk between two dates (inclusive), indexed by date.
+
+        Only the taluk's partitions for the requested years are opened, and
+        the date filter is pushed down to the Parquet row groups.
+        """
+        import pyarrow.dataset as ds
+
+        taluk_dir = os.path.join(self.root, f"taluk={taluk}")
+        columns = list(columns or WEATHER_FIELDS)
+        if not os.path.isdir(taluk_dir):
+            return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name="date"), dtype=np.float32)
+
+        dataset = ds.dataset(taluk_dir, format="parquet", partitioning="hive")
+        condition = None
+        if start_date is not None:
+            start = pd.Timestamp(start_date)
+            condition = (ds.field("year") >= start.year) & (ds.field("date") >= start)
+        if end_date is not None:
+            end = pd.Timestamp(end_date)
+            upper = (ds.field("year") <= end.year) & (ds.field("date") <= end)
+            condition = upper if condition is None else condition & upper
+        table = dataset.to_table(columns=["date", *columns], filter=condition)
+        return table.to_pandas().set_index("date").sort_index()
+
+    def feature_frame(self, taluk, start_date=None, end_date=None):
+        """Observations plus calendar fields, ready for ``prepare_features``."""
+        df = self.query(taluk, start_date, end_date)
+        df.index.name = None
+        for name, values in calendar_features(df.index).items():
+            df[name] = values
+        return df[FEATURES]
+
+
+def run_observed_forecast(start_date, end_date, taluk, model, store=None):
+    """Like ``forecasting.run_forecast`` but on observed history; days with gaps are dropped."""
+    store = store or ObservationStore()
+    df = store.feature_frame(taluk, start_date, end_date).dropna()
+    if not df.empty:
+        df['Predicted_Heatwave'] = model.predict(prepare_features(df))
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load observed weather into the local Parquet store.")
+    parser.add_argument("--store", default=DEFAULT_STORE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    ingest = sub.add_parser("ingest", help="append CSV or NetCDF files")
+    ingest.add_argument("paths", nargs="+")
+    ingest.add_argument("--format", choices=["csv", "netcdf"], help="default: by file extension")
+    ingest.add_argument("--taluk", help="taluk for single-station CSVs without a taluk column")
+    ingest.add_argument("--variables", nargs="*", default=[], metavar="FIELD=VAR",
+                        help="NetCDF variable for each model field, e.g. Temp_2m=t2m")
+    sub.add_parser("status", help="show the last stored date per taluk")
+    args = parser.parse_args()
+
+    store = ObservationStore(args.store)
+    if args.command == "ingest":
+        for path in args.paths:
+            fmt = args.format or ("netcdf" if path.endswith((".nc", ".nc4", ".netcdf")) else "csv")
+            if fmt == "netcdf":
+                variables = dict(item.split("=", 1) for item in args.variables)
+                written = store.ingest(path, fmt, variables=variables)
+            else:
+                written = store.ingest(path, fmt, taluk=args.taluk)
+            total = sum(written.values())
+            print(f"{path}: {total} new rows for {len(written)} taluks")
+    else:
+        marks = store.watermarks()
+        if not marks:
+            print(f"no observations in {args.store}")
+        for taluk, day in marks.items():
+            print(f"{taluk}: up to {day.date()}")
+
+
+if __name__ == "__main__":
+    main()
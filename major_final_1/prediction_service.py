@@ -0,0 +1,285 @@
+# prediction_service.py
+"""Standalone prediction service: one warm model behind a small ASGI app.
+
+Concurrent requests are coalesced into micro-batches so ``model.predict``
+runs once per batch instead of once per caller. Serve it with any ASGI
+server, e.g.::
+
+    uvicorn prediction_service:app --port 8502
+
+and point the dashboard and batch jobs at it with
+``HEATWAVE_PREDICTION_URL=http://127.0.0.1:8502`` (see ``model_registry``).
+
+``POST /predict`` takes features in the ``prepare_features`` layout, either
+``{"columns": [...], "data": [[...], ...]}`` (``DataFrame.to_json(orient="split")``)
+or ``{"Temp_2m": [...], ...}``, and returns ``{"predictions": [...]}``.
+``GET /health`` reports the model version and batching counters.
+"""
+
+import asyncio
+import json
+import os
+import time
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+from forecasting import FEATURES
+
+MAX_BATCH_ROWS = int(os.environ.get("HEATWAVE_MAX_BATCH_ROWS", "8192"))
+MAX_WAIT_MS = float(os.environ.get("HEATWAVE_MAX_WAIT_MS", "2"))
+
+
+# --- Micro-batching ---
+
+class MicroBatcher:
+    """Queue feature arrays and run ``predict_fn`` on whatever has arrived.
+
+    A batch closes when it reaches ``max_batch_rows`` or ``max_wait_ms`` after
+    its first request, whichever comes first. ``predict_fn(batch)`` returns
+    ``(predictions, model_version)`` and runs in a worker thread so the event
+    loop keeps accepting requests meanwhile. When a batch fails, its requests
+    are retried one at a time, so only the request that caused it fails.
+    """
+
+    def __init__(self, predict_fn, max_batch_rows=MAX_BATCH_ROWS, max_wait_ms=MAX_WAIT_MS):
+        self.predict_fn = predict_fn
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_ms / 1000.0
+        self.requests = 0
+        self.batches = 0
+        self.rows = 0
+        self._queue = None
+        self._worker = None
+
+    async def predict(self, features):
+        """``(predictions, model_version)`` for a (rows x len(FEATURES)) array."""
+        features = check_features(features)
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future))
+        return await future
+
+    async def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _collect(self):
+        pending = [await self._queue.get()]
+        rows = len(pending[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while rows < self.max_batch_rows:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                # Still take anything already queued without waiting.
+                if self._queue.empty():
+                    break
+                item = self._queue.get_nowait()
+            else:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            pending.append(item)
+            rows += len(item[0])
+        return pending
+
+    async def _run(self):
+        while True:
+            pending = await self._collect()
+            batch = np.concatenate([features for features, _ in pending])
+            if await self._run_batch(pending, batch) or len(pending) == 1:
+                continue
+            # Find the request(s) that broke the batch; the rest still get answers.
+            for features, future in pending:
+                await self._run_batch([(features, future)], features)
+
+    async def _run_batch(self, pending, batch):
+        """Answer ``pending`` from one ``predict_fn`` call; on failure only a lone request is failed."""
+        try:
+            predictions, version = await asyncio.to_thread(self.predict_fn, batch)
+        except Exception as exc:
+            if len(pending) == 1:
+                _, future = pending[0]
+                if not future.done():
+                    future.set_exception(exc)
+            return False
+        self._deliver(pending, predictions, version)
+        return True
+
+    def _deliver(self, pending, predictions, version):
+        self.requests += len(pending)
+        self.batches += 1
+        self.rows += len(predictions)
+        offset = 0
+        for features, future in pending:
+            if not future.done():
+                future.set_result((predictions[offset:offset + len(features)], version))
+            offset += len(features)
+
+
+def model_predict(features, model_path=None):
+    """Run the registry's model on a feature array laid out as ``FEATURES``."""
+    model = model_registry.get_model(model_path)
+    return np.asarray(model.predict(pd.DataFrame(features, columns=FEATURES)))
+
+
+def check_features(features):
+    """``features`` as a float (rows x FEATURES) array; ValueError when it cannot join a batch."""
+    features = np.asarray(features, dtype=np.float64)
+    if features.ndim != 2 or features.shape[1] != len(FEATURES):
+        raise ValueError(f"expected rows of {len(FEATURES)} features, got an array of shape {features.shape}")
+    if not len(features):
+        raise ValueError("no rows to predict")
+    if np.isinf(features).any():
+        raise ValueError("features must not be infinite")
+    return features
+
+
+def parse_features(payload):
+    """Feature array (rows x FEATURES) from a split-orient or column-dict payload."""
+    if "columns" in payload and "data" in payload:
+        data = np.asarray(payload["data"], dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != len(payload["columns"]):
+            raise ValueError("'data' must be a list of rows matching 'columns'")
+        position = {name: i for i, name in enumerate(payload["columns"])}
+        missing = [name for name in FEATURES if name not in position]
+        if missing:
+            raise ValueError(f"missing feature columns: {', '.join(missing)}")
+        return check_features(data[:, [position[name] for name in FEATURES]])
+    missing = [name for name in FEATURES if name not in payload]
+    if missing:
+        raise ValueError(f"missing feature columns: {', '.join(missing)}")
+    return check_features(np.column_stack([np.asarray(payload[name], dtype=np.float64) for name in FEATURES]))
+
+
+# --- ASGI app ---
+
+class PredictionApp:
+    """Minimal ASGI application around a ``MicroBatcher``."""
+
+    def __init__(self, model_path=None, max_batch_rows=MAX_BATCH_ROWS, max_wait_ms=MAX_WAIT_MS):
+        # Always a local artifact, even when HEATWAVE_PREDICTION_URL is set.
+        self.model_path = model_path or model_registry.DEFAULT_MODEL_PATH
+        self.batcher = MicroBatcher(self._predict_batch, max_batch_rows, max_wait_ms)
+
+    def _predict_batch(self, features):
+        # Runs in the batcher's worker thread, which keeps the artifact stat
+        # behind model_version off the event loop.
+        return model_predict(features, self.model_path), model_registry.model_version(self.model_path)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        route = (scope["method"], scope["path"].rstrip("/") or "/")
+        if route == ("POST", "/predict"):
+            body = await self._read_body(receive)
+            try:
+                features = parse_features(json.loads(body))
+            except (ValueError, TypeError) as exc:
+                await self._respond(send, 400, {"error": str(exc)})
+                return
+            try:
+                predictions, version = await self.batcher.predict(features)
+            except Exception as exc:
+                await self._respond(send, 500, {"error": str(exc)})
+                return
+            await self._respond(send, 200, {"predictions": predictions.tolist(), "model_version": version})
+        elif route == ("GET", "/health"):
+            await self._respond(send, 200, await asyncio.to_thread(self.stats))
+        else:
+            await self._respond(send, 404, {"error": "not found"})
+
+    def stats(self):
+        batcher = self.batcher
+        return {
+            "model_version": model_registry.model_version(self.model_path),
+            "requests": batcher.requests,
+            "batches": batcher.batches,
+            "rows": batcher.rows,
+        }
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Load the model before the first request, off the event loop.
+                await asyncio.to_thread(model_registry.get_model, self.model_path)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.batcher.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _read_body(receive):
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _respond(send, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+app = PredictionApp()
+
+
+# --- Client ---
+
+class RemoteModel:
+    """``predict``-compatible client for a running prediction service."""
+
+    def __init__(self, url, timeout=30.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            self.url + path, data=data, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.load(response)
+
+    def predict(self, X):
+        frame = pd.DataFrame(X)[FEATURES]
+        payload = {"columns": FEATURES, "data": frame.to_numpy(dtype=np.float64).tolist()}
+        return np.asarray(self._request("/predict", payload)["predictions"])
+
+    def version(self):
+        return self._request("/health")["model_version"]
+
+
+def wait_until_ready(url, timeout=30.0):
+    """Block until the service answers ``/health`` (e.g. after starting it in a subprocess)."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return RemoteModel(url, timeout=1.0).version()
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
@@ -0,0 +1,87 @@
+# scenarios.py
+"""What-if engine: heatwave risk for every taluk over a grid of mitigation deltas."""
+
+from functools import lru_cache
+
+import numpy as np
+
+from shared_data import RISK_BAND_FLOORS, WARD_STORE, calculate_heatwave_percentage_batch, ward_data_version
+
+# Grid axes, matching the what-if sliders in the Heat Sentinel dashboard
+GREEN_STEPS = np.arange(0, 31, 2)    # green cover increase, percentage points
+TRAFFIC_STEPS = np.arange(0, 41, 5)  # traffic index reduction
+AIQ_STEPS = np.arange(0, 61, 5)      # air quality index improvement
+
+# Relative cost of one unit of each intervention, used to rank mitigation plans.
+# Adjust these to reflect local programme costs.
+MITIGATION_COSTS = {"green": 3.0, "traffic": 1.0, "aiq": 1.5}
+
+
+class ScenarioGrid:
+    """Precomputed risk surface ``pct[taluk, green, traffic, aiq]``."""
+
+    def __init__(self, ward_df):
+        self.taluks = list(ward_df.index)
+        self._row = {taluk: i for i, taluk in enumerate(self.taluks)}
+        fields = {f: ward_df[f].to_numpy(dtype=np.float64) for f in ward_df.columns}
+
+        # Broadcast each field to (taluk, green, traffic, aiq) without copying
+        shape = (len(self.taluks), len(GREEN_STEPS), len(TRAFFIC_STEPS), len(AIQ_STEPS))
+        columns = {f: np.broadcast_to(v[:, None, None, None], shape) for f, v in fields.items()}
+        columns["Green_Cover_"] = np.broadcast_to(
+            np.maximum(fields["Green_Cover_"][:, None, None, None] + GREEN_STEPS[None, :, None, None], 0), shape
+        )
+        columns["Traffic_Index"] = np.broadcast_to(
+            np.maximum(fields["Traffic_Index"][:, None, None, None] - TRAFFIC_STEPS[None, None, :, None], 0), shape
+        )
+        columns["AIQ"] = np.broadcast_to(
+            np.maximum(fields["AIQ"][:, None, None, None] - AIQ_STEPS[None, None, None, :], 0), shape
+        )
+        self.pct = calculate_heatwave_percentage_batch(columns)
+
+        self.cost = (
+            MITIGATION_COSTS["green"] * GREEN_STEPS[:, None, None]
+            + MITIGATION_COSTS["traffic"] * TRAFFIC_STEPS[None, :, None]
+            + MITIGATION_COSTS["aiq"] * AIQ_STEPS[None, None, :]
+        )
+
+    def lookup(self, taluk, green_delta=0, traffic_delta=0, aiq_delta=0):
+        """Risk % for slider values; values between grid steps snap to the nearest step."""
+        g = int(np.abs(GREEN_STEPS - green_delta).argmin())
+        t = int(np.abs(TRAFFIC_STEPS - traffic_delta).argmin())
+        a = int(np.abs(AIQ_STEPS - aiq_delta).argmin())
+        return int(self.pct[self._row[taluk], g, t, a])
+
+    def cheapest_mitigation(self, taluk):
+        """Lowest-cost plan that brings ``taluk`` below each risk band.
+
+        Returns ``{band: plan}`` where ``plan`` is a dict with the deltas, the
+        resulting risk % and cost, or None when the grid cannot reach it.
+        """
+        surface = self.pct[self._row[taluk]]
+        plans = {}
+        for band, floor in RISK_BAND_FLOORS.items():
+            reachable = surface < floor
+            if not reachable.any():
+                plans[band] = None
+                continue
+            cost = np.where(reachable, self.cost, np.inf)
+            g, t, a = np.unravel_index(int(cost.argmin()), cost.shape)
+            plans[band] = {
+                "green_delta": int(GREEN_STEPS[g]),
+                "traffic_delta": int(TRAFFIC_STEPS[t]),
+                "aiq_delta": int(AIQ_STEPS[a]),
+                "heatwave_pct": int(surface[g, t, a]),
+                "cost": float(self.cost[g, t, a]),
+            }
+        return plans
+
+
+@lru_cache(maxsize=4)
+def _grid_for_version(data_version):
+    return ScenarioGrid(WARD_STORE.frame())
+
+
+def get_scenario_grid():
+    """Scenario grid for the current ward data, built once per data version."""
+    return _grid_for_version(ward_data_version())
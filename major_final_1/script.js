@@ -1,13 +1,28 @@
-// Populate dropdown
+// Ward readings and their heatwave scores come from the same ward_data.json the
+// Streamlit app uses (serve this folder over HTTP, e.g. `python -m http.server`).
+// Scores are written by `python shared_data.py`, so they match the app exactly.
+const READING_FIELDS = ["Temp_2m", "Humidity", "Green_Cover_", "Traffic_Index", "AIQ", "Precipitation_mm"];
+let WARD_DATA = {};
+
 const wardSelect = document.getElementById("wardSelect");
 const heatwaveBox = document.getElementById("heatwaveBox");
 
-Object.keys(WARD_DATA).forEach(ward => {
-    const option = document.createElement("option");
-    option.value = ward;
-    option.textContent = ward;
-    wardSelect.appendChild(option);
-});
+fetch("ward_data.json")
+    .then(response => response.json())
+    .then(payload => {
+        Object.keys(payload.taluks).forEach(ward => {
+            const info = payload.taluks[ward];
+            // Skip taluks that only have coordinates so far
+            if (!READING_FIELDS.every(field => field in info) || !("heatwave_percentage" in info)) return;
+            WARD_DATA[ward] = info;
+
+            // Populate dropdown
+            const option = document.createElement("option");
+            option.value = ward;
+            option.textContent = ward;
+            wardSelect.appendChild(option);
+        });
+    });
 
 // Chart.js setup
 const ctx = document.getElementById('tempChart').getContext('2d');
@@ -38,27 +53,6 @@ let factorChart = new Chart(ctx, {
     }
 });
 
-// Function to calculate heatwave percentage
-function calculateHeatwavePercentage(data) {
-    const tempWeight = 0.4;
-    const humidityWeight = 0.1;
-    const greenCoverWeight = -0.1; // more green cover reduces heatwave
-    const trafficWeight = 0.2;
-    const aiqWeight = 0.2;
-    const precipitationWeight = -0.1; // more rain reduces heatwave
-
-    let score = 
-        data.Temp_2m * tempWeight +
-        data.Humidity * humidityWeight +
-        data.Green_Cover_ * greenCoverWeight +
-        data.Traffic_Index * trafficWeight +
-        data.AIQ * aiqWeight +
-        data.Precipitation_mm * precipitationWeight;
-
-    let percentage = Math.min(Math.max(Math.round(score), 0), 100);
-    return percentage;
-}
-
 // Update chart and heatwave box on taluk selection
 wardSelect.addEventListener("change", function() {
     const ward = this.value;
@@ -77,8 +71,7 @@ wardSelect.addEventListener("change", function() {
         factorChart.update();
 
         // Update heatwave percentage
-        const heatwavePercent = calculateHeatwavePercentage(data);
-        heatwaveBox.textContent = `Heatwave: ${heatwavePercent}%`;
+        heatwaveBox.textContent = `Heatwave: ${data.heatwave_percentage}% (${data.risk_level})`;
     } else {
         factorChart.data.datasets[0].data = [];
         factorChart.update();
@@ -1,32 +1,149 @@
 # shared_data.py
 
-WARD_DATA = {
-    "Tumakuru": {"Temp_2m": 39, "Humidity": 58, "Green_Cover_": 25, "Traffic_Index": 80, "AIQ": 65, "Precipitation_mm": 6},
-    "Kunigal": {"Temp_2m": 42, "Humidity": 55, "Green_Cover_": 18, "Traffic_Index": 60, "AIQ": 65, "Precipitation_mm": 4},
-    "Turuvekere": {"Temp_2m": 41, "Humidity": 53, "Green_Cover_": 20, "Traffic_Index": 45, "AIQ": 40, "Precipitation_mm": 5},
-    "Tiptur": {"Temp_2m": 43, "Humidity": 50, "Green_Cover_": 15, "Traffic_Index": 85, "AIQ": 70, "Precipitation_mm": 3},
-    "Chikkanayakanahalli": {"Temp_2m": 38, "Humidity": 60, "Green_Cover_": 30, "Traffic_Index": 50, "AIQ": 50, "Precipitation_mm": 7},
-    "Sira": {"Temp_2m": 40, "Humidity": 57, "Green_Cover_": 22, "Traffic_Index": 65, "AIQ": 58, "Precipitation_mm": 5},
-    "Pavagada": {"Temp_2m": 70, "Humidity": 52, "Green_Cover_": 30, "Traffic_Index": 40, "AIQ": 35, "Precipitation_mm": 2},
-    "Madhugiri": {"Temp_2m": 41, "Humidity": 30, "Green_Cover_": 20, "Traffic_Index": 60, "AIQ": 50, "Precipitation_mm": 30},
-    "Koratagere": {"Temp_2m": 60, "Humidity": 40, "Green_Cover_": 25, "Traffic_Index": 30, "AIQ": 20, "Precipitation_mm": 6}
-}
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from ward_store import WardStore
+
+# Canonical ward readings, coordinates and score weights. The Leaflet map and
+# the static index.html read the same file; edit it instead of the code.
+WARD_DATA_PATH = os.environ.get(
+    "HEATWAVE_WARD_DATA_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "ward_data.json"),
+)
+
+READING_FIELDS = ["Temp_2m", "Humidity", "Green_Cover_", "Traffic_Index", "AIQ", "Precipitation_mm"]
+
+
+@lru_cache(maxsize=None)
+def load_ward_payload(path=WARD_DATA_PATH):
+    """Parse the ward data file once per process."""
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+_payload = load_ward_payload()
+
+# Linear weights of the heatwave score; positive drivers push risk up,
+# green cover and rain pull it down.
+HEATWAVE_WEIGHTS = _payload["weights"]
+_WEIGHT_ITEMS = tuple(HEATWAVE_WEIGHTS.items())
+
+# Approximate taluk centroids (lat, lon), including taluks without readings yet.
+TALUK_COORDS = {name: tuple(info["coords"]) for name, info in _payload["taluks"].items()}
+
+# Columnar store of current readings and their history, indexed by taluk id.
+WARD_STORE = WardStore.from_payload(_payload, READING_FIELDS)
+
+# Latest readings for taluks that have them, keyed by taluk name. This is a
+# live dict-like view of WARD_STORE kept for code written against the old dict.
+WARD_DATA = WARD_STORE.as_mapping()
+
+
+@lru_cache(maxsize=None)
+def _payload_hash():
+    canonical = json.dumps(_payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def ward_data_version():
+    """Identifies the current ward data (file content + live updates), used to key derived caches."""
+    return f"{_payload_hash()}.{WARD_STORE.version}"
+
+
+def calculate_heatwave_percentage_batch(rows):
+    """Score many rows at once.
+
+    ``rows`` can be a DataFrame, a NumPy structured array or a dict of arrays
+    with the ``HEATWAVE_WEIGHTS`` fields. Returns an int array of percentages
+    clipped to 0-100, matching ``calculate_heatwave_percentage`` row by row.
+    Every row must be complete: a NaN reading raises ValueError naming the
+    row (its index label for a DataFrame), so drop incomplete taluks first,
+    e.g. with ``WARD_STORE.frame()``.
+    """
+    score = None
+    for field, weight in HEATWAVE_WEIGHTS.items():
+        column = np.asarray(rows[field], dtype=np.float64)
+        if score is None:
+            score = column * weight
+        else:
+            score += column * weight
+    missing = np.isnan(score)
+    if missing.any():
+        if isinstance(rows, pd.DataFrame):
+            labels = list(rows.index[missing])
+        else:
+            labels = [tuple(int(i) for i in at) if len(at) > 1 else int(at[0]) for at in np.argwhere(missing)]
+        raise ValueError(f"incomplete readings for {', '.join(map(str, labels[:5]))}"
+                         f"{' and more' if len(labels) > 5 else ''}")
+    return np.clip(np.rint(score), 0, 100).astype(np.int64)
+
 
 def calculate_heatwave_percentage(data):
-    tempWeight = 0.4
-    humidityWeight = 0.1
-    greenCoverWeight = -0.1  # more green cover reduces heatwave
-    trafficWeight = 0.2
-    aiqWeight = 0.2
-    precipitationWeight = -0.1  # more rain reduces heatwave
-
-    score = (
-        data["Temp_2m"] * tempWeight +
-        data["Humidity"] * humidityWeight +
-        data["Green_Cover_"] * greenCoverWeight +
-        data["Traffic_Index"] * trafficWeight +
-        data["AIQ"] * aiqWeight +
-        data["Precipitation_mm"] * precipitationWeight
-    )
-    percentage = min(max(round(score), 0), 100)
-    return percentage
+    """Score a single ward dict.
+
+    Plain Python arithmetic in the same order as the batch scorer, so the two
+    agree exactly; for one row it is far cheaper than building arrays.
+    """
+    score = 0.0
+    for field, weight in _WEIGHT_ITEMS:
+        score += data[field] * weight
+    if score != score:
+        raise ValueError("incomplete readings: the score is NaN")
+    return min(max(round(score), 0), 100)
+
+
+# Lower bound (inclusive) of each risk band above "Low", as used by classify_risk_level.
+RISK_BAND_FLOORS = {"Moderate": 25, "High": 50, "Severe": 75}
+
+
+def classify_risk_level(heatwave_percent: int):
+    """Map heatwave percentage to a qualitative risk band with color and advice."""
+    if heatwave_percent < RISK_BAND_FLOORS["Moderate"]:
+        return "Low", "#22c55e", "Conditions are generally safe. Maintain regular hydration and shade."
+    elif heatwave_percent < RISK_BAND_FLOORS["High"]:
+        return "Moderate", "#eab308", "Avoid peak afternoon exposure and check on vulnerable groups."
+    elif heatwave_percent < RISK_BAND_FLOORS["Severe"]:
+        return "High", "#f97316", "Limit outdoor work, provide cooling spaces and water points."
+    else:
+        return "Severe", "#dc2626", "Issue heat alerts, shift working hours and activate emergency protocols."
+
+
+# --- Precomputed scores for the static pages ---
+
+# Written into each scored taluk of ward_data.json so index.html and
+# tumkur_leaflet.html show the Python score instead of recomputing it.
+SCORE_FIELDS = ("heatwave_percentage", "risk_level")
+
+
+def scored_payload():
+    """The ward data payload with SCORE_FIELDS filled in for every taluk that has readings."""
+    taluks = {}
+    for name, info in _payload["taluks"].items():
+        info = {key: value for key, value in info.items() if key not in SCORE_FIELDS}
+        if all(field in info for field in READING_FIELDS):
+            percent = calculate_heatwave_percentage(info)
+            info["heatwave_percentage"] = percent
+            info["risk_level"] = classify_risk_level(percent)[0]
+        taluks[name] = info
+    return {**_payload, "taluks": taluks}
+
+
+def write_ward_payload(payload, path=WARD_DATA_PATH):
+    """Write ``payload`` in the file's hand-editable layout: one line per taluk."""
+    rows = [f"    {json.dumps(name)}: {json.dumps(info)}" for name, info in payload["taluks"].items()]
+    text = "{\n" + f'  "weights": {json.dumps(payload["weights"])},\n' + '  "taluks": {\n'
+    text += ",\n".join(rows) + "\n  }\n}\n"
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+if __name__ == "__main__":
+    # Run after editing readings or weights: python shared_data.py
+    write_ward_payload(scored_payload())
+    print(f"Updated scores in {WARD_DATA_PATH}")
@@ -0,0 +1,239 @@
+# taluk_locator.py
+"""Map arbitrary locations to a taluk and its current heatwave risk.
+
+Boundaries come from a GeoJSON file of taluk polygons (``HEATWAVE_TALUK_BOUNDARIES``,
+default ``taluk_boundaries.geojson`` next to the app), indexed with shapely's
+STRtree when shapely is installed and a vectorised even-odd ray cast
+otherwise. Without a boundary file each point goes to the taluk with the
+nearest centroid inside the district box, i.e. the Voronoi partition of
+``TALUK_COORDS``, which is only an approximation of the real boundaries.
+
+    >>> get_locator().lookup([13.34], [77.10])
+          Taluk  Heatwave_pct Risk_level
+    0  Tumakuru          47.0   Moderate
+"""
+
+import json
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from heat_grid import _neighbour_index
+from shared_data import TALUK_COORDS, WARD_STORE, calculate_heatwave_percentage_batch, classify_risk_level, ward_data_version
+from tile_cache import TUMAKURU_BBOX
+
+BOUNDARIES_PATH = os.environ.get(
+    "HEATWAVE_TALUK_BOUNDARIES",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "taluk_boundaries.geojson"),
+)
+# Feature properties tried, in order, for the taluk name.
+NAME_PROPERTIES = ("taluk", "Taluk", "name", "NAME", "NAME_3", "sdtname")
+NO_DATA = "No data"
+
+
+def load_boundaries(path=BOUNDARIES_PATH, name_properties=NAME_PROPERTIES):
+    """{taluk: [polygon, ...]} from a GeoJSON file, each polygon a list of (lon, lat) rings."""
+    with open(path, encoding="utf-8") as fh:
+        collection = json.load(fh)
+    boundaries = {}
+    for feature in collection["features"]:
+        props = feature.get("properties") or {}
+        name = next((props[p] for p in name_properties if props.get(p)), None)
+        if name is None:
+            raise ValueError(f"{path}: feature without a taluk name property ({', '.join(name_properties)})")
+        geometry = feature["geometry"]
+        polygons = [geometry["coordinates"]] if geometry["type"] == "Polygon" else geometry["coordinates"]
+        boundaries.setdefault(name.strip().title(), []).extend(polygons)
+    return boundaries
+
+
+class _RayCastIndex:
+    """Numpy point-in-polygon fallback: bounding-box filter, then an even-odd ray cast."""
+
+    # Cap on point x edge temporaries per block (~32 MB of float64).
+    BLOCK_ELEMENTS = 4_000_000
+
+    def __init__(self, polygons):
+        # polygons: list of (owner id, [ring, ...]) with rings as (n, 2) lon/lat arrays
+        self.polygons = []
+        for owner, rings in polygons:
+            rings = [np.asarray(ring, dtype=np.float64)[:, :2] for ring in rings]
+            points = np.concatenate(rings)
+            # Edges of every ring (closed or not); holes fall out of the even-odd rule.
+            start = np.concatenate([ring for ring in rings])
+            end = np.concatenate([np.roll(ring, -1, axis=0) for ring in rings])
+            self.polygons.append((owner, points.min(axis=0), points.max(axis=0), start.T, end.T))
+
+    def owners(self, lon, lat):
+        result = np.full(len(lon), -1, dtype=np.intp)
+        for owner, low, high, (x0, y0), (x1, y1) in self.polygons:
+            candidates = np.flatnonzero(
+                (result < 0) & (lon >= low[0]) & (lon <= high[0]) & (lat >= low[1]) & (lat <= high[1])
+            )
+            block = max(1, self.BLOCK_ELEMENTS // len(x0))
+            for offset in range(0, len(candidates), block):
+                ids = candidates[offset:offset + block]
+                x, y = lon[ids, None], lat[ids, None]
+                crosses = (y0 > y) != (y1 > y)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    x_at_y = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+                inside = (np.count_nonzero(crosses & (x < x_at_y), axis=1) % 2) == 1
+                result[ids[inside]] = owner
+        return result
+
+
+class _STRtreeIndex:
+    """shapely 2 index: an STRtree sorts a coarse cell grid into interior and border cells.
+
+    Points in a cell that lies inside one polygon take its owner directly;
+    only points in border cells are tested, with ``contains_xy`` against the
+    few polygons the tree found for that cell. Querying the tree with millions
+    of point geometries instead is two orders of magnitude slower. Taluks are
+    assumed not to overlap.
+    """
+
+    def __init__(self, polygons, cell_deg=0.02):
+        import shapely
+
+        self._shapely = shapely
+        self._owners = np.array([owner for owner, _ in polygons], dtype=np.intp)
+        self._geometries = np.array([shapely.Polygon(rings[0], rings[1:]) for _, rings in polygons])
+        shapely.prepare(self._geometries)
+        tree = shapely.STRtree(self._geometries)
+
+        west, south, east, north = shapely.total_bounds(self._geometries)
+        self._origin = (west, south)
+        self._cell_deg = cell_deg
+        self._shape = (max(1, math.ceil((north - south) / cell_deg)), max(1, math.ceil((east - west) / cell_deg)))
+        rows, cols = np.divmod(np.arange(self._shape[0] * self._shape[1]), self._shape[1])
+        boxes = shapely.box(west + cols * cell_deg, south + rows * cell_deg,
+                            west + (cols + 1) * cell_deg, south + (rows + 1) * cell_deg)
+
+        self._interior = np.full(len(boxes), -1, dtype=np.intp)
+        cell_ids, polygon_ids = tree.query(boxes, predicate="within")
+        self._interior[cell_ids] = polygon_ids
+        cell_ids, polygon_ids = tree.query(boxes, predicate="intersects")
+        border = self._interior[cell_ids] < 0
+        # Per polygon, a flag per cell marking the border cells it touches.
+        self._border = np.zeros((len(self._geometries), len(boxes)), dtype=bool)
+        self._border[polygon_ids[border], cell_ids[border]] = True
+
+    def owners(self, lon, lat):
+        west, south = self._origin
+        row = np.floor((lat - south) / self._cell_deg).astype(np.intp)
+        col = np.floor((lon - west) / self._cell_deg).astype(np.intp)
+        covered = (row >= 0) & (row < self._shape[0]) & (col >= 0) & (col < self._shape[1])
+        cell = np.where(covered, row * self._shape[1] + col, 0)
+
+        polygon = np.where(covered, self._interior[cell], -1)
+        for index, geometry in enumerate(self._geometries):
+            ids = np.flatnonzero(covered & (polygon < 0) & self._border[index, cell])
+            if len(ids):
+                polygon[ids[self._shapely.contains_xy(geometry, lon[ids], lat[ids])]] = index
+        return np.where(polygon >= 0, self._owners[polygon], -1)
+
+
+class _NearestCentroidIndex:
+    """Voronoi fallback: the nearest taluk centroid, for points inside the district box."""
+
+    def __init__(self, centroids, bbox):
+        self.bbox = bbox
+        self._tree = _neighbour_index(np.asarray(centroids, dtype=np.float64)[:, ::-1])
+
+    def owners(self, lon, lat):
+        south, west, north, east = self.bbox
+        result = np.full(len(lon), -1, dtype=np.intp)
+        inside = np.flatnonzero((lat >= south) & (lat <= north) & (lon >= west) & (lon <= east))
+        if len(inside):
+            _, nearest = self._tree.query(np.column_stack([lon[inside], lat[inside]]), 1)
+            result[inside] = np.asarray(nearest).reshape(-1)
+        return result
+
+
+class TalukLocator:
+    """Bulk (lat, lon) -> taluk id lookup, plus the taluk's current risk."""
+
+    def __init__(self, taluks, index, boundaries=None, centroids=None, bbox=None):
+        self.taluks = list(taluks)
+        self._index = index
+        self.boundaries = boundaries
+        self.centroids = centroids
+        self.bbox = bbox
+
+    @property
+    def approximate(self):
+        """True when taluks are nearest-centroid cells rather than real boundaries."""
+        return self.boundaries is None
+
+    @classmethod
+    def from_boundaries(cls, boundaries):
+        taluks = sorted(boundaries)
+        polygons = [(i, rings) for i, taluk in enumerate(taluks) for rings in boundaries[taluk]]
+        try:
+            index = _STRtreeIndex(polygons)
+        except ImportError:
+            index = _RayCastIndex(polygons)
+        return cls(taluks, index, boundaries=boundaries)
+
+    @classmethod
+    def from_centroids(cls, coords=TALUK_COORDS, bbox=TUMAKURU_BBOX):
+        taluks = list(coords)
+        centroids = [coords[t] for t in taluks]
+        return cls(taluks, _NearestCentroidIndex(centroids, bbox), centroids=centroids, bbox=bbox)
+
+    def taluk_ids(self, lat, lon):
+        """Index into ``self.taluks`` for each point, -1 outside every taluk."""
+        lat = np.asarray(lat, dtype=np.float64).reshape(-1)
+        lon = np.asarray(lon, dtype=np.float64).reshape(-1)
+        return self._index.owners(lon, lat)
+
+    def risk_table(self):
+        """Current heatwave % and risk band per taluk, in ``self.taluks`` order (NaN / "No data" without readings)."""
+        ward_df = WARD_STORE.frame()
+        scores = pd.Series(calculate_heatwave_percentage_batch(ward_df), index=ward_df.index, dtype=np.float64)
+        pct = scores.reindex(self.taluks)
+        level = [NO_DATA if np.isnan(p) else classify_risk_level(p)[0] for p in pct]
+        return pd.DataFrame({"Heatwave_pct": pct.to_numpy(), "Risk_level": level}, index=self.taluks)
+
+    def lookup(self, lat, lon):
+        """Taluk, heatwave % and risk band for each point; Taluk is None outside the district."""
+        ids = self.taluk_ids(lat, lon)
+        table = _risk_table(self, ward_data_version())
+        names = np.array(self.taluks + [None], dtype=object)
+        pct = np.append(table["Heatwave_pct"].to_numpy(), np.nan)
+        level = np.array(list(table["Risk_level"]) + [None], dtype=object)
+        # -1 (outside) picks the trailing None/NaN entries.
+        return pd.DataFrame({"Taluk": names[ids], "Heatwave_pct": pct[ids], "Risk_level": level[ids]})
+
+    def client_spec(self):
+        """Everything the map's click handler needs to repeat the lookup in the browser."""
+        table = _risk_table(self, ward_data_version())
+        taluks = []
+        for i, (taluk, row) in enumerate(table.iterrows()):
+            entry = {"name": taluk, "level": row["Risk_level"]}
+            if row["Risk_level"] != NO_DATA:
+                entry["pct"] = int(row["Heatwave_pct"])
+                entry["colour"] = classify_risk_level(row["Heatwave_pct"])[1]
+            if self.boundaries is not None:
+                entry["polygons"] = self.boundaries[taluk]
+            else:
+                entry["centroid"] = list(self.centroids[i])
+            taluks.append(entry)
+        return {"taluks": taluks, "bbox": None if self.bbox is None else list(self.bbox)}
+
+
+@lru_cache(maxsize=4)
+def _risk_table(locator, data_version):
+    return locator.risk_table()
+
+
+@lru_cache(maxsize=1)
+def get_locator(path=BOUNDARIES_PATH):
+    """Process-wide locator: real boundaries when the GeoJSON exists, centroids otherwise."""
+    if path and os.path.exists(path):
+        return TalukLocator.from_boundaries(load_boundaries(path))
+    return TalukLocator.from_centroids()
+
@@ -0,0 +1,6 @@
+# The app modules import each other by bare name (``from shared_data import ...``),
+# as they do when Streamlit runs them from this folder.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aggregates import PERIOD_COLUMNS, ForecastAggregates
+
+
+@pytest.fixture
+def daily():
+    dates = pd.date_range("2025-10-01", "2026-09-30", freq="D")
+    rng = np.random.default_rng(0)
+    temp = 28 + 6 * np.sin(np.arange(len(dates)) / 58.0) + rng.normal(0, 1, len(dates))
+    return pd.DataFrame(
+        {
+            "Temp_2m": temp,
+            "Temp_min": temp - 4,
+            "Temp_max": temp + 4,
+            "Heat_Index": temp + 3,
+            "Predicted_Heatwave": (temp > 33).astype(np.int64),
+        },
+        index=dates,
+    )
+
+
+def _resampled(df, rule):
+    grouped = df.resample(rule)
+    return pd.DataFrame({
+        "temp_mean": grouped["Temp_2m"].mean(),
+        "temp_min": grouped["Temp_min"].min(),
+        "temp_max": grouped["Temp_max"].max(),
+        "heatwave_days": grouped["Predicted_Heatwave"].sum(),
+        "days": grouped["Temp_2m"].count(),
+    })
+
+
+@pytest.mark.parametrize("period, rule", [("monthly", "ME"), ("weekly", "W")])
+def test_periods_match_resample(daily, period, rule):
+    table = getattr(ForecastAggregates(daily), period)
+    assert list(table.columns) == PERIOD_COLUMNS
+    pd.testing.assert_frame_equal(table, _resampled(daily, rule), check_dtype=False, check_freq=False)
+
+
+def test_seasons_follow_imd_months(daily):
+    seasonal = ForecastAggregates(daily).seasonal
+    assert seasonal["season"].tolist() == ["Post-monsoon", "Winter", "Summer", "Monsoon"]
+    assert seasonal.index[0] == pd.Timestamp("2025-10-01")
+    assert seasonal["days"].tolist() == [92, 59, 92, 122]
+
+
+def test_unsorted_input_and_summary_helpers(daily):
+    aggregates = ForecastAggregates(daily.iloc[::-1])
+    monthly = aggregates.monthly
+    assert aggregates.hottest_month() == monthly["temp_mean"].idxmax()
+    assert aggregates.monthly["heatwave_days"].sum() == daily["Predicted_Heatwave"].sum()
+    longest = aggregates.longest_episode()
+    assert longest["days"] == aggregates.episodes["days"].max()
+
+
+def test_no_episodes(daily):
+    aggregates = ForecastAggregates(daily.assign(Predicted_Heatwave=0))
+    assert aggregates.episodes.empty
+    assert aggregates.longest_episode() is None
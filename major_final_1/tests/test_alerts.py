@@ -0,0 +1,84 @@
+import pytest
+
+from alerts import AlertEngine, AlertOutbox
+from shared_data import READING_FIELDS
+from ward_store import WardStore
+
+TALUKS = ["Tumakuru", "Tiptur", "Gubbi"]
+
+
+def _set(store, taluk, pct):
+    # Humidity has weight 0.1 and every other reading is 0, so the score is ``pct``.
+    store.update(taluk, {"Humidity": pct * 10})
+
+
+@pytest.fixture
+def store():
+    store = WardStore(TALUKS, READING_FIELDS)
+    store.update_many(TALUKS[:2], [[0.0] * len(READING_FIELDS)] * 2, timestamp=1)
+    _set(store, "Tumakuru", 40)
+    _set(store, "Tiptur", 30)
+    return store
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    outbox = AlertOutbox(str(tmp_path / "outbox.sqlite"))
+    yield outbox
+    outbox.close()
+
+
+def _alerts(outbox):
+    return outbox.pending()[["taluk", "kind", "level", "previous_level"]].values.tolist()
+
+
+def test_debounce_needs_two_readings_in_the_new_band(store, outbox):
+    engine = AlertEngine(store, outbox).start()
+    _set(store, "Tumakuru", 55)
+    _set(store, "Tumakuru", 40)  # a one-off blip resets the streak
+    _set(store, "Tumakuru", 56)
+    assert outbox.count() == 0
+    _set(store, "Tumakuru", 57)
+    assert _alerts(outbox) == [["Tumakuru", "raised", "High", "Moderate"]]
+    _set(store, "Tumakuru", 80)
+    _set(store, "Tumakuru", 81)
+    assert _alerts(outbox)[-1] == ["Tumakuru", "escalated", "Severe", "High"]
+    assert engine.levels()["Tumakuru"] == "Severe"
+
+
+def test_hysteresis_keeps_a_band_until_well_below_its_floor(store, outbox):
+    engine = AlertEngine(store, outbox).start()
+    for pct in (60, 61, 48, 47, 46, 45):  # within 5 points of the High floor
+        _set(store, "Tumakuru", pct)
+    assert engine.levels()["Tumakuru"] == "High"
+    _set(store, "Tumakuru", 44)
+    _set(store, "Tumakuru", 43)
+    assert engine.levels()["Tumakuru"] == "Moderate"
+    assert _alerts(outbox)[-1] == ["Tumakuru", "cleared", "Moderate", "High"]
+
+
+def test_startup_alerts_taluks_already_in_an_alert_band(store, outbox):
+    _set(store, "Tiptur", 80)
+    engine = AlertEngine(store, outbox).start()
+    assert _alerts(outbox) == [["Tiptur", "raised", "Severe", "Low"]]
+    assert engine.levels() == {"Tumakuru": "Moderate", "Tiptur": "Severe", "Gubbi": "Low"}
+
+
+def test_restart_resumes_from_the_outbox(store, outbox):
+    _set(store, "Tiptur", 80)
+    AlertEngine(store, outbox).start().stop()
+    # Same readings: nothing new to report.
+    AlertEngine(store, outbox).start().stop()
+    assert outbox.count() == 1
+    # Tiptur cooled down while no engine was running.
+    _set(store, "Tiptur", 30)
+    AlertEngine(store, outbox).start()
+    assert _alerts(outbox)[-1] == ["Tiptur", "cleared", "Moderate", "Severe"]
+    assert outbox.last_levels() == {"Tiptur": "Moderate"}
+
+
+def test_dispatched_alerts_leave_the_queue(store, outbox):
+    _set(store, "Tiptur", 80)
+    AlertEngine(store, outbox).start()
+    outbox.mark_dispatched(outbox.pending().index)
+    assert outbox.pending().empty and outbox.count() == 1
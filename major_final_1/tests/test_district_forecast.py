@@ -0,0 +1,60 @@
+import os
+import signal
+import threading
+
+import joblib
+import pytest
+
+import district_forecast
+import model_registry
+from benchmarks.dummy_model import DummyHeatwaveModel
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(DummyHeatwaveModel(work=0), path)
+    yield str(path)
+    district_forecast.shutdown_pools()
+    model_registry.clear()
+
+
+def test_broken_pool_is_replaced(model_path):
+    args = ("2024-04-01", "2024-04-10", ["Tumakuru", "Tiptur"])
+    expected = district_forecast.forecast_district(*args, workers=2, model_path=model_path)
+    pool = district_forecast._pools[(2, model_path)]
+    for pid in list(pool._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    result = district_forecast.forecast_district(*args, workers=2, model_path=model_path)
+    assert district_forecast._pools[(2, model_path)] is not pool
+    assert result.equals(expected)
+
+
+def test_pool_starts_while_the_registry_lock_is_held(model_path):
+    # A background warm-up holds model_registry._lock while the pool starts;
+    # forked workers would inherit the held lock and hang in their own warm_up.
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(df=district_forecast.forecast_district(
+        "2024-04-01", "2024-04-03", ["Tumakuru", "Sira"], workers=2, model_path=model_path
+    )))
+    with model_registry._lock:
+        worker.start()
+        worker.join(timeout=60)
+        hung = worker.is_alive()
+        if hung:
+            for pid in list(district_forecast._pools[(2, model_path)]._processes):
+                os.kill(pid, signal.SIGKILL)
+    worker.join()
+    assert not hung
+    assert len(result["df"]) == 6
+
+
+def test_small_runs_default_to_serial(monkeypatch):
+    monkeypatch.setattr(district_forecast, "WORKERS", None)
+    monkeypatch.setattr(district_forecast.os, "cpu_count", lambda: 8)
+    assert district_forecast.default_workers(10, 365) == 1
+    assert district_forecast.default_workers(10, 365 * 30) == 8
+    assert district_forecast.default_workers(4, 365 * 100) == 4
+    monkeypatch.setattr(district_forecast, "WORKERS", "3")
+    assert district_forecast.default_workers(10, 365) == 3
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from downsampling import envelope, lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_returns_sorted_indices():
+    x = np.arange(1000)
+    y = np.sin(x / 25.0)
+    keep = lttb_indices(x, y, 100)
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == 999
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_keeps_a_single_spike():
+    y = np.zeros(500)
+    y[321] = 50.0
+    assert 321 in lttb_indices(np.arange(500), y, 20)
+
+
+def test_lttb_accepts_datetimes():
+    dates = pd.date_range("2025-10-01", periods=365, freq="D")
+    keep = lttb_indices(dates, np.random.default_rng(0).normal(size=365), 50)
+    assert len(keep) == 50
+
+
+def test_lttb_short_series_unchanged():
+    np.testing.assert_array_equal(lttb_indices(np.arange(10), np.arange(10.0), 20), np.arange(10))
+
+
+def test_envelope_keeps_extremes():
+    low = np.arange(100.0)
+    high = low + 10
+    _, band_min, band_max = envelope(np.arange(100), low, high, 10)
+    assert band_min.min() == 0 and band_max.max() == 109
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from charts import heatwave_runs, heatwave_shapes
+from episodes import EPISODE_COLUMNS, episode_summary, find_episodes, find_runs
+
+
+def _daily(flags, start="2026-04-01", taluk=None):
+    dates = pd.date_range(start, periods=len(flags), freq="D")
+    temp = 35 + np.arange(len(flags), dtype=np.float64)
+    df = pd.DataFrame({"Predicted_Heatwave": flags, "Temp_max": temp, "Heat_Index": temp + 2}, index=dates)
+    if taluk is not None:
+        df = df.reset_index(names="Date").assign(Taluk=taluk)
+    return df
+
+
+def test_find_runs_splits_on_date_gaps_and_groups():
+    days = [0, 1, 2, 4, 5, 5, 6]
+    flags = [1, 1, 0, 1, 1, 1, 1]
+    groups = [0, 0, 0, 0, 0, 1, 1]
+    positions, starts, lengths = find_runs(days, flags, groups)
+    assert positions.tolist() == [0, 1, 3, 4, 5, 6]
+    assert starts.tolist() == [0, 2, 4]
+    assert lengths.tolist() == [2, 2, 2]
+
+
+def test_isolated_days_are_not_episodes():
+    episodes = find_episodes(_daily([1, 0, 1, 1, 1, 0, 1, 1]))
+    assert list(episodes.columns) == EPISODE_COLUMNS
+    assert episodes["start"].tolist() == [pd.Timestamp("2026-04-03"), pd.Timestamp("2026-04-07")]
+    assert episodes["end"].tolist() == [pd.Timestamp("2026-04-05"), pd.Timestamp("2026-04-08")]
+    assert episodes["days"].tolist() == [3, 2]
+    assert episodes["peak_temp"].tolist() == [39.0, 42.0]
+    assert episodes["intensity"].tolist() == [37 + 38 + 39 + 6.0, 41 + 42 + 4.0]
+
+
+def test_episodes_by_taluk_match_one_taluk_at_a_time():
+    frames = {"Tiptur": [1, 1, 0, 1, 1], "Gubbi": [0, 1, 1, 1, 0]}
+    long = pd.concat([_daily(flags, taluk=taluk) for taluk, flags in frames.items()]).sample(frac=1, random_state=0)
+    episodes = find_episodes(long, by="Taluk")
+    for taluk, flags in frames.items():
+        alone = find_episodes(_daily(flags)).reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            episodes[episodes["Taluk"] == taluk].drop(columns="Taluk").reset_index(drop=True), alone
+        )
+    summary = episode_summary(episodes, by="Taluk")
+    assert summary.loc["Tiptur", "episodes"] == 2 and summary.loc["Gubbi", "longest"] == 3
+
+
+def test_summary_without_episodes():
+    summary = episode_summary(find_episodes(_daily([1, 0, 1, 0])))
+    assert summary == {"episodes": 0, "longest": 0, "episode_days": 0, "max_intensity": 0.0}
+
+
+def test_chart_runs_end_the_day_after_the_last_heatwave_day():
+    df = _daily([1, 1, 0, 1])
+    starts, ends, lengths = heatwave_runs(df.index, df["Predicted_Heatwave"])
+    assert list(starts) == [pd.Timestamp("2026-04-01"), pd.Timestamp("2026-04-04")]
+    assert list(ends) == [pd.Timestamp("2026-04-03"), pd.Timestamp("2026-04-05")]
+    shapes = heatwave_shapes(df.index, df["Predicted_Heatwave"])
+    assert shapes[0]["fillcolor"] != shapes[1]["fillcolor"]
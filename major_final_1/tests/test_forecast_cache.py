@@ -0,0 +1,65 @@
+import os
+
+import joblib
+import pytest
+
+import model_registry
+from benchmarks.dummy_model import DummyHeatwaveModel
+from forecast_cache import ForecastCache
+
+START, END = "2025-10-01", "2025-10-30"
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(DummyHeatwaveModel(work=0), path)
+    yield str(path)
+    model_registry.clear()
+
+
+def test_repeat_requests_hit_memory(model_path):
+    cache = ForecastCache()
+    first = cache.get_forecast("Tumakuru", START, END, model_path=model_path)
+    assert cache.get_forecast("Tumakuru", START, END, model_path=model_path) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    aggregates = cache.get_aggregates("Tumakuru", START, END, model_path=model_path)
+    assert cache.get_aggregates("Tumakuru", START, END, model_path=model_path) is aggregates
+
+
+def test_new_model_artifact_invalidates_entries(model_path):
+    cache = ForecastCache()
+    first = cache.get_forecast("Tumakuru", START, END, model_path=model_path)
+    joblib.dump(DummyHeatwaveModel(threshold=0.0, work=0), model_path)
+    second = cache.get_forecast("Tumakuru", START, END, model_path=model_path)
+    assert second is not first
+    assert second["Predicted_Heatwave"].all() and cache.misses == 2
+
+
+def test_eviction_keeps_total_bytes_under_the_bound(model_path):
+    probe = ForecastCache()
+    nbytes = int(probe.get_forecast("Tumakuru", START, END, model_path=model_path).memory_usage(index=True).sum())
+    cache = ForecastCache(max_bytes=2 * nbytes)
+    for taluk in ("Tumakuru", "Tiptur", "Sira"):
+        cache.get_forecast(taluk, START, END, model_path=model_path)
+        cache.get_aggregates(taluk, START, END, model_path=model_path)
+    assert [key[0] for key in cache._entries] == ["Tiptur", "Sira"]
+    assert set(key[0] for key in cache._aggregates) == {"Tiptur", "Sira"}
+    assert cache._nbytes == 2 * nbytes <= cache.max_bytes
+
+    # The newest entry stays even when it alone is over budget.
+    tiny = ForecastCache(max_bytes=1)
+    tiny.get_forecast("Tumakuru", START, END, model_path=model_path)
+    tiny.get_forecast("Tiptur", START, END, model_path=model_path)
+    assert [key[0] for key in tiny._entries] == ["Tiptur"]
+
+
+def test_disk_tier_survives_a_new_cache(model_path, tmp_path):
+    pytest.importorskip("pyarrow")
+    cache_dir = str(tmp_path / "cache")
+    first = ForecastCache(cache_dir=cache_dir).get_forecast("Tumakuru", START, END, model_path=model_path)
+    assert len(os.listdir(cache_dir)) == 1
+    again = ForecastCache(cache_dir=cache_dir)
+    df = again.get_forecast("Tumakuru", START, END, model_path=model_path)
+    assert (again.hits, again.misses) == (1, 0)
+    assert df.equals(first)
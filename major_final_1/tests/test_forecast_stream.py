@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from benchmarks.dummy_model import DummyHeatwaveModel
+from forecast_stream import MONTHLY_COLUMNS, run_streaming_forecast
+
+TALUKS = ["Tumakuru", "Tiptur"]
+
+
+@pytest.fixture
+def model():
+    return DummyHeatwaveModel(work=0)
+
+
+def test_monthly_table_does_not_depend_on_chunk_size(model):
+    tables = [
+        run_streaming_forecast("2024-01-15", "2025-03-10", TALUKS, chunk_days=chunk_days, model=model)
+        for chunk_days in (1, 7, 45, 365, 1000)
+    ]
+    for table in tables[1:]:
+        pd.testing.assert_frame_equal(tables[0], table, check_exact=True)
+    assert tables[0].loc["Tumakuru", "days"].tolist()[:2] == [17, 29]
+
+
+def test_later_start_repeats_the_same_days(model):
+    full = run_streaming_forecast("2024-01-01", "2024-06-30", TALUKS, chunk_days=30, model=model)
+    late = run_streaming_forecast("2024-03-01", "2024-06-30", TALUKS, chunk_days=30, model=model)
+    later = full[full.index.get_level_values("Month") >= "2024-03-01"]
+    pd.testing.assert_frame_equal(later, late)
+
+
+def test_empty_range_gives_empty_table(model):
+    table = run_streaming_forecast("2024-02-01", "2024-01-31", TALUKS, model=model)
+    assert table.empty
+    assert list(table.columns) == MONTHLY_COLUMNS
+    assert table.index.names == ["Taluk", "Month"]
+
+
+def test_yearly_chart_draws_a_streamed_taluk(model):
+    from charts import create_yearly_plot
+
+    monthly = run_streaming_forecast("2025-10-01", "2030-09-30", TALUKS, model=model).loc["Tiptur"]
+    fig = create_yearly_plot(None, "Tiptur", monthly=monthly, title="5-Year Heatwave Forecast for Tiptur")
+    assert fig.layout.title.text == "5-Year Heatwave Forecast for Tiptur"
+    assert len(fig.data[0].x) == 60
+    assert list(fig.data[-1].y) == monthly["heatwave_days"].tolist()
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from forecasting import (FEATURES, TALUKS, WEATHER_FIELDS, generate_district_weather, generate_weather_data,
+                         weather_frame)
+
+
+def test_same_seed_gives_the_same_weather():
+    _, first = generate_district_weather("2025-10-01", "2025-12-31", seed=7)
+    _, again = generate_district_weather("2025-10-01", "2025-12-31", seed=7)
+    _, other = generate_district_weather("2025-10-01", "2025-12-31", seed=8)
+    for name in FEATURES:
+        np.testing.assert_array_equal(first[name], again[name])
+    assert not np.array_equal(first["Temp_2m"], other["Temp_2m"])
+
+
+def test_taluk_alone_matches_the_district_pass():
+    dates, fields = generate_district_weather("2025-10-01", "2026-03-31", seed=11)
+    for row, taluk in enumerate(TALUKS):
+        alone = generate_weather_data("2025-10-01", "2026-03-31", taluk, seed=11)
+        pd.testing.assert_frame_equal(alone, weather_frame(dates, fields, row))
+
+
+def test_taluk_series_does_not_depend_on_its_neighbours():
+    _, district = generate_district_weather("2025-10-01", "2025-10-31", seed=3)
+    _, subset = generate_district_weather("2025-10-01", "2025-10-31", ["Sira", "Tiptur"], seed=3)
+    for name in WEATHER_FIELDS:
+        np.testing.assert_array_equal(subset[name][0], district[name][TALUKS.index("Sira")])
+        np.testing.assert_array_equal(subset[name][1], district[name][TALUKS.index("Tiptur")])
+
+
+def test_field_shapes_and_dtype():
+    dates, fields = generate_district_weather("2025-10-01", "2025-10-10", seed=0, dtype=np.float32)
+    assert len(dates) == 10
+    for name in WEATHER_FIELDS:
+        assert fields[name].shape == (len(TALUKS), 10)
+        assert fields[name].dtype == np.float32
+    assert (fields["Humidity"] >= 30).all() and (fields["Humidity"] <= 95).all()
+    assert (fields["Temp_max"] >= fields["Temp_2m"]).all() and (fields["Temp_min"] <= fields["Temp_2m"]).all()
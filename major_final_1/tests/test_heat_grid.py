@@ -0,0 +1,82 @@
+import base64
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import heat_grid
+from heat_grid import RISK_COLOURS, HeatGrid, encode_png, overlay_spec, risk_to_rgba
+from shared_data import HEATWAVE_WEIGHTS, TALUK_COORDS, WARD_STORE, calculate_heatwave_percentage_batch
+
+BBOX = (13.0, 76.5, 13.5, 77.0)
+
+
+def _stations(grid, cells):
+    """Coordinates of the given (row, col) cell centres."""
+    return tuple((grid.lats[r], grid.lons[c]) for r, c in cells)
+
+
+def test_cells_on_a_station_take_its_value():
+    probe = HeatGrid(((13.2, 76.7),), bbox=BBOX, resolution_km=2.0)
+    cells = [(3, 4), (10, 20), (25, 8)]
+    grid = HeatGrid(_stations(probe, cells), bbox=BBOX, resolution_km=2.0)
+    values = np.array([[10.0, 1.0], [20.0, 2.0], [30.0, 3.0]])
+    surface = grid.interpolate(values).reshape(grid.n_rows, grid.n_cols, 2)
+    for (r, c), expected in zip(cells, values):
+        np.testing.assert_array_equal(surface[r, c], expected)
+    # Everywhere else IDW is a weighted mean, so it stays within the station range.
+    assert surface[..., 0].min() >= 10.0 - 1e-4 and surface[..., 0].max() <= 30.0 + 1e-4
+
+
+def test_brute_force_neighbours_match_the_kd_tree(monkeypatch):
+    pytest.importorskip("scipy")
+    coords = tuple(TALUK_COORDS.values())
+    values = np.random.default_rng(0).uniform(0, 100, (len(coords), 3))
+    expected = HeatGrid(coords, resolution_km=4.0).interpolate(values)
+    monkeypatch.setattr(heat_grid, "_neighbour_index", heat_grid._BruteForceNeighbours)
+    np.testing.assert_allclose(HeatGrid(coords, resolution_km=4.0).interpolate(values), expected, rtol=1e-6)
+
+
+def test_risk_is_scored_inside_coverage_and_blank_outside():
+    ward_df = WARD_STORE.frame()
+    coords = tuple(TALUK_COORDS[taluk] for taluk in ward_df.index)
+    grid = HeatGrid(coords, resolution_km=4.0, max_distance_km=15.0)
+    risk = grid.risk(ward_df)
+    assert risk.shape == (grid.n_rows, grid.n_cols)
+
+    inside = grid.inside.reshape(risk.shape)
+    assert inside.any() and not inside.all()
+    assert np.isnan(risk[~inside]).all()
+    fields = list(HEATWAVE_WEIGHTS)
+    surface = pd.DataFrame(grid.interpolate(ward_df[fields].to_numpy()), columns=fields)
+    np.testing.assert_array_equal(risk[inside], calculate_heatwave_percentage_batch(surface)[grid.inside])
+
+
+def test_risk_colours_and_transparency():
+    rgba = risk_to_rgba(np.array([[0.0, 100.0, np.nan, 150.0]]), alpha=200)
+    np.testing.assert_array_equal(rgba[0, 0, :3], RISK_COLOURS[0])
+    np.testing.assert_array_equal(rgba[0, 1, :3], RISK_COLOURS[-1])
+    np.testing.assert_array_equal(rgba[0, 3], rgba[0, 1])
+    assert rgba[0, :, 3].tolist() == [200, 200, 0, 200]
+
+
+def test_png_round_trips():
+    Image = pytest.importorskip("PIL.Image")
+    rgba = np.random.default_rng(1).integers(0, 256, (7, 5, 4), dtype=np.uint8)
+    image = Image.open(io.BytesIO(encode_png(rgba)))
+    assert image.mode == "RGBA" and image.size == (5, 7)
+    np.testing.assert_array_equal(np.asarray(image), rgba)
+
+
+def test_overlay_spec_and_cached_grid():
+    tumakuru_map = pytest.importorskip("tumakuru_map")
+    coords = tuple(TALUK_COORDS.values())
+    assert tumakuru_map._heat_grid(coords) is tumakuru_map._heat_grid(coords)
+
+    grid = HeatGrid(coords, resolution_km=8.0)
+    spec = overlay_spec(grid, np.full((grid.n_rows, grid.n_cols), 50.0, dtype=np.float32))
+    south, west, north, east = grid.bbox
+    assert spec["bounds"] == [[south, west], [north, east]]
+    png = base64.b64decode(spec["url"].removeprefix("data:image/png;base64,"))
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
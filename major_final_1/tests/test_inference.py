@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+from sklearn.ensemble import (AdaBoostClassifier, BaggingClassifier, ExtraTreesClassifier,
+                              GradientBoostingClassifier, RandomForestClassifier, RandomForestRegressor)
+from sklearn.tree import DecisionTreeClassifier
+
+import inference
+from forecasting import FEATURES
+from inference import CompiledTreesBackend, UnsupportedModel, evaluate_backends, select_backend
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(30, 8, (1200, len(FEATURES))), columns=FEATURES)
+    y = ((X["Heat_Index"] + rng.normal(0, 3, len(X))) > 34).astype(int)
+    return X.iloc[:800], y.iloc[:800], X.iloc[800:]
+
+
+@pytest.mark.parametrize("model", [
+    RandomForestClassifier(n_estimators=20, max_depth=6, random_state=0),
+    ExtraTreesClassifier(n_estimators=20, max_depth=6, random_state=0),
+    DecisionTreeClassifier(max_depth=8, random_state=0),
+])
+def test_compiled_trees_match_sklearn(data, model):
+    X, y, fresh = data
+    model.fit(X, y)
+    backend = CompiledTreesBackend(model)
+    np.testing.assert_array_equal(backend.predict(fresh), model.predict(fresh))
+
+
+def test_compiled_regressor_matches_sklearn(data):
+    X, y, fresh = data
+    model = RandomForestRegressor(n_estimators=10, max_depth=5, random_state=0).fit(X, X["Temp_2m"])
+    np.testing.assert_allclose(CompiledTreesBackend(model).predict(fresh), model.predict(fresh))
+
+
+@pytest.mark.parametrize("model", [
+    GradientBoostingClassifier(n_estimators=10, max_depth=3, random_state=0),
+    AdaBoostClassifier(n_estimators=10, random_state=0),
+    BaggingClassifier(DecisionTreeClassifier(), n_estimators=5, max_features=0.5, random_state=0),
+])
+def test_other_ensembles_are_rejected(data, model):
+    X, y, fresh = data
+    model.fit(X, y)
+    with pytest.raises(UnsupportedModel):
+        CompiledTreesBackend(model)
+    backend, report = select_backend(model, fresh, repeat=1)
+    assert backend.name == "joblib"
+    assert next(r for r in report if r["backend"] == "compiled")["status"].startswith("unavailable")
+
+
+def test_backend_failing_on_the_sample_is_skipped(data, monkeypatch):
+    X, y, fresh = data
+    model = RandomForestClassifier(n_estimators=5, max_depth=4, random_state=0).fit(X, y)
+
+    class Broken:
+        name = "compiled"
+
+        def __init__(self, model):
+            pass
+
+        def predict(self, X):
+            raise ValueError("boom")
+
+    monkeypatch.setitem(inference.BACKENDS, "compiled", Broken)
+    backends, report = evaluate_backends(model, fresh, ("joblib", "compiled"), repeat=1)
+    assert list(backends) == ["joblib"]
+    assert report[1]["status"] == "failed: ValueError: boom"
+
+
+class _Inverted:
+    """Instant but wrong: flips every prediction, so only the parity check stops it."""
+    name = "compiled"
+
+    def __init__(self, model):
+        self.model = model
+
+    def predict(self, X):
+        return 1 - self.model.predict(X)
+
+
+@pytest.mark.parametrize("preferred", ["auto", "compiled"])
+def test_backend_failing_parity_falls_back_to_joblib(data, monkeypatch, preferred):
+    X, y, fresh = data
+    model = RandomForestClassifier(n_estimators=5, max_depth=4, random_state=0).fit(X, y)
+    monkeypatch.setitem(inference.BACKENDS, "compiled", _Inverted)
+    backend, report = select_backend(model, fresh, preferred=preferred, repeat=1)
+    assert backend.name == "joblib"
+    compiled = next(r for r in report if r["backend"] == "compiled")
+    assert compiled["status"] == f"parity failed: {len(fresh)} of {len(fresh)} rows differ"
+    assert not compiled["selected"]
+
+
+def test_backend_returning_the_wrong_shape_fails_parity(data, monkeypatch):
+    X, y, fresh = data
+    model = RandomForestClassifier(n_estimators=5, max_depth=4, random_state=0).fit(X, y)
+
+    class Truncated(_Inverted):
+        def predict(self, X):
+            return self.model.predict(X)[:-1]
+
+    monkeypatch.setitem(inference.BACKENDS, "compiled", Truncated)
+    backends, report = evaluate_backends(model, fresh, ("joblib", "compiled"), repeat=1)
+    assert list(backends) == ["joblib"]
+    assert report[1]["status"] == f"parity failed: all of {len(fresh)} rows differ"
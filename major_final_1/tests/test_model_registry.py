@@ -0,0 +1,63 @@
+import logging
+import os
+
+import joblib
+import pytest
+
+import model_registry
+from benchmarks.dummy_model import DummyHeatwaveModel
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    model_registry.clear()
+    yield
+    model_registry.clear()
+
+
+def test_get_model_loads_once_and_reloads_on_change(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(DummyHeatwaveModel(work=0), path)
+    first = model_registry.get_model(str(path))
+    assert model_registry.get_model(str(path)) is first
+    version = model_registry.model_version(str(path))
+
+    joblib.dump(DummyHeatwaveModel(threshold=40.0, work=0), path)
+    assert model_registry.get_model(str(path)) is not first
+    assert model_registry.model_version(str(path)) != version
+
+
+def test_touched_artifact_keeps_the_loaded_model(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(DummyHeatwaveModel(work=0), path)
+    first = model_registry.get_model(str(path))
+    version = model_registry.model_version(str(path))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    # New mtime, same bytes: the content hash matches, so nothing is reloaded.
+    assert model_registry.get_model(str(path)) is first
+    assert model_registry.model_version(str(path)) == version
+
+
+def test_warm_up_missing_artifact(tmp_path):
+    assert model_registry.warm_up(str(tmp_path / "missing.joblib")) is False
+
+
+def test_warm_up_logs_corrupt_artifact(tmp_path, caplog):
+    path = tmp_path / "model.joblib"
+    path.write_bytes(b"not a pickle")
+    with caplog.at_level(logging.ERROR, logger="model_registry"):
+        assert model_registry.warm_up(str(path)) is False
+    assert "could not load the forecasting model" in caplog.text
+
+
+def test_unusable_preferred_backend_falls_back_to_joblib(tmp_path, monkeypatch):
+    path = tmp_path / "model.joblib"
+    joblib.dump(DummyHeatwaveModel(work=0), path)
+    monkeypatch.setattr(model_registry, "INFERENCE_BACKEND", "compiled")
+    with pytest.warns(UserWarning, match="'compiled' unavailable or not matching; using joblib"):
+        backend = model_registry.get_model(str(path))
+    assert backend.name == "joblib"
+    report = model_registry.backend_report(str(path))
+    assert [(r["backend"], r["selected"]) for r in report] == [("joblib", True), ("compiled", False)]
+    assert report[1]["status"].startswith("unavailable")
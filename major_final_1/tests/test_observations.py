@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.dummy_model import DummyHeatwaveModel
+from forecasting import FEATURES, WEATHER_FIELDS
+from observations import ObservationStore, read_csv_observations, run_observed_forecast, to_daily
+
+
+def _readings(start, end, taluk="Tiptur", per_day=2):
+    dates = pd.date_range(start, end, freq=f"{24 // per_day}h")
+    rng = np.random.default_rng(len(dates))
+    return pd.DataFrame({
+        "date": dates,
+        "taluk": taluk,
+        "Temp_2m": rng.normal(32, 3, len(dates)),
+        "Heat_Index": rng.normal(34, 3, len(dates)),
+        "Humidity": rng.uniform(30, 90, len(dates)),
+    })
+
+
+def test_csv_columns_are_mapped_and_days_averaged(tmp_path):
+    path = tmp_path / "station.csv"
+    path.write_text("Date,tmax,RH\n2025-04-01 06:00,30,60\n2025-04-01 18:00,34,40\n2025-04-02 12:00,35,50\n")
+    df = read_csv_observations(str(path), column_map={"tmax": "Temp_2m", "RH": "Humidity"}, taluk="Sira")
+    daily = to_daily(df)
+    assert list(daily.columns) == ["taluk", "date", *WEATHER_FIELDS]
+    assert daily["date"].tolist() == [pd.Timestamp("2025-04-01"), pd.Timestamp("2025-04-02")]
+    assert daily["Temp_2m"].tolist() == [32.0, 35.0]
+    assert daily["Humidity"].tolist() == [50.0, 50.0]
+    assert daily["AIQ"].isna().all()
+
+
+def test_csv_without_date_or_taluk_is_rejected(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("day,Temp_2m\n2025-04-01,30\n")
+    with pytest.raises(ValueError, match="no 'date' column"):
+        read_csv_observations(str(path))
+    path.write_text("date,Temp_2m\n2025-04-01,30\n")
+    with pytest.raises(ValueError, match="no 'taluk' column"):
+        read_csv_observations(str(path))
+
+
+def test_append_partitions_by_taluk_and_year_and_skips_stored_days(tmp_path):
+    pytest.importorskip("pyarrow")
+    store = ObservationStore(str(tmp_path))
+    first = pd.concat([_readings("2024-12-20", "2025-01-10"), _readings("2025-01-01", "2025-01-05", "Sira")])
+    assert store.append(first) == {"Sira": 5, "Tiptur": 22}
+    assert sorted(os.listdir(tmp_path / "taluk=Tiptur")) == ["year=2024", "year=2025"]
+    assert store.watermarks() == {"Sira": pd.Timestamp("2025-01-05"), "Tiptur": pd.Timestamp("2025-01-10")}
+
+    # Re-ingesting is a no-op; an overlapping file only adds the newer days.
+    assert store.append(first) == {}
+    assert store.append(_readings("2025-01-08", "2025-01-15")) == {"Tiptur": 5}
+    assert store.watermarks()["Tiptur"] == pd.Timestamp("2025-01-15")
+    assert len(store.query("Tiptur")) == 27
+
+
+def test_query_filters_dates_across_year_partitions(tmp_path):
+    pytest.importorskip("pyarrow")
+    store = ObservationStore(str(tmp_path))
+    readings = _readings("2024-12-01", "2025-02-28")
+    store.append(readings)
+    expected = to_daily(readings).set_index("date")
+
+    result = store.query("Tiptur", "2024-12-30", "2025-01-02")
+    assert result.index.tolist() == list(pd.date_range("2024-12-30", "2025-01-02"))
+    np.testing.assert_array_equal(result["Temp_2m"], expected.loc["2024-12-30":"2025-01-02", "Temp_2m"])
+    assert store.query("Sira").empty
+    assert list(store.query("Tiptur", columns=["Heat_Index"]).columns) == ["Heat_Index"]
+
+
+def test_observed_forecast_drops_days_with_gaps(tmp_path):
+    pytest.importorskip("pyarrow")
+    store = ObservationStore(str(tmp_path))
+    readings = _readings("2025-04-01", "2025-04-10")
+    for field in WEATHER_FIELDS:
+        if field not in readings:
+            readings[field] = 1.0
+    readings.loc[readings["date"].dt.day == 3, "AIQ"] = np.nan
+    store.append(readings)
+
+    assert list(store.feature_frame("Tiptur").columns) == FEATURES
+    df = run_observed_forecast("2025-04-01", "2025-04-10", "Tiptur", DummyHeatwaveModel(work=0), store=store)
+    assert len(df) == 9 and pd.Timestamp("2025-04-03") not in df.index
+    assert (df["Predicted_Heatwave"] == (df["Heat_Index"] > 33.0)).all()
@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import joblib
+import numpy as np
+import pytest
+
+import model_registry
+from benchmarks.dummy_model import DummyHeatwaveModel
+from forecasting import FEATURES
+from prediction_service import MicroBatcher, PredictionApp, check_features, parse_features
+
+HEAT_INDEX = FEATURES.index("Heat_Index")
+
+
+def _rows(*heat_index):
+    rows = np.zeros((len(heat_index), len(FEATURES)))
+    rows[:, HEAT_INDEX] = heat_index
+    return rows
+
+
+def test_parse_features_reorders_split_payload():
+    columns = FEATURES[::-1]
+    rows = _rows(35.0)[:, ::-1]
+    np.testing.assert_array_equal(parse_features({"columns": columns, "data": rows.tolist()}), _rows(35.0))
+
+
+@pytest.mark.parametrize("features", [np.zeros((0, len(FEATURES))), np.zeros((2, 3)), np.zeros(len(FEATURES)),
+                                      np.full((1, len(FEATURES)), np.inf)])
+def test_check_features_rejects_what_cannot_be_batched(features):
+    with pytest.raises(ValueError):
+        check_features(features)
+
+
+def test_failed_batch_only_fails_the_bad_request():
+    batch_sizes = []
+
+    def predict(batch):
+        batch_sizes.append(len(batch))
+        if np.isnan(batch).any():
+            raise ValueError("NaN in features")
+        return batch[:, HEAT_INDEX] > 33, "v1"
+
+    async def run():
+        batcher = MicroBatcher(predict, max_wait_ms=50)
+        results = await asyncio.gather(
+            batcher.predict(_rows(30.0, 40.0)), batcher.predict(_rows(np.nan)), batcher.predict(_rows(35.0)),
+            return_exceptions=True,
+        )
+        await batcher.close()
+        return results, batcher
+
+    (good, bad, other), batcher = asyncio.run(run())
+    assert good[0].tolist() == [False, True] and good[1] == "v1"
+    assert isinstance(bad, ValueError)
+    assert other[0].tolist() == [True]
+    assert batch_sizes == [4, 2, 1, 1]
+    assert batcher.requests == 2
+
+
+def test_app_answers_with_predictions_and_version(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump(DummyHeatwaveModel(work=0), path)
+    app = PredictionApp(str(path))
+    body = json.dumps({"columns": FEATURES, "data": _rows(30.0, 40.0).tolist()}).encode()
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        await app({"type": "http", "method": "POST", "path": "/predict"}, receive, send)
+        await app.batcher.close()
+
+    asyncio.run(run())
+    model_registry.clear()
+    assert sent[0]["status"] == 200
+    payload = json.loads(sent[1]["body"])
+    assert payload["predictions"] == [0, 1]
+    assert payload["model_version"] == model_registry.model_version(str(path))
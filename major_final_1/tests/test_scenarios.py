@@ -0,0 +1,75 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+from scenarios import AIQ_STEPS, GREEN_STEPS, TRAFFIC_STEPS, ScenarioGrid, get_scenario_grid
+from shared_data import RISK_BAND_FLOORS, WARD_DATA, WARD_STORE, calculate_heatwave_percentage
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return ScenarioGrid(WARD_STORE.frame())
+
+
+def _direct(taluk, green, traffic, aiq):
+    row = dict(WARD_DATA[taluk])
+    row["Green_Cover_"] = max(row["Green_Cover_"] + green, 0)
+    row["Traffic_Index"] = max(row["Traffic_Index"] - traffic, 0)
+    row["AIQ"] = max(row["AIQ"] - aiq, 0)
+    return calculate_heatwave_percentage(row)
+
+
+def test_grid_matches_the_direct_scorer(grid):
+    for taluk in grid.taluks:
+        for g, t, a in itertools.product(GREEN_STEPS, TRAFFIC_STEPS, AIQ_STEPS):
+            assert grid.lookup(taluk, g, t, a) == _direct(taluk, g, t, a)
+
+
+def test_lookup_snaps_to_the_nearest_step(grid):
+    assert grid.lookup("Tiptur", 3.2, 6, 58) == grid.lookup("Tiptur", 4, 5, 60)
+    assert grid.lookup("Tiptur", -5, 100, 0.4) == grid.lookup("Tiptur", GREEN_STEPS[0], TRAFFIC_STEPS[-1], 0)
+
+
+def test_cheapest_mitigation_is_the_cheapest_reachable_plan(grid):
+    for taluk in grid.taluks:
+        plans = grid.cheapest_mitigation(taluk)
+        for band, floor in RISK_BAND_FLOORS.items():
+            plan = plans[band]
+            reachable = [
+                grid.cost[i, j, k]
+                for (i, g), (j, t), (k, a) in itertools.product(
+                    enumerate(GREEN_STEPS), enumerate(TRAFFIC_STEPS), enumerate(AIQ_STEPS)
+                )
+                if grid.lookup(taluk, g, t, a) < floor
+            ]
+            if not reachable:
+                assert plan is None
+                continue
+            assert plan["cost"] == min(reachable)
+            assert plan["heatwave_pct"] < floor
+            assert plan["heatwave_pct"] == grid.lookup(
+                taluk, plan["green_delta"], plan["traffic_delta"], plan["aiq_delta"]
+            )
+
+
+def test_unreachable_band_has_no_plan():
+    frame = pd.DataFrame(
+        {"Temp_2m": [300.0], "Humidity": [50.0], "Green_Cover_": [10.0], "Traffic_Index": [50.0],
+         "AIQ": [50.0], "Precipitation_mm": [0.0]},
+        index=["Hot"],
+    )
+    assert ScenarioGrid(frame).cheapest_mitigation("Hot") == {band: None for band in RISK_BAND_FLOORS}
+
+
+def test_grid_is_rebuilt_when_readings_change():
+    before = get_scenario_grid()
+    assert get_scenario_grid() is before
+    original = dict(WARD_DATA["Sira"])
+    try:
+        WARD_STORE.update("Sira", {"Temp_2m": original["Temp_2m"] + 20})
+        after = get_scenario_grid()
+        assert after is not before
+        assert after.lookup("Sira") == before.lookup("Sira") + 8
+    finally:
+        WARD_STORE.update("Sira", original)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.bench_scoring import baseline_percentage
+from shared_data import (HEATWAVE_WEIGHTS, WARD_DATA, WARD_DATA_PATH, WARD_STORE, calculate_heatwave_percentage,
+                         calculate_heatwave_percentage_batch, classify_risk_level, load_ward_payload, scored_payload,
+                         write_ward_payload)
+
+FIELDS = list(HEATWAVE_WEIGHTS)
+
+
+def test_every_ward_matches_the_original_formula():
+    frame = WARD_STORE.frame()
+    expected = [baseline_percentage(WARD_DATA[taluk]) for taluk in frame.index]
+    assert calculate_heatwave_percentage_batch(frame).tolist() == expected
+    assert [calculate_heatwave_percentage(WARD_DATA[taluk]) for taluk in frame.index] == expected
+
+
+def test_random_and_boundary_rows_match_the_original_formula():
+    rng = np.random.default_rng(0)
+    rows = pd.DataFrame(rng.uniform(-50, 300, (5000, len(FIELDS))), columns=FIELDS)
+    # Scores landing exactly on .5 (round half to even), on the clip limits and beyond them.
+    edges = [{**dict.fromkeys(FIELDS, 0), "Humidity": h} for h in (5, 15, 25, 995, 1000, 1005, -5, 2000)]
+    rows = pd.concat([rows, pd.DataFrame(edges)], ignore_index=True)
+    expected = [baseline_percentage(row) for row in rows.to_dict("records")]
+    assert calculate_heatwave_percentage_batch(rows).tolist() == expected
+    assert [calculate_heatwave_percentage(row) for row in rows.to_dict("records")] == expected
+
+
+def test_incomplete_rows_are_rejected_by_name():
+    with pytest.raises(ValueError, match="Gubbi"):
+        calculate_heatwave_percentage_batch(WARD_STORE.frame(complete_only=False))
+    with pytest.raises(ValueError):
+        calculate_heatwave_percentage({**dict.fromkeys(FIELDS, 1.0), "AIQ": np.nan})
+
+
+def test_static_pages_get_current_scores():
+    # index.html and tumkur_leaflet.html display these fields as stored, so a
+    # stale file would disagree with the app; rerun `python shared_data.py`.
+    payload = load_ward_payload()
+    for taluk, info in payload["taluks"].items():
+        if taluk in WARD_DATA:
+            percent = calculate_heatwave_percentage(WARD_DATA[taluk])
+            assert info["heatwave_percentage"] == percent
+            assert info["risk_level"] == classify_risk_level(percent)[0]
+        else:
+            assert "heatwave_percentage" not in info
+    assert payload == scored_payload()
+
+
+def test_rewriting_keeps_the_file_layout(tmp_path):
+    path = tmp_path / "ward_data.json"
+    write_ward_payload(scored_payload(), path)
+    with open(WARD_DATA_PATH, encoding="utf-8") as fh:
+        assert path.read_text(encoding="utf-8") == fh.read()
@@ -0,0 +1,75 @@
+import json
+
+import numpy as np
+import pytest
+
+from taluk_locator import NO_DATA, TalukLocator, _RayCastIndex, load_boundaries
+
+# Tiptur: a square with a hole; Gubbi: the square next to it (lon, lat rings).
+BOUNDARIES = {
+    "type": "FeatureCollection",
+    "features": [
+        {"type": "Feature", "properties": {"NAME_3": "tiptur"},
+         "geometry": {"type": "Polygon", "coordinates": [
+             [[76.0, 13.0], [76.5, 13.0], [76.5, 13.5], [76.0, 13.5], [76.0, 13.0]],
+             [[76.2, 13.2], [76.3, 13.2], [76.3, 13.3], [76.2, 13.3], [76.2, 13.2]],
+         ]}},
+        {"type": "Feature", "properties": {"name": "Gubbi"},
+         "geometry": {"type": "MultiPolygon", "coordinates": [
+             [[[76.5, 13.0], [77.0, 13.0], [77.0, 13.5], [76.5, 13.5], [76.5, 13.0]]],
+         ]}},
+    ],
+}
+LAT = [13.1, 13.25, 13.4, 13.25, 14.0]
+LON = [76.1, 76.25, 76.7, 76.4, 76.1]
+EXPECTED = ["Tiptur", None, "Gubbi", "Tiptur", None]
+
+
+@pytest.fixture
+def boundaries(tmp_path):
+    path = tmp_path / "taluks.geojson"
+    path.write_text(json.dumps(BOUNDARIES))
+    return load_boundaries(str(path))
+
+
+def _names(locator, ids):
+    return [locator.taluks[i] if i >= 0 else None for i in ids]
+
+
+def test_load_boundaries_normalises_names(boundaries):
+    assert sorted(boundaries) == ["Gubbi", "Tiptur"]
+    assert len(boundaries["Tiptur"][0]) == 2  # outer ring and hole
+
+
+def test_boundary_lookup_honours_holes(boundaries):
+    locator = TalukLocator.from_boundaries(boundaries)
+    assert not locator.approximate
+    assert _names(locator, locator.taluk_ids(LAT, LON)) == EXPECTED
+
+
+def test_ray_cast_matches_strtree(boundaries):
+    pytest.importorskip("shapely")
+    locator = TalukLocator.from_boundaries(boundaries)
+    polygons = [(i, rings) for i, taluk in enumerate(locator.taluks) for rings in boundaries[taluk]]
+    rng = np.random.default_rng(0)
+    lat, lon = rng.uniform(12.9, 13.6, 5000), rng.uniform(75.9, 77.1, 5000)
+    expected = locator.taluk_ids(lat, lon)
+    np.testing.assert_array_equal(_RayCastIndex(polygons).owners(lon, lat), expected)
+
+
+def test_centroid_lookup_picks_nearest_taluk_inside_the_box():
+    locator = TalukLocator.from_centroids()
+    assert locator.approximate
+    table = locator.lookup([13.34, 14.1, 10.0], [77.10, 77.28, 77.0])
+    assert table["Taluk"].tolist() == ["Tumakuru", "Pavagada", None]
+    assert np.isnan(table["Heatwave_pct"].iloc[2])
+
+
+def test_risk_of_taluks_without_readings(boundaries):
+    locator = TalukLocator.from_boundaries(boundaries)
+    table = locator.risk_table()
+    assert table.loc["Gubbi", "Risk_level"] == NO_DATA
+    assert table.loc["Tiptur", "Risk_level"] != NO_DATA
+    spec = locator.client_spec()
+    assert [t["name"] for t in spec["taluks"]] == ["Gubbi", "Tiptur"]
+    assert "pct" in spec["taluks"][1] and "pct" not in spec["taluks"][0]
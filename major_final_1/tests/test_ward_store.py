@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from ward_store import WardStore
+
+FIELDS = ["Temp_2m", "Humidity"]
+
+
+@pytest.fixture
+def store():
+    store = WardStore(["Tumakuru", "Tiptur", "Gubbi"], FIELDS)
+    store.update_many(["Tumakuru", "Tiptur"], [[40, 60], [38, 55]], timestamp=1)
+    return store
+
+
+def test_small_change_is_recorded(store):
+    changed = store.update("Tumakuru", {"Temp_2m": 40.0003}, timestamp=2)
+    assert changed.tolist() == [0]
+    assert store.column("Temp_2m")[0] == 40.0003
+    assert store.history("Tumakuru")["Temp_2m"].tolist() == [40, 40.0003]
+    assert store.history()["Temp_2m"].dtype == np.float64
+
+
+def test_unchanged_rows_are_skipped(store):
+    version = store.version
+    changed = store.update_many(["Tumakuru", "Gubbi"], [[40, 60], [np.nan, np.nan]], timestamp=2)
+    assert len(changed) == 0
+    assert store.version == version
+
+
+def test_frame_and_column_are_read_only(store):
+    df = store.frame(complete_only=False)
+    with pytest.raises(ValueError):
+        df.iloc[0, 0] = 99
+    with pytest.raises(ValueError):
+        store.column("Humidity")[0] = 99
+    assert store.row("Tumakuru") == {"Temp_2m": 40, "Humidity": 60}
+
+
+def test_frame_drops_incomplete_taluks(store):
+    assert list(store.frame().index) == ["Tumakuru", "Tiptur"]
+
+
+def test_snapshot_returns_readings_at_a_time(store):
+    store.update("Tumakuru", {"Temp_2m": 44}, timestamp=5)
+    assert store.snapshot(3).loc["Tumakuru", "Temp_2m"] == 40
+    assert store.snapshot(5).loc["Tumakuru", "Temp_2m"] == 44
+
+
+def test_subscribers_hear_changed_ids_until_unsubscribed(store):
+    calls = []
+    unsubscribe = store.subscribe(lambda ids, timestamp: calls.append((ids.tolist(), timestamp)))
+    store.update_many(["Tumakuru", "Tiptur"], [[40, 60], [39, 55]], timestamp=7)
+    unsubscribe()
+    store.update("Tiptur", {"Temp_2m": 41}, timestamp=8)
+    assert calls == [([1], 7)]
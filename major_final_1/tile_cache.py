@@ -0,0 +1,150 @@
+# tile_cache.py
+"""Offline map assets: pre-seeded OSM tiles and the vendored Leaflet build.
+
+Streamlit serves ``static/`` at ``<baseUrlPath>/app/static/`` (see
+``.streamlit/config.toml``), so once tiles are seeded the map needs no
+external requests. Seed on a connected machine and copy ``static/tiles``
+to the air-gapped ones::
+
+    python tile_cache.py seed            # zoom 8-12 over Tumakuru district
+    python tile_cache.py status
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+import urllib.request
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+TILES_DIR = os.path.join(STATIC_DIR, "tiles")
+MANIFEST_PATH = os.path.join(TILES_DIR, "manifest.json")
+LEAFLET_DIR = os.path.join(STATIC_DIR, "vendor", "leaflet")
+
+# Tumakuru district bounding box (south, west, north, east) with a small margin
+TUMAKURU_BBOX = (12.70, 76.20, 14.50, 77.60)
+MIN_ZOOM, MAX_ZOOM = 8, 12
+
+OSM_TILE_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+OSM_ATTRIBUTION = '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
+CDN_LEAFLET_CSS = "https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"
+CDN_LEAFLET_JS = "https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"
+
+# OSM's tile policy asks for an identifying User-Agent and modest request rates.
+USER_AGENT = "tumkur-heatwave-dashboard/1.0 (offline tile seeding)"
+
+
+def lat_lon_to_tile(lat, lon, zoom):
+    """Slippy-map tile (x, y) containing a point at ``zoom``."""
+    n = 2 ** zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tiles_for_bbox(bbox=TUMAKURU_BBOX, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+    """Yield every (z, x, y) tile covering ``bbox`` between the two zoom levels."""
+    south, west, north, east = bbox
+    for z in range(min_zoom, max_zoom + 1):
+        x0, y0 = lat_lon_to_tile(north, west, z)
+        x1, y1 = lat_lon_to_tile(south, east, z)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield z, x, y
+
+
+def tile_path(z, x, y):
+    return os.path.join(TILES_DIR, str(z), str(x), f"{y}.png")
+
+
+def seed_tiles(url=OSM_TILE_URL, bbox=TUMAKURU_BBOX, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM, delay=0.25):
+    """Download missing tiles into ``static/tiles`` and write the manifest."""
+    fetched = skipped = failed = 0
+    for z, x, y in tiles_for_bbox(bbox, min_zoom, max_zoom):
+        path = tile_path(z, x, y)
+        if os.path.exists(path):
+            skipped += 1
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        request = urllib.request.Request(url.format(z=z, x=x, y=y), headers={"User-Agent": USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = response.read()
+        except OSError as e:
+            print(f"failed {z}/{x}/{y}: {e}")
+            failed += 1
+            continue
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+        fetched += 1
+        time.sleep(delay)
+
+    if not failed:
+        manifest = {
+            "bbox": list(bbox),
+            "min_zoom": min_zoom,
+            "max_zoom": max_zoom,
+            "source": url,
+            "attribution": OSM_ATTRIBUTION,
+            "seeded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(MANIFEST_PATH, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
+    return fetched, skipped, failed
+
+
+def load_manifest():
+    """The tile manifest, or None when tiles have not been (fully) seeded."""
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def map_assets(static_url="app/static"):
+    """Leaflet and tile URLs for the map: local copies when present, CDN/OSM otherwise."""
+    local_leaflet = os.path.exists(os.path.join(LEAFLET_DIR, "leaflet.js"))
+    manifest = load_manifest()
+    if manifest:
+        tiles = {
+            "url": f"{static_url}/tiles/{{z}}/{{x}}/{{y}}.png",
+            "minZoom": manifest["min_zoom"],
+            "maxZoom": manifest["max_zoom"],
+            "attribution": manifest.get("attribution", OSM_ATTRIBUTION),
+        }
+    else:
+        tiles = {"url": OSM_TILE_URL, "maxZoom": 18, "attribution": OSM_ATTRIBUTION}
+    return {
+        "leaflet_css": f"{static_url}/vendor/leaflet/leaflet.css" if local_leaflet else CDN_LEAFLET_CSS,
+        "leaflet_js": f"{static_url}/vendor/leaflet/leaflet.js" if local_leaflet else CDN_LEAFLET_JS,
+        "tiles": tiles,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage offline map tiles for the Tumakuru heatwave map.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    seed = sub.add_parser("seed", help="download tiles for the district bounding box")
+    seed.add_argument("--min-zoom", type=int, default=MIN_ZOOM)
+    seed.add_argument("--max-zoom", type=int, default=MAX_ZOOM)
+    seed.add_argument("--url", default=OSM_TILE_URL, help="tile URL template, e.g. an internal tile server")
+    seed.add_argument("--delay", type=float, default=0.25, help="seconds between requests")
+    sub.add_parser("status", help="show how many tiles are cached")
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        fetched, skipped, failed = seed_tiles(args.url, min_zoom=args.min_zoom, max_zoom=args.max_zoom, delay=args.delay)
+        print(f"fetched {fetched}, already cached {skipped}, failed {failed}")
+    else:
+        wanted = list(tiles_for_bbox())
+        cached = sum(os.path.exists(tile_path(*t)) for t in wanted)
+        print(f"{cached}/{len(wanted)} tiles cached for zoom {MIN_ZOOM}-{MAX_ZOOM}; manifest: {load_manifest() is not None}")
+
+
+if __name__ == "__main__":
+    main()
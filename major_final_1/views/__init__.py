@@ -0,0 +1,34 @@
+# views/__init__.py
+"""Dashboard pages, imported only when first shown.
+
+Each page lives in its own module so opening, say, the map does not pay for
+Plotly, the forecast cache or the model. ``PAGES`` maps the sidebar label to
+``(module, function)``.
+"""
+
+import importlib
+import os
+from functools import lru_cache
+
+PAGES = {
+    "Forecast System": ("views.forecast", "show_forecast_system"),
+    "Heat Sentinel Dashboard": ("views.heat_sentinel", "show_heat_sentinel_dashboard"),
+    "Taluk Comparison": ("views.taluk_comparison", "show_taluk_comparison"),
+    "Tumakuru Map Visualization": ("tumakuru_map", "show_tumakuru_map"),
+}
+
+# Styles for the themed-card markup the pages emit; every entry point injects it.
+THEME_CSS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "theme.css")
+
+
+def page_function(page):
+    """The render function for a sidebar label, importing its module on first use."""
+    module_name, function_name = PAGES[page]
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+@lru_cache(maxsize=1)
+def theme_css():
+    """``theme.css`` wrapped in a ``<style>`` tag, for ``st.markdown(..., unsafe_allow_html=True)``."""
+    with open(THEME_CSS_PATH, encoding="utf-8") as fh:
+        return f"<style>\n{fh.read()}</style>"
@@ -0,0 +1,38 @@
+# views/debug.py
+"""Sidebar panel for the stage instrumentation (see ``instrumentation``)."""
+
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+import model_registry
+
+
+def show_debug_panel():
+    """Read-only sidebar panel with the stage timings, backend report and counters.
+
+    Instrumentation and tracemalloc are process-wide, so they are switched on
+    for the whole server with ``HEATWAVE_INSTRUMENT`` / ``HEATWAVE_TRACE_MEMORY``
+    rather than from one session's sidebar.
+    """
+    with st.sidebar.expander("Performance debug"):
+        if not instrumentation.enabled():
+            st.caption("Start the app with HEATWAVE_INSTRUMENT=1 to time forecast stages "
+                       "(add HEATWAVE_TRACE_MEMORY=1 for memory peaks).")
+            return
+
+        stats = instrumentation.stage_stats()
+        if stats:
+            table = pd.DataFrame.from_dict(stats, orient="index").sort_values("total_s", ascending=False)
+            table["last_ms"] = (table.pop("last_s") * 1000).round(1)
+            table["max_ms"] = (table.pop("max_s") * 1000).round(1)
+            table["total_s"] = table["total_s"].round(3)
+            table["peak_MiB"] = (table.pop("peak_bytes") / 2**20).round(2)
+            st.dataframe(table, use_container_width=True)
+        backends = model_registry.backend_report()
+        if backends:
+            st.caption("Inference backends")
+            st.dataframe(pd.DataFrame(backends).set_index("backend").round(3), use_container_width=True)
+        counters = instrumentation.counters()
+        if counters:
+            st.json(counters)
@@ -0,0 +1,270 @@
+# views/forecast.py
+"""Forecast System page: per-taluk 3-month/1-year forecasts and the district run."""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import instrumentation
+import model_registry
+from charts import create_3month_plot, create_yearly_plot
+from district_forecast import district_summary, forecast_district
+from downsampling import DEFAULT_CHART_WIDTH, max_points_for_width
+from episodes import IMD_MIN_DAYS
+from forecast_cache import forecast_cache
+from forecast_stream import run_streaming_forecast
+from forecasting import END_DATE_1YEAR, END_DATE_3MONTH, START_DATE, TALUKS
+from views.session_cache import SessionMemo
+
+# Results and figures survive reruns in the current session, keyed by their inputs.
+FORECAST_MEMO = SessionMemo("forecast", max_entries=8)
+FIGURE_MEMO = SessionMemo("forecast_figures", max_entries=8)
+DISTRICT_MEMO = SessionMemo("district_forecast", max_entries=2)
+LONG_RANGE_MEMO = SessionMemo("long_range_forecast", max_entries=4)
+
+# Planning horizons beyond a year are forecast chunk by chunk (forecast_stream),
+# keeping only monthly statistics in memory.
+LONG_RANGE_YEARS = (5, 10, 20, 30)
+
+
+def show_forecast_system():
+    # Taluk selection
+    selected_taluk = st.sidebar.selectbox(
+        "Select Taluk",
+        TALUKS,
+        index=0
+    )
+    with st.sidebar.expander("Chart rendering"):
+        chart_width = st.select_slider(
+            "Chart detail (px width)", options=[600, 900, 1200, 1600, 2400], value=DEFAULT_CHART_WIDTH
+        )
+        use_webgl = st.checkbox("Use WebGL (faster for long series)", value=False)
+    max_points = max_points_for_width(chart_width)
+
+    # Add buttons to forecast the selected taluk or the whole district. The
+    # choice is remembered so later reruns keep showing the result.
+    if st.sidebar.button("Generate Forecast"):
+        st.session_state["forecast_view"] = ("taluk", selected_taluk)
+    if st.sidebar.button("Forecast all taluks"):
+        st.session_state["forecast_view"] = ("district",)
+    with st.sidebar.expander("Long-range scenario"):
+        years = st.select_slider("Horizon (years)", options=LONG_RANGE_YEARS, value=LONG_RANGE_YEARS[1])
+        if st.button("Run long-range forecast"):
+            st.session_state["forecast_view"] = ("long_range", selected_taluk, years)
+
+    view = st.session_state.get("forecast_view")
+    if view is not None and view[0] == "taluk":
+        show_taluk_forecast(view[1], selected_taluk, max_points, use_webgl)
+    elif view is not None and view[0] == "long_range":
+        show_long_range_forecast(view[1], view[2], use_webgl)
+    elif view is not None:
+        show_district_forecast()
+    else:
+        # Hero welcome section
+        st.markdown(
+            """
+            <div class="themed-card" style="margin-bottom:1.5rem;">
+              <div class="themed-card-header">Overview</div>
+              <div class="themed-card-title">🌡️ Tumkur District Heatwave Intelligence</div>
+              <p style="margin-top:0.75rem;font-size:0.9rem;color:#4b5563;">
+                Forecast and monitor heat stress for every taluk in Tumkur. Use the sidebar to pick a location
+                and generate short‑term and seasonal projections, then switch tabs to inspect current drivers
+                and the district map.
+              </p>
+              <ul style="font-size:0.85rem;color:#6b7280;margin-top:0.5rem;padding-left:1.2rem;">
+                <li><b>Forecast System</b> – 3‑month and 1‑year projections with key metrics.</li>
+                <li><b>Heat Sentinel Dashboard</b> – present‑day risk and driver breakdown.</li>
+                <li><b>Tumakuru Map Visualization</b> – interactive map with taluk‑level hotspots.</li>
+              </ul>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+
+def _compute_forecast(taluk):
+    """Forecast plus the summary metrics shown under the charts."""
+    with instrumentation.stage("forecast"):
+        df_1year = forecast_cache.get_forecast(taluk, START_DATE, END_DATE_1YEAR)
+        aggregates = forecast_cache.get_aggregates(taluk, START_DATE, END_DATE_1YEAR)
+    df_3month = df_1year.loc[START_DATE:END_DATE_3MONTH]
+    return {
+        "df_1year": df_1year,
+        "df_3month": df_3month,
+        "monthly": aggregates.monthly,
+        "heatwave_days_3month": int(df_3month['Predicted_Heatwave'].sum()),
+        "heatwave_days_1year": int(aggregates.monthly['heatwave_days'].sum()),
+        "hottest_month": aggregates.hottest_month().strftime('%B %Y'),
+        "episodes_1year": len(aggregates.episodes),
+        "longest_episode": aggregates.longest_episode(),
+    }
+
+
+def _build_3month_figure(result, taluk, max_points, use_webgl, x_range):
+    with instrumentation.stage("figure.3month"):
+        return create_3month_plot(result["df_3month"], taluk, max_points=max_points, webgl=use_webgl,
+                                  x_range=x_range)
+
+
+def _build_yearly_figure(result, taluk, use_webgl):
+    with instrumentation.stage("figure.yearly"):
+        return create_yearly_plot(result["df_1year"], taluk, monthly=result["monthly"], webgl=use_webgl)
+
+
+def _zoom_range(dates):
+    """(start, end) picked on a slider under the 3-month heading, or None for the whole span."""
+    start, end = st.select_slider(
+        "Zoom", options=list(dates), value=(dates[0], dates[-1]), format_func=lambda d: f"{d:%d %b}"
+    )
+    return None if (start, end) == (dates[0], dates[-1]) else (start, end)
+
+
+def show_taluk_forecast(taluk, selected_taluk, max_points, use_webgl):
+    """3-month and 1-year charts plus summary metrics for one taluk, memoized per session."""
+    if taluk != selected_taluk:
+        st.info(f"Showing the forecast for {taluk}. Click 'Generate Forecast' to switch to {selected_taluk}.")
+    try:
+        with st.spinner(f'Generating forecast for {taluk}...'):
+            key = (taluk, START_DATE, END_DATE_1YEAR, model_registry.model_version())
+            result = FORECAST_MEMO.get(key, lambda: _compute_forecast(taluk))
+    except Exception as e:
+        st.error(f"Error generating forecast: {str(e)}")
+        return
+
+    st.markdown("## 🌡️ 3-Month Heatwave Forecast")
+    st.markdown(f"### {taluk} Taluk (Oct-Dec 2025)")
+    x_range = _zoom_range(result["df_3month"].index)
+    try:
+        # Zooming rebuilds only the 3-month chart; each figure has its own memo entry.
+        fig_3m = FIGURE_MEMO.get(
+            key + ("3month", max_points, use_webgl, x_range),
+            lambda: _build_3month_figure(result, taluk, max_points, use_webgl, x_range),
+        )
+        fig_1y = FIGURE_MEMO.get(key + ("yearly", use_webgl), lambda: _build_yearly_figure(result, taluk, use_webgl))
+    except Exception as e:
+        st.error(f"Error generating forecast: {str(e)}")
+        return
+    with instrumentation.stage("render.3month"):
+        st.plotly_chart(fig_3m, use_container_width=True)
+    st.markdown("---")
+    st.markdown("## 📅 1-Year Heatwave Forecast")
+    st.markdown(f"### {taluk} Taluk (Oct 2025 - Sep 2026)")
+    with instrumentation.stage("render.yearly"):
+        st.plotly_chart(fig_1y, use_container_width=True)
+    st.markdown("---")
+    st.markdown("## 📊 Forecast Summary")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Predicted Heatwave Days (3 Months)", f"{result['heatwave_days_3month']} days")
+    with col2:
+        st.metric("Total Predicted Heatwave Days (1 Year)", f"{result['heatwave_days_1year']} days")
+    with col3:
+        st.metric("Hottest Month", result["hottest_month"])
+    col4, col5, _ = st.columns(3)
+    with col4:
+        st.metric(f"Heatwave Episodes (1 Year, {IMD_MIN_DAYS}+ days)", f"{result['episodes_1year']} episodes")
+    with col5:
+        longest = result["longest_episode"]
+        if longest is None:
+            st.metric("Longest Episode", "None")
+        else:
+            st.metric("Longest Episode", f"{longest['days']} days", delta=f"from {longest['start']:%d %b %Y}",
+                      delta_color="off")
+
+
+def _long_range_end(years):
+    return (pd.Timestamp(START_DATE) + pd.DateOffset(years=years) - pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+def _compute_long_range_forecast(taluk, years):
+    with instrumentation.stage("long_range_forecast"):
+        monthly = run_streaming_forecast(START_DATE, _long_range_end(years), [taluk]).loc[taluk]
+    yearly = monthly['heatwave_days'].groupby(monthly.index.year).sum()
+    return {
+        "monthly": monthly,
+        "heatwave_days": int(monthly['heatwave_days'].sum()),
+        "heatwave_days_per_year": monthly['heatwave_days'].sum() / (monthly['days'].sum() / 365.25),
+        "worst_year": int(yearly.idxmax()),
+        "hottest_month": monthly['temp_mean'].idxmax().strftime('%B %Y'),
+    }
+
+
+def show_long_range_forecast(taluk, years, use_webgl):
+    """Monthly statistics for a multi-year horizon, streamed rather than held as daily data."""
+    end_date = _long_range_end(years)
+    try:
+        with st.spinner(f'Generating a {years}-year forecast for {taluk}...'):
+            key = (taluk, START_DATE, end_date, model_registry.model_version())
+            result = LONG_RANGE_MEMO.get(key, lambda: _compute_long_range_forecast(taluk, years))
+            period = f"{pd.Timestamp(START_DATE):%b %Y} - {pd.Timestamp(end_date):%b %Y}"
+            fig = FIGURE_MEMO.get(
+                key + ("long_range", use_webgl),
+                lambda: create_yearly_plot(None, taluk, monthly=result["monthly"], webgl=use_webgl,
+                                           title=f"{years}-Year Heatwave Forecast for {taluk} ({period})"),
+            )
+    except Exception as e:
+        st.error(f"Error generating forecast: {str(e)}")
+        return
+
+    st.markdown(f"## 🗓️ {years}-Year Heatwave Forecast")
+    st.markdown(f"### {taluk} Taluk ({period})")
+    st.plotly_chart(fig, use_container_width=True)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(f"Total Predicted Heatwave Days ({years} Years)", f"{result['heatwave_days']} days")
+    with col2:
+        st.metric("Average per Year", f"{result['heatwave_days_per_year']:.0f} days")
+    with col3:
+        st.metric("Worst Year", str(result["worst_year"]))
+    st.metric("Hottest Month", result["hottest_month"])
+
+
+def _compute_district_forecast():
+    with instrumentation.stage("district_forecast"):
+        district_df = forecast_district(START_DATE, END_DATE_1YEAR)
+    return district_summary(district_df, short_end=END_DATE_3MONTH)
+
+
+def show_district_forecast():
+    """Forecast every taluk in parallel and summarise heatwave days across the district."""
+    with st.spinner("Generating forecasts for all taluks..."):
+        try:
+            key = (START_DATE, END_DATE_1YEAR, model_registry.model_version())
+            summary = DISTRICT_MEMO.get(key, _compute_district_forecast)
+        except Exception as e:
+            st.error(f"Error generating forecast: {str(e)}")
+            return
+
+    st.markdown("## 🗺️ District Heatwave Forecast")
+    st.markdown("### All taluks (Oct 2025 - Sep 2026)")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Most affected taluk", summary.index[0])
+    with col2:
+        st.metric("Heatwave days there (1 Year)", f"{summary['Heatwave days'].iloc[0]} days")
+    with col3:
+        st.metric("District average (1 Year)", f"{summary['Heatwave days'].mean():.0f} days")
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=summary.index,
+                y=summary['Heatwave days'],
+                marker_color='#e74c3c',
+                opacity=0.8,
+                hovertemplate='%{x}<br>%{y} heatwave days<extra></extra>',
+            )
+        ]
+    )
+    fig.update_layout(
+        title="Predicted heatwave days per taluk",
+        yaxis_title="Heatwave Days",
+        template="plotly_white",
+        margin=dict(l=50, r=50, t=80, b=50),
+        height=400,
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("#### District summary")
+    st.dataframe(summary, use_container_width=True)
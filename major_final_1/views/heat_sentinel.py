@@ -0,0 +1,188 @@
+# views/heat_sentinel.py
+"""Heat Sentinel Dashboard page: present-day risk, what-if simulator and mitigation plans."""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from scenarios import AIQ_STEPS, GREEN_STEPS, TRAFFIC_STEPS, get_scenario_grid
+from shared_data import (
+    RISK_BAND_FLOORS,
+    WARD_DATA,
+    WARD_STORE,
+    calculate_heatwave_percentage,
+    calculate_heatwave_percentage_batch,
+    classify_risk_level,
+)
+
+
+def show_heat_sentinel_dashboard():
+    st.title("Heat Sentinel Dashboard")
+    st.write(
+        "Explore present‑day heat stress drivers across Tumkur taluks. Select a location to see its risk profile."
+    )
+
+    wards = list(WARD_DATA.keys())
+    ward = st.selectbox("Select Taluk", ["--Select--"] + wards)
+
+    if ward == "--Select--":
+        st.markdown(
+            "<p style='color:#6b7280;margin-top:0.5rem;'>Choose a taluk from the dropdown to view its heat drivers.</p>",
+            unsafe_allow_html=True,
+        )
+        return
+
+    data = WARD_DATA[ward]
+    heatwave_percent = calculate_heatwave_percentage(data)
+    risk_label, risk_color, risk_advice = classify_risk_level(heatwave_percent)
+
+    # Top summary row
+    col_a, col_b, col_c = st.columns([1.3, 1, 1])
+    with col_a:
+        st.markdown(
+            f"""
+            <div class="themed-card">
+              <div class="themed-card-header">Current risk</div>
+              <div class="themed-card-title">{ward}</div>
+              <div style="margin-top:0.75rem;">
+                <span class="heat-badge" style="border-color:{risk_color};color:{risk_color}">
+                  🌡️ {risk_label} risk&nbsp;&nbsp;•&nbsp;&nbsp;{heatwave_percent}%
+                </span>
+              </div>
+              <p style="margin-top:0.75rem;font-size:0.85rem;color:#6b7280;">
+                {risk_advice}
+              </p>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+    with col_b:
+        st.metric("Temperature (°C)", data["Temp_2m"])
+        st.metric("Humidity (%)", data["Humidity"])
+    with col_c:
+        st.metric("Green cover (%)", data["Green_Cover_"])
+        st.metric("Traffic index", data["Traffic_Index"])
+
+    # Factors bar chart inside a card
+    labels = ["Temp_2m", "Humidity", "Green Cover %", "Traffic Index", "AIQ", "Precipitation mm"]
+    values = [
+        data["Temp_2m"],
+        data["Humidity"],
+        data["Green_Cover_"],
+        data["Traffic_Index"],
+        data["AIQ"],
+        data["Precipitation_mm"],
+    ]
+    colors = [
+        "rgba(248, 113, 113, 0.9)",
+        "rgba(59, 130, 246, 0.9)",
+        "rgba(34, 197, 94, 0.9)",
+        "rgba(234, 179, 8, 0.9)",
+        "rgba(168, 85, 247, 0.9)",
+        "rgba(45, 212, 191, 0.9)",
+    ]
+    fig = go.Figure(data=[go.Bar(x=labels, y=values, marker_color=colors)])
+    fig.update_layout(
+        title="Heatwave Driver Profile",
+        yaxis=dict(title="Value", range=[0, max(values) + 10]),
+        xaxis=dict(title="Factor"),
+        showlegend=False,
+        margin=dict(l=20, r=20, t=50, b=40),
+    )
+
+    st.markdown('<div class="themed-card" style="margin-top:1.5rem;">', unsafe_allow_html=True)
+    st.markdown("<div class='themed-card-header'>Drivers</div>", unsafe_allow_html=True)
+    st.markdown("<div class='themed-card-title'>Factors influencing heat stress</div>", unsafe_allow_html=True)
+    st.plotly_chart(fig, use_container_width=True)
+    st.markdown(
+        "<p style='font-size:0.85rem;color:#6b7280;margin-top:-0.5rem;'>"
+        "High temperature, low green cover, heavy traffic and poor air quality all push risk upwards."
+        "</p>",
+        unsafe_allow_html=True,
+    )
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # Compact overview of all taluks with their risk bands
+    st.markdown("#### District‑wide risk snapshot")
+    ward_df = WARD_STORE.frame()
+    overview_df = pd.DataFrame(
+        {
+            "Taluk": ward_df.index,
+            "Heatwave %": calculate_heatwave_percentage_batch(ward_df),
+        }
+    )
+    overview_df["Risk level"] = [classify_risk_level(pct)[0] for pct in overview_df["Heatwave %"]]
+    overview_df = overview_df.sort_values("Heatwave %", ascending=False)
+    st.dataframe(overview_df, use_container_width=True)
+
+    # --- What‑if analysis: simulate mitigation scenarios ---
+    st.markdown("#### What‑if: simulate mitigation for this taluk")
+    st.write(
+        "Adjust the sliders to explore how improvements in green cover, traffic and air quality could "
+        "change the heatwave risk for this taluk."
+    )
+
+    # Risk for every slider combination is precomputed, so moving a slider is a lookup
+    scenario_grid = get_scenario_grid()
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        green_delta = st.slider(
+            "Increase green cover (percentage points)",
+            min_value=0,
+            max_value=int(GREEN_STEPS[-1]),
+            value=0,
+            step=int(GREEN_STEPS[1]),
+        )
+    with c2:
+        traffic_delta = st.slider(
+            "Reduce traffic index",
+            min_value=0,
+            max_value=int(TRAFFIC_STEPS[-1]),
+            value=0,
+            step=int(TRAFFIC_STEPS[1]),
+        )
+    with c3:
+        aiq_delta = st.slider(
+            "Improve air quality index (lower is better)",
+            min_value=0,
+            max_value=int(AIQ_STEPS[-1]),
+            value=0,
+            step=int(AIQ_STEPS[1]),
+        )
+
+    sim_pct = scenario_grid.lookup(ward, green_delta, traffic_delta, aiq_delta)
+    sim_level, sim_color, sim_advice = classify_risk_level(sim_pct)
+
+    col_before, col_after = st.columns(2)
+    with col_before:
+        st.metric("Current heatwave risk", f"{heatwave_percent}%", help=risk_advice)
+    with col_after:
+        st.metric("Simulated risk", f"{sim_pct}%", help=sim_advice)
+
+    st.markdown(
+        f"<p style='font-size:0.85rem;color:#6b7280;'>Scenario risk band: "
+        f"<span style='font-weight:600;color:{sim_color};'>{sim_level}</span>.</p>",
+        unsafe_allow_html=True,
+    )
+
+    # Cheapest way (by relative programme cost) to leave each band this taluk is in or above
+    plans = scenario_grid.cheapest_mitigation(ward)
+    plan_rows = []
+    for band, floor in RISK_BAND_FLOORS.items():
+        if heatwave_percent < floor:
+            continue
+        plan = plans[band]
+        plan_rows.append(
+            {
+                "Target": f"Below {band} (<{floor}%)",
+                "Green cover +": plan["green_delta"] if plan else None,
+                "Traffic −": plan["traffic_delta"] if plan else None,
+                "AIQ −": plan["aiq_delta"] if plan else None,
+                "Resulting risk %": plan["heatwave_pct"] if plan else None,
+                "Relative cost": plan["cost"] if plan else None,
+            }
+        )
+    if plan_rows:
+        st.markdown("#### Cheapest mitigation plans")
+        st.dataframe(pd.DataFrame(plan_rows).set_index("Target"), use_container_width=True)
+        st.caption("Empty rows cannot be reached within the slider ranges.")
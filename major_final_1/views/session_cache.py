@@ -0,0 +1,47 @@
+# views/session_cache.py
+"""Per-session memo of expensive page results, kept in ``st.session_state``.
+
+Streamlit reruns the whole script on every widget change; results that only
+depend on a few inputs are stored here keyed by those inputs, so unrelated
+reruns and page switches re-render from memory.
+"""
+
+from collections import OrderedDict
+
+import streamlit as st
+
+import instrumentation
+
+
+class SessionMemo:
+    """LRU of at most ``max_entries`` results under one name in the current session.
+
+    Stored values are shared across reruns and must be treated as read-only.
+    """
+
+    def __init__(self, name, max_entries=8):
+        self.name = name
+        self.max_entries = max_entries
+        self._state_key = f"_session_memo.{name}"
+
+    def _entries(self):
+        if self._state_key not in st.session_state:
+            st.session_state[self._state_key] = OrderedDict()
+        return st.session_state[self._state_key]
+
+    def get(self, key, compute):
+        """The stored result for ``key``, calling ``compute()`` only on a miss."""
+        entries = self._entries()
+        if key in entries:
+            entries.move_to_end(key)
+            instrumentation.count(f"session_memo.{self.name}.hit")
+            return entries[key]
+        instrumentation.count(f"session_memo.{self.name}.miss")
+        value = compute()
+        entries[key] = value
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._entries().clear()
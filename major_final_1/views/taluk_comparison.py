@@ -0,0 +1,94 @@
+# views/taluk_comparison.py
+"""Taluk Comparison page: side-by-side drivers and risk for two or three taluks."""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from forecasting import TALUKS
+from shared_data import WARD_DATA, WARD_STORE, calculate_heatwave_percentage_batch, classify_risk_level
+
+
+def show_taluk_comparison():
+    """Compare multiple taluks side‑by‑side on current drivers and risk."""
+    st.title("Taluk Comparison")
+    st.write(
+        "Select two or three taluks to compare their present‑day heatwave risk and key drivers side‑by‑side."
+    )
+
+    selected = st.multiselect("Choose taluks to compare", TALUKS, default=["Tumakuru", "Pavagada"])
+    if len(selected) < 2:
+        st.info("Please select at least two taluks to enable comparison.")
+        return
+    if len(selected) > 3:
+        st.warning("Comparison is limited to three taluks at a time. Please deselect one or more.")
+        return
+
+    # Build comparison data
+    available = [taluk for taluk in selected if taluk in WARD_DATA]
+    if not available:
+        st.warning("No data available for the selected taluks.")
+        return
+
+    pcts = calculate_heatwave_percentage_batch(WARD_STORE.frame().loc[available])
+    # Display values come from row(), which keeps whole-number readings as ints
+    # (40°C, not 40.0°C); the frame is float64 throughout.
+    rows = [WARD_STORE.row(taluk) for taluk in available]
+    comp_df = pd.DataFrame(
+        {
+            "Taluk": available,
+            "Heatwave_pct": pcts,
+            "Risk_level": [classify_risk_level(pct)[0] for pct in pcts],
+            "Temp_2m": [row["Temp_2m"] for row in rows],
+            "Humidity": [row["Humidity"] for row in rows],
+            "Green_Cover_pct": [row["Green_Cover_"] for row in rows],
+            "Traffic_Index": [row["Traffic_Index"] for row in rows],
+            "AIQ": [row["AIQ"] for row in rows],
+            "Precipitation_mm": [row["Precipitation_mm"] for row in rows],
+        }
+    )
+
+    # Top risk cards
+    cols = st.columns(len(comp_df))
+    for col, row in zip(cols, comp_df.itertuples(index=False)):
+        _, color, _ = classify_risk_level(row.Heatwave_pct)
+        with col:
+            st.markdown(
+                f"""
+                <div class="themed-card">
+                  <div class="themed-card-header">Taluk</div>
+                  <div class="themed-card-title">{row.Taluk}</div>
+                  <div style="margin-top:0.75rem;">
+                    <span class="heat-badge" style="border-color:{color};color:{color}">
+                      {row.Risk_level} • {row.Heatwave_pct}%
+                    </span>
+                  </div>
+                  <p style="margin-top:0.75rem;font-size:0.85rem;color:#6b7280;">
+                    Temp: {row.Temp_2m}°C • Humidity: {row.Humidity}% • Green cover: {row.Green_Cover_pct}%.
+                  </p>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+
+    # Driver comparison chart
+    factor_labels = ["Temp_2m", "Humidity", "Green_Cover_pct", "Traffic_Index", "AIQ", "Precipitation_mm"]
+    fig = go.Figure()
+    for row in comp_df.itertuples(index=False):
+        vals = [getattr(row, f) for f in factor_labels]
+        fig.add_trace(go.Bar(name=row.Taluk, x=factor_labels, y=vals))
+
+    fig.update_layout(
+        barmode="group",
+        title="Heatwave driver comparison",
+        yaxis_title="Value",
+        margin=dict(l=20, r=20, t=60, b=40),
+    )
+
+    st.markdown('<div class="themed-card" style="margin-top:1.5rem;">', unsafe_allow_html=True)
+    st.plotly_chart(fig, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # Raw comparison table
+    st.markdown("#### Detailed comparison table")
+    st.dataframe(comp_df.set_index("Taluk"), use_container_width=True)
@@ -0,0 +1,212 @@
+# ward_store.py
+"""Columnar in-memory store of taluk readings with a time-stamped history."""
+
+import threading
+import time
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+_INITIAL_HISTORY = 1024
+
+
+def _now_ns():
+    return time.time_ns()
+
+
+class WardStore:
+    """Current readings as one (field x taluk) float array plus an append-only history log.
+
+    Rows are addressed by a stable taluk id (the position in ``taluks``).
+    ``column`` and ``frame`` return read-only views of the current array
+    rather than copies; go through ``update`` to change data.
+    Callbacks registered with ``subscribe`` hear about every change.
+    """
+
+    def __init__(self, taluks, fields):
+        self.taluks = list(taluks)
+        self.fields = list(fields)
+        self.taluk_ids = {taluk: i for i, taluk in enumerate(self.taluks)}
+        self._field_ids = {field: j for j, field in enumerate(self.fields)}
+        self.version = 0
+        self._lock = threading.Lock()
+        self._subscribers = []
+
+        self._current = np.full((len(self.fields), len(self.taluks)), np.nan)
+        self._updated_at = np.zeros(len(self.taluks), dtype=np.int64)
+
+        # History log, one row per taluk update; grown by doubling
+        self._n_history = 0
+        self._hist_time = np.empty(_INITIAL_HISTORY, dtype=np.int64)
+        self._hist_taluk = np.empty(_INITIAL_HISTORY, dtype=np.int32)
+        self._hist_values = np.empty((_INITIAL_HISTORY, len(self.fields)), dtype=np.float64)
+
+    @classmethod
+    def from_payload(cls, payload, fields):
+        """Build a store from the ``ward_data.json`` payload (taluks without readings stay NaN)."""
+        taluks = list(payload["taluks"])
+        store = cls(taluks, fields)
+        ids, rows = [], []
+        for taluk, info in payload["taluks"].items():
+            if all(field in info for field in fields):
+                ids.append(store.taluk_ids[taluk])
+                rows.append([info[field] for field in fields])
+        if ids:
+            store._apply(np.array(ids), np.array(rows, dtype=np.float64), _now_ns())
+        return store
+
+    # --- Writes ---
+
+    def update(self, taluk, readings, timestamp=None):
+        """Record new readings (a dict of some or all fields) for one taluk."""
+        row = self._current[:, self.taluk_ids[taluk]].copy()
+        for field, value in readings.items():
+            row[self._field_ids[field]] = value
+        return self.update_many([taluk], row[None, :], timestamp)
+
+    def update_many(self, taluks, values, timestamp=None):
+        """Record full rows of readings (len(taluks) x len(fields)) in one step.
+
+        Returns the ids of the taluks whose readings actually changed.
+        """
+        ids = np.array([self.taluk_ids[t] for t in taluks], dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64).reshape(len(ids), len(self.fields))
+        return self._apply(ids, values, timestamp if timestamp is not None else _now_ns())
+
+    def _apply(self, ids, values, timestamp):
+        with self._lock:
+            before = self._current[:, ids].T
+            # Exact comparison: small real changes (40 -> 40.0003) must still be recorded.
+            same = (before == values) | (np.isnan(before) & np.isnan(values))
+            changed = ~same.all(axis=1)
+            ids, values = ids[changed], values[changed]
+            if len(ids) == 0:
+                return ids
+            self._current[:, ids] = values.T
+            self._updated_at[ids] = timestamp
+            self._append_history(ids, values, timestamp)
+            self.version += 1
+            subscribers = list(self._subscribers)
+        # Outside the lock, so callbacks can read the store.
+        for callback in subscribers:
+            callback(ids, timestamp)
+        return ids
+
+    def subscribe(self, callback):
+        """Call ``callback(taluk_ids, timestamp)`` after each write that changed readings.
+
+        Callbacks run on the writing thread. Returns a function that unsubscribes.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def _append_history(self, ids, values, timestamp):
+        needed = self._n_history + len(ids)
+        if needed > len(self._hist_time):
+            capacity = max(needed, 2 * len(self._hist_time))
+            self._hist_time = np.resize(self._hist_time, capacity)
+            self._hist_taluk = np.resize(self._hist_taluk, capacity)
+            self._hist_values = np.resize(self._hist_values, (capacity, len(self.fields)))
+        end = self._n_history + len(ids)
+        self._hist_time[self._n_history:end] = timestamp
+        self._hist_taluk[self._n_history:end] = ids
+        self._hist_values[self._n_history:end] = values
+        self._n_history = end
+
+    # --- Reads ---
+
+    def has_readings(self):
+        """Boolean mask of taluks with a complete set of readings."""
+        return ~np.isnan(self._current).any(axis=0)
+
+    def column(self, field):
+        """Current values of one field for every taluk (a view, indexed by taluk id)."""
+        view = self._current[self._field_ids[field]]
+        view.flags.writeable = False
+        return view
+
+    def readings(self, ids):
+        """``{field: values}`` for the given taluk ids, in the shape the batch scorer takes."""
+        values = self._current[:, ids]
+        return {field: values[j] for j, field in enumerate(self.fields)}
+
+    def frame(self, complete_only=True):
+        """Current readings as a DataFrame indexed by taluk.
+
+        Backed by a read-only view of the store's array, without copying unless
+        rows must be dropped.
+        """
+        values = self._current.T
+        values.flags.writeable = False
+        df = pd.DataFrame(values, index=pd.Index(self.taluks, name="Taluk"),
+                          columns=self.fields, copy=False)
+        if complete_only:
+            mask = self.has_readings()
+            if not mask.all():
+                df = df[mask]
+        return df
+
+    def row(self, taluk):
+        """Current readings of one taluk as a plain dict."""
+        values = self._current[:, self.taluk_ids[taluk]]
+        # Readings are usually whole numbers; keep them ints for display
+        return {field: int(v) if float(v).is_integer() else float(v) for field, v in zip(self.fields, values)}
+
+    def history(self, taluk=None):
+        """Logged readings (optionally for one taluk) as a DataFrame indexed by UTC time."""
+        n = self._n_history
+        times, ids, values = self._hist_time[:n], self._hist_taluk[:n], self._hist_values[:n]
+        if taluk is not None:
+            mask = ids == self.taluk_ids[taluk]
+            times, ids, values = times[mask], ids[mask], values[mask]
+        df = pd.DataFrame(values, columns=self.fields, index=pd.to_datetime(times, unit="ns"))
+        df.insert(0, "Taluk", np.asarray(self.taluks, dtype=object)[ids])
+        df.index.name = "Time"
+        return df
+
+    def snapshot(self, at):
+        """Readings as they were at time ``at`` (anything ``pd.Timestamp`` accepts; naive times are UTC)."""
+        cutoff = pd.Timestamp(at).value
+        n = self._n_history
+        valid = np.flatnonzero(self._hist_time[:n] <= cutoff)
+        result = np.full((len(self.taluks), len(self.fields)), np.nan)
+        if len(valid):
+            # Latest entry per taluk id: sort by (taluk, time, log position) and keep group ends
+            ids, times = self._hist_taluk[valid], self._hist_time[valid]
+            order = np.lexsort((valid, times, ids))
+            last = np.append(ids[order][1:] != ids[order][:-1], True)
+            latest = valid[order[last]]
+            result[self._hist_taluk[latest]] = self._hist_values[latest]
+        df = pd.DataFrame(result, index=pd.Index(self.taluks, name="Taluk"), columns=self.fields)
+        return df.dropna()
+
+    def as_mapping(self):
+        """Dict-like ``{taluk: {field: value}}`` view for code written against WARD_DATA."""
+        return WardDataView(self)
+
+
+class WardDataView(Mapping):
+    """Read-only mapping over a WardStore that mirrors the old WARD_DATA dict of dicts."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, taluk):
+        if taluk not in self._store.taluk_ids or not self._store.has_readings()[self._store.taluk_ids[taluk]]:
+            raise KeyError(taluk)
+        return self._store.row(taluk)
+
+    def __iter__(self):
+        mask = self._store.has_readings()
+        return (taluk for taluk, ok in zip(self._store.taluks, mask) if ok)
+
+    def __len__(self):
+        return int(self._store.has_readings().sum())